@@ -1,3 +1,4 @@
+import time
 import uuid
 from collections.abc import AsyncGenerator, Callable
 from typing import Any
@@ -9,36 +10,28 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.infrastructure.cache import get_client_membership_index
 from app.infrastructure.database.models.user_orm import UserORM
 from app.infrastructure.database.session import get_db_session
+from app.infrastructure.repositories.access_repo import AccessRepository
 
 security_scheme = HTTPBearer()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Alias for get_db_session to keep a short, conventional name."""
-    async for session in get_db_session():
-        yield session
-
-
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> UserORM:
-    """Decode the JWT from the Authorization header and return the user.
-
-    Raises:
-        HTTPException 401: If the token is invalid, expired, or the user
-            does not exist / is inactive.
-    """
-    token = credentials.credentials
-
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _decode_token(token: str) -> tuple[dict[str, Any], uuid.UUID]:
+    """Verify *token* and return its claims and subject user id.
+
+    Raises:
+        HTTPException 401: If the token is invalid, expired or has no subject.
+    """
     try:
         payload: dict[str, Any] = jwt.decode(
             token,
@@ -47,44 +40,167 @@ async def get_current_user(
         )
         sub: str | None = payload.get("sub")
         if sub is None:
-            raise credentials_exception
-        user_id = uuid.UUID(sub)
+            raise _credentials_exception()
+        return payload, uuid.UUID(sub)
     except (JWTError, ValueError):
-        raise credentials_exception
+        raise _credentials_exception()
+
 
+async def _load_active_user(db: AsyncSession, user_id: uuid.UUID) -> UserORM:
     result = await db.execute(select(UserORM).where(UserORM.id == user_id))
     user: UserORM | None = result.scalars().first()
 
     if user is None or not user.is_active:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
 
 
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Alias for get_db_session to keep a short, conventional name."""
+    async for session in get_db_session():
+        yield session
+
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> UserORM:
+    """Decode the JWT from the Authorization header and return the user.
+
+    Raises:
+        HTTPException 401: If the token is invalid, expired, or the user
+            does not exist / is inactive.
+    """
+    _, user_id = _decode_token(credentials.credentials)
+    return await _load_active_user(db, user_id)
+
+
+class Principal:
+    """The caller, as described by the verified claims of their access token.
+
+    ``id`` and ``role`` come straight from the token.  The user row is only
+    read when a handler awaits :meth:`get_user` for profile fields, and is
+    then kept for the rest of the request.
+    """
+
+    def __init__(
+        self,
+        id: uuid.UUID,
+        role: str,
+        db: AsyncSession,
+        user: UserORM | None = None,
+    ) -> None:
+        self.id = id
+        self.role = role
+        self._db = db
+        self._user = user
+
+    async def get_user(self) -> UserORM:
+        """Return the caller's user row, loading it on first use.
+
+        Raises:
+            HTTPException 401: If the user no longer exists or is inactive.
+        """
+        if self._user is None:
+            self._user = await _load_active_user(self._db, self.id)
+        return self._user
+
+
+async def get_principal(
+    credentials: HTTPAuthorizationCredentials = Depends(security_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """Authorize the caller from their access token without a user query.
+
+    Claims are trusted for ``ACCESS_TOKEN_CLAIMS_MAX_AGE_MINUTES`` after the
+    token was issued.  An older token (or one with no ``iat``) has the
+    user's status and role checked in the database instead, so a
+    deactivation or role change applies within that window rather than
+    only when the token expires.
+
+    Raises:
+        HTTPException 401: If the token is invalid, expired, not an access
+            token, or (once checked) the user does not exist / is inactive.
+    """
+    payload, user_id = _decode_token(credentials.credentials)
+    role = payload.get("role")
+    if payload.get("type") != "access" or not isinstance(role, str):
+        raise _credentials_exception()
+
+    issued_at = payload.get("iat")
+    max_age = settings.ACCESS_TOKEN_CLAIMS_MAX_AGE_MINUTES * 60
+    if isinstance(issued_at, (int, float)) and time.time() - issued_at <= max_age:
+        return Principal(user_id, role, db)
+
+    user = await _load_active_user(db, user_id)
+    return Principal(user_id, user.role, db, user=user)
+
+
 def require_role(*allowed_roles: str) -> Callable[..., Any]:
-    """Dependency factory that restricts access to users with specific roles.
+    """Dependency factory that restricts access to callers with specific roles.
+
+    The role is taken from the access token (see :func:`get_principal`), so
+    no user query is made unless the handler asks for the user.
 
     Usage::
 
         @router.get("/admin-only", dependencies=[Depends(require_role("admin"))])
         async def admin_endpoint(): ...
 
-    Or inject the user directly::
+    Or inject the principal directly::
 
         @router.get("/admin-only")
         async def admin_endpoint(
-            user: UserORM = Depends(require_role("admin")),
+            principal: Principal = Depends(require_role("admin")),
         ): ...
     """
 
     async def _check_role(
-        current_user: UserORM = Depends(get_current_user),
-    ) -> UserORM:
-        if current_user.role not in allowed_roles:
+        principal: Principal = Depends(get_principal),
+    ) -> Principal:
+        if principal.role not in allowed_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Insufficient permissions",
             )
-        return current_user
+        return principal
 
     return _check_role
+
+
+async def require_client_access(
+    client_id: uuid.UUID,
+    principal: Principal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db),
+) -> Principal:
+    """Restrict a ``/clients/{client_id}/...`` route to the client's members.
+
+    Admins may access every client.  Anyone else needs an access entry for
+    the client or to be its case owner; that is answered from the
+    in-process membership index, so a repeat check makes no query.
+
+    Usage::
+
+        router = APIRouter(
+            prefix="/clients/{client_id}/things",
+            dependencies=[Depends(require_client_access)],
+        )
+
+    Raises:
+        HTTPException 403: If the caller may not access the client.
+    """
+    if principal.role == "BROKER_TPA_GA_ADMIN":
+        return principal
+
+    allowed = await get_client_membership_index().has_access(
+        principal.id,
+        client_id,
+        lambda: AccessRepository(db).list_client_ids_for_user(principal.id),
+    )
+    if not allowed:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You do not have access to this client",
+        )
+    return principal
@@ -5,7 +5,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_db
+from app.api.dependencies import get_current_user, get_db, require_client_access
 from app.domain.models.access import ClientAccess, ClientAccessCreate, ClientAccessUpdate
 from app.domain.services.access_service import AccessService
 from app.infrastructure.database.models.user_orm import UserORM
@@ -14,6 +14,7 @@ from app.infrastructure.email import ConsoleEmailBackend, EmailService
 router = APIRouter(
     prefix="/clients/{client_id}/access",
     tags=["access"],
+    dependencies=[Depends(require_client_access)],
 )
 
 
@@ -1,191 +1,213 @@
-"""Admin endpoints: SLA alerts and dashboard metrics."""
+"""Admin endpoints: SLA alerts, dashboard metrics, analytics and exports."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import UUID
 
-from fastapi import APIRouter, Depends
-from pydantic import BaseModel
-from sqlalchemy import func, select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_db, require_role
 from app.config import settings
-from app.infrastructure.database.models.client_orm import ClientORM
-from app.infrastructure.database.models.event_log_orm import EventLogORM
-from app.infrastructure.database.models.workflow_orm import (
-    WorkflowInstanceORM,
-    WorkflowStepInstanceORM,
+from app.domain.models.admin import (
+    ActivityHistogram,
+    DashboardMetrics,
+    FileCacheStats,
+    FunnelReport,
+    SlaAlertsResponse,
+    StepDurationReport,
+    StuckStepsResponse,
 )
+from app.domain.models.client import ClientExportParams, ClientStatus
+from app.domain.services.analytics_service import AnalyticsService
+from app.domain.services.client_export_service import WRITERS, ClientExportService
+from app.domain.services.dashboard_service import DashboardService
+from app.infrastructure.cache import (
+    DASHBOARD_METRICS,
+    SLA_ALERTS,
+    STUCK_STEPS,
+    get_response_cache,
+)
+from app.infrastructure.database.session import async_session_factory
+from app.infrastructure.storage import CachingFileStorage, get_file_storage
+from app.infrastructure.storage.table_stream import parquet_available
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
 
-# --- Response models ---
-
-class SlaAlert(BaseModel):
-    client_id: str
-    client_name: str
-    status: str
-    days_stale: int
-    severity: str  # "warning" | "critical"
-
-
-class SlaAlertsResponse(BaseModel):
-    alerts: list[SlaAlert]
-    total: int
+async def _cached_dashboard(namespace: str, ttl: int, method: str, **params):
+    """Serve a ``DashboardService`` method through the response cache.
 
+    The computation opens its own session because a stale hit refreshes
+    in the background, after the request's session is closed.
+    """
 
-class StuckStep(BaseModel):
-    client_id: str
-    client_name: str
-    step_id: str
-    days_stuck: int
+    async def compute():
+        async with async_session_factory() as session:
+            return await getattr(DashboardService(session), method)(**params)
 
-
-class DashboardMetrics(BaseModel):
-    total_cases: int
-    by_status: dict[str, int]
-    stuck_steps: list[StuckStep]
-    stale_cases: list[SlaAlert]
-    avg_cycle_time_days: float | None = None
-    submissions_last_7_days: int
-    submissions_last_30_days: int
+    return await get_response_cache().get_or_compute(
+        namespace, params, compute, ttl=ttl
+    )
 
 
 # --- Endpoints ---
 
 @router.get("/sla/alerts", response_model=SlaAlertsResponse)
 async def get_sla_alerts(
-    db: AsyncSession = Depends(get_db),
-    current_user=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+    severity: Literal["warning", "critical"] | None = None,
+    assigned_to_user_id: UUID | None = None,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=500),
+    count_only: bool = False,
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
 ):
-    """Return cases that exceed SLA warning/critical thresholds."""
-    now = datetime.now(timezone.utc)
-    warning_cutoff = now - timedelta(days=settings.SLA_WARNING_DAYS)
-
-    query = (
-        select(ClientORM)
-        .where(ClientORM.updated_at < warning_cutoff)
-        .order_by(ClientORM.updated_at.asc())
+    """Return cases that exceed SLA warning/critical thresholds.
+
+    Paginated, oldest first.  ``count_only=true`` returns just the total.
+    Served from the response cache.
+    """
+    return await _cached_dashboard(
+        SLA_ALERTS,
+        settings.SLA_ALERTS_CACHE_TTL_SECONDS,
+        "get_sla_alerts",
+        severity=severity,
+        assigned_to_user_id=assigned_to_user_id,
+        page=page,
+        per_page=per_page,
+        count_only=count_only,
     )
-    result = await db.execute(query)
-    clients = result.scalars().all()
 
-    alerts: list[SlaAlert] = []
-    for c in clients:
-        days = (now - c.updated_at.replace(tzinfo=timezone.utc)).days if c.updated_at else 0
-        severity = "critical" if days >= settings.SLA_CRITICAL_DAYS else "warning"
-        alerts.append(SlaAlert(
-            client_id=str(c.id),
-            client_name=c.client_name,
-            status=c.status,
-            days_stale=days,
-            severity=severity,
-        ))
 
-    return SlaAlertsResponse(alerts=alerts, total=len(alerts))
+@router.get("/stuck-steps", response_model=StuckStepsResponse)
+async def get_stuck_steps(
+    step_id: str | None = None,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=500),
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+):
+    """Return steps IN_PROGRESS beyond the stuck threshold, with per-step counts."""
+    return await _cached_dashboard(
+        STUCK_STEPS,
+        settings.STUCK_STEPS_CACHE_TTL_SECONDS,
+        "get_stuck_steps",
+        step_id=step_id,
+        page=page,
+        per_page=per_page,
+    )
 
 
 @router.get("/dashboard/metrics", response_model=DashboardMetrics)
 async def get_dashboard_metrics(
-    db: AsyncSession = Depends(get_db),
-    current_user=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
 ):
-    """Aggregate dashboard metrics for admin overview."""
-    now = datetime.now(timezone.utc)
+    """Aggregate dashboard metrics for admin overview (cached)."""
+    return await _cached_dashboard(
+        DASHBOARD_METRICS,
+        settings.DASHBOARD_METRICS_CACHE_TTL_SECONDS,
+        "get_metrics",
+    )
 
-    # Total cases
-    total_result = await db.execute(select(func.count()).select_from(ClientORM))
-    total_cases = total_result.scalar() or 0
 
-    # By status
-    status_query = (
-        select(ClientORM.status, func.count())
-        .group_by(ClientORM.status)
-    )
-    status_result = await db.execute(status_query)
-    by_status = {row[0]: row[1] for row in status_result.all()}
-
-    # Stuck steps: IN_PROGRESS for more than threshold days
-    stuck_cutoff = now - timedelta(days=settings.STUCK_STEP_THRESHOLD_DAYS)
-    stuck_query = (
-        select(WorkflowStepInstanceORM, ClientORM.client_name, ClientORM.id)
-        .join(WorkflowInstanceORM, WorkflowStepInstanceORM.workflow_instance_id == WorkflowInstanceORM.id)
-        .join(ClientORM, WorkflowInstanceORM.client_id == ClientORM.id)
-        .where(
-            WorkflowStepInstanceORM.status == "IN_PROGRESS",
-            WorkflowStepInstanceORM.started_at < stuck_cutoff,
-        )
-        .order_by(WorkflowStepInstanceORM.started_at.asc())
+@router.get("/analytics/step-durations", response_model=StepDurationReport)
+async def get_step_durations(
+    weeks: int = Query(12, ge=1, le=104),
+    step_id: str | None = None,
+    employee_bucket: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+):
+    """Return p50/p90/p99 step durations per step and per ISO week."""
+    service = AnalyticsService(db)
+    return await service.get_step_durations(
+        weeks=weeks, step_id=step_id, employee_bucket=employee_bucket
     )
-    stuck_result = await db.execute(stuck_query)
-    stuck_steps: list[StuckStep] = []
-    for step, client_name, client_id in stuck_result.all():
-        days = (now - step.started_at.replace(tzinfo=timezone.utc)).days if step.started_at else 0
-        stuck_steps.append(StuckStep(
-            client_id=str(client_id),
-            client_name=client_name,
-            step_id=step.step_id,
-            days_stuck=days,
-        ))
-
-    # Stale cases (same as SLA alerts)
-    warning_cutoff = now - timedelta(days=settings.SLA_WARNING_DAYS)
-    stale_query = (
-        select(ClientORM)
-        .where(ClientORM.updated_at < warning_cutoff)
-        .order_by(ClientORM.updated_at.asc())
+
+
+@router.get("/analytics/funnel", response_model=FunnelReport)
+async def get_step_funnel(
+    weeks: int = Query(12, ge=1, le=104),
+    channel: Literal["online", "offline"] | None = None,
+    assigned_role: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+):
+    """Return where cases drop off across workflow steps, by entry week."""
+    service = AnalyticsService(db)
+    return await service.get_funnel(
+        weeks=weeks, channel=channel, assigned_role=assigned_role
     )
-    stale_result = await db.execute(stale_query)
-    stale_cases: list[SlaAlert] = []
-    for c in stale_result.scalars().all():
-        days = (now - c.updated_at.replace(tzinfo=timezone.utc)).days if c.updated_at else 0
-        severity = "critical" if days >= settings.SLA_CRITICAL_DAYS else "warning"
-        stale_cases.append(SlaAlert(
-            client_id=str(c.id),
-            client_name=c.client_name,
-            status=c.status,
-            days_stale=days,
-            severity=severity,
-        ))
-
-    # Avg cycle time: completed workflows (started_at → completed_at)
-    cycle_query = (
-        select(func.avg(
-            func.extract("epoch", WorkflowInstanceORM.completed_at)
-            - func.extract("epoch", WorkflowInstanceORM.started_at)
-        ))
-        .where(
-            WorkflowInstanceORM.completed_at.isnot(None),
-            WorkflowInstanceORM.started_at.isnot(None),
+
+
+@router.get("/analytics/activity", response_model=ActivityHistogram)
+async def get_activity_histogram(
+    interval: Literal["day", "week"] = "day",
+    periods: int = Query(30, ge=1, le=366),
+    db: AsyncSession = Depends(get_db),
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+):
+    """Return daily or weekly counts of submissions, starts, handoffs and uploads.
+
+    Read from the per-day event rollup, never from the raw event log.
+    """
+    service = AnalyticsService(db)
+    return await service.get_activity_histogram(interval=interval, periods=periods)
+
+
+@router.get("/clients/export")
+async def export_clients(
+    format: Literal["csv", "parquet"] = "csv",
+    search: str | None = Query(None),
+    status: ClientStatus | None = Query(None),
+    assigned_to_user_id: UUID | None = Query(None),
+    stale: bool | None = Query(None),
+    stale_threshold_days: int = Query(7, ge=1),
+    sort_by: str = Query("client_name"),
+    sort_order: str = Query("asc", pattern="^(asc|desc)$"),
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+):
+    """Stream the whole case list with the ``GET /clients`` filters.
+
+    One request replaces paging through ``GET /clients``; rows are read
+    with a server-side cursor and written out as they arrive.  Parquet
+    requires ``pyarrow`` to be installed.
+    """
+    if format == "parquet" and not parquet_available():
+        raise HTTPException(
+            status_code=501, detail="Parquet export is not available on this server"
         )
+    params = ClientExportParams(
+        search=search,
+        status=status,
+        assigned_to_user_id=assigned_to_user_id,
+        stale=stale,
+        stale_threshold_days=stale_threshold_days,
+        sort_by=sort_by,
+        sort_order=sort_order,
     )
-    cycle_result = await db.execute(cycle_query)
-    avg_seconds = cycle_result.scalar()
-    avg_cycle_time_days = round(avg_seconds / 86400, 1) if avg_seconds else None
-
-    # Submissions last 7 / 30 days
-    for days_ago, attr_name in [(7, "submissions_7"), (30, "submissions_30")]:
-        cutoff = now - timedelta(days=days_ago)
-        sub_query = (
-            select(func.count())
-            .select_from(EventLogORM)
-            .where(
-                EventLogORM.event_type == "WorkflowSubmitted",
-                EventLogORM.created_at >= cutoff,
-            )
-        )
-        sub_result = await db.execute(sub_query)
-        if attr_name == "submissions_7":
-            submissions_7 = sub_result.scalar() or 0
-        else:
-            submissions_30 = sub_result.scalar() or 0
-
-    return DashboardMetrics(
-        total_cases=total_cases,
-        by_status=by_status,
-        stuck_steps=stuck_steps,
-        stale_cases=stale_cases,
-        avg_cycle_time_days=avg_cycle_time_days,
-        submissions_last_7_days=submissions_7,
-        submissions_last_30_days=submissions_30,
+
+    # The stream outlives the request's session, so it opens its own.
+    async def body():
+        async with async_session_factory() as session:
+            async for chunk in ClientExportService(session).stream(params, format):
+                yield chunk
+
+    writer = WRITERS[format]
+    filename = f"cases-{datetime.now(timezone.utc):%Y%m%d}.{writer.extension}"
+    return StreamingResponse(
+        body(),
+        media_type=writer.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
+
+
+@router.get("/storage/cache", response_model=FileCacheStats)
+async def get_file_cache_stats(
+    principal=Depends(require_role("BROKER_TPA_GA_ADMIN")),
+):
+    """Return hit/miss metrics for the local file cache in this worker."""
+    storage = get_file_storage()
+    if not isinstance(storage, CachingFileStorage):
+        return FileCacheStats(enabled=False)
+    return FileCacheStats(enabled=True, **storage.stats())
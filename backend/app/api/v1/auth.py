@@ -1,6 +1,7 @@
 """Authentication endpoints: login, refresh, register, and current-user lookup."""
 
 from datetime import datetime, timedelta, timezone
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from jose import JWTError, jwt
@@ -38,10 +39,16 @@ class RefreshRequest(BaseModel):
 
 
 def create_access_token(user_id: str, role: str) -> str:
-    expire = datetime.now(timezone.utc) + timedelta(
-        minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-    )
-    payload = {"sub": user_id, "role": role, "exp": expire, "type": "access"}
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    # ``iat`` lets get_principal decide whether the role claim is still fresh.
+    payload = {
+        "sub": user_id,
+        "role": role,
+        "iat": now,
+        "exp": expire,
+        "type": "access",
+    }
     return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
 
@@ -81,8 +88,12 @@ async def login(request: LoginRequest, db: AsyncSession = Depends(get_db)):
 
 
 @router.post("/refresh", response_model=TokenResponse)
-async def refresh(request: RefreshRequest):
-    """Exchange a valid refresh token for a new access/refresh token pair."""
+async def refresh(request: RefreshRequest, db: AsyncSession = Depends(get_db)):
+    """Exchange a valid refresh token for a new access/refresh token pair.
+
+    The user is re-read so the new access token carries their current role;
+    access tokens are authorized from that claim without a user query.
+    """
     try:
         payload = jwt.decode(
             request.refresh_token,
@@ -91,17 +102,20 @@ async def refresh(request: RefreshRequest):
         )
         if payload.get("type") != "refresh":
             raise HTTPException(status_code=401, detail="Invalid token type")
+        user_id = UUID(payload.get("sub") or "")
+    except (JWTError, ValueError):
+        raise HTTPException(status_code=401, detail="Invalid refresh token")
 
-        user_id = payload.get("sub")
-        role = payload.get("role")
-
-        return TokenResponse(
-            access_token=create_access_token(user_id, role),
-            refresh_token=create_refresh_token(user_id, role),
-        )
-    except JWTError:
+    result = await db.execute(select(UserORM).where(UserORM.id == user_id))
+    user = result.scalar_one_or_none()
+    if not user or not user.is_active:
         raise HTTPException(status_code=401, detail="Invalid refresh token")
 
+    return TokenResponse(
+        access_token=create_access_token(str(user.id), user.role),
+        refresh_token=create_refresh_token(str(user.id), user.role),
+    )
+
 
 @router.get("/me", response_model=User)
 async def get_me(current_user: UserORM = Depends(get_current_user)):
@@ -1,10 +1,18 @@
 """Client endpoints: list, retrieve, readiness, timeline, and assignment."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.api.dependencies import get_current_user, get_db
+from app.api.dependencies import (
+    Principal,
+    get_current_user,
+    get_db,
+    require_client_access,
+    require_role,
+)
+from app.config import settings
 from app.domain.models.client import (
     CaseDiagnostics,
     CaseReadiness,
@@ -13,11 +21,23 @@ from app.domain.models.client import (
     ClientListResponse,
     TimelineResponse,
 )
-from app.domain.services.client_service import ClientService
+from app.domain.services.client_service import (
+    CASE_HANDLER_ROLES,
+    ClientService,
+    decode_timeline_cursor,
+)
+from app.domain.services.timeline_stream_service import TimelineStreamService
+from app.infrastructure.database.event_log_listener import get_event_log_listener
 from app.infrastructure.database.models.user_orm import UserORM
 
 router = APIRouter(prefix="/clients", tags=["clients"])
 
+# Routes for one client are limited to its members.  ``assign-me`` is not,
+# as it is how a case handler takes on an unowned case from the list.
+# Ownership grants access, so only case handlers may change it.
+client_access = [Depends(require_client_access)]
+case_handlers = require_role(*CASE_HANDLER_ROLES)
+
 
 @router.get("", response_model=ClientListResponse)
 async def list_clients(
@@ -49,7 +69,7 @@ async def list_clients(
     return await service.list_clients(params)
 
 
-@router.get("/{client_id}", response_model=Client)
+@router.get("/{client_id}", response_model=Client, dependencies=client_access)
 async def get_client(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
@@ -63,7 +83,11 @@ async def get_client(
     return client
 
 
-@router.get("/{client_id}/readiness", response_model=CaseReadiness)
+@router.get(
+    "/{client_id}/readiness",
+    response_model=CaseReadiness,
+    dependencies=client_access,
+)
 async def check_readiness(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
@@ -74,21 +98,85 @@ async def check_readiness(
     return await service.check_readiness(client_id)
 
 
-@router.get("/{client_id}/timeline", response_model=TimelineResponse)
+@router.get(
+    "/{client_id}/timeline",
+    response_model=TimelineResponse,
+    dependencies=client_access,
+)
 async def get_timeline(
     client_id: UUID,
     event_type: str | None = Query(None),
+    step_id: str | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    before: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(True),
     db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user),
 ):
-    """Get chronological event history for a case."""
+    """Get chronological event history for a case, newest first.
+
+    Page with ``before`` rather than ``offset`` so deep pages cost the same
+    as the first; pass ``include_total=false`` to skip the count query.
+    """
     service = ClientService(db)
-    return await service.get_timeline(client_id, limit, offset, event_type=event_type)
+    try:
+        return await service.get_timeline(
+            client_id,
+            limit,
+            offset,
+            event_type=event_type,
+            step_id=step_id,
+            before=before,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
-@router.get("/{client_id}/diagnostics", response_model=CaseDiagnostics)
+@router.get("/{client_id}/timeline/stream", dependencies=client_access)
+async def stream_timeline(
+    client_id: UUID,
+    last_event_id: str | None = Header(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user),
+):
+    """Stream new timeline events for a case as Server-Sent Events.
+
+    Each event's ``id`` is a timeline cursor; reconnecting with
+    ``Last-Event-ID`` first replays what was missed, possibly repeating
+    events from the last ``TIMELINE_STREAM_REPLAY_MARGIN_SECONDS``.  A comment line is
+    sent every ``TIMELINE_STREAM_HEARTBEAT_SECONDS`` to keep proxies from
+    closing an idle stream.
+    """
+    if last_event_id is not None:
+        try:
+            decode_timeline_cursor(last_event_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    listener = get_event_log_listener()
+    if listener.at_capacity:
+        raise HTTPException(status_code=503, detail="Too many live timeline streams")
+
+    # Release the request's connection; the stream uses short-lived sessions.
+    await db.commit()
+    service = TimelineStreamService(
+        listener,
+        heartbeat_seconds=settings.TIMELINE_STREAM_HEARTBEAT_SECONDS,
+        replay_margin_seconds=settings.TIMELINE_STREAM_REPLAY_MARGIN_SECONDS,
+    )
+    return StreamingResponse(
+        service.stream(client_id, last_event_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/{client_id}/diagnostics",
+    response_model=CaseDiagnostics,
+    dependencies=client_access,
+)
 async def get_diagnostics(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
@@ -102,16 +190,21 @@ async def get_diagnostics(
         raise HTTPException(status_code=404, detail=str(e))
 
 
-@router.patch("/{client_id}/assign", response_model=Client)
+@router.patch("/{client_id}/assign", response_model=Client, dependencies=client_access)
 async def assign_owner(
     client_id: UUID,
     user_id: UUID = Query(...),
     db: AsyncSession = Depends(get_db),
-    current_user: UserORM = Depends(get_current_user),
+    principal: Principal = Depends(case_handlers),
 ):
-    """Assign a case owner."""
+    """Assign a case owner; the new owner must be a case handler."""
     service = ClientService(db)
-    client = await service.assign_owner(client_id, user_id, acting_user_id=current_user.id)
+    try:
+        client = await service.assign_owner(
+            client_id, user_id, acting_user_id=principal.id
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
     return client
@@ -121,11 +214,14 @@ async def assign_owner(
 async def assign_to_me(
     client_id: UUID,
     db: AsyncSession = Depends(get_db),
-    current_user: UserORM = Depends(get_current_user),
+    principal: Principal = Depends(case_handlers),
 ):
-    """Assign the current user as case owner."""
+    """Assign the current user as owner of a case that has none."""
     service = ClientService(db)
-    client = await service.assign_owner(client_id, current_user.id, acting_user_id=current_user.id)
+    try:
+        client = await service.claim_owner(client_id, principal.id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     if not client:
         raise HTTPException(status_code=404, detail="Client not found")
     return client
@@ -2,26 +2,27 @@
 
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Form, HTTPException, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Form, HTTPException, Query, UploadFile
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_db
-from app.config import settings
+from app.api.dependencies import get_current_user, get_db, require_client_access
 from app.domain.models.document import Document
+from app.domain.services.case_export_service import CaseExportService
 from app.domain.services.document_service import DocumentService
 from app.infrastructure.database.models.user_orm import UserORM
-from app.infrastructure.storage.file_storage import LocalFileStorage
+from app.infrastructure.storage import FileStorage, get_file_storage
 
 router = APIRouter(
     prefix="/clients/{client_id}/documents",
     tags=["documents"],
+    dependencies=[Depends(require_client_access)],
 )
 
 
-def _get_storage() -> LocalFileStorage:
-    """Return a LocalFileStorage instance configured from application settings."""
-    return LocalFileStorage(upload_dir=settings.UPLOAD_DIR)
+def _get_storage() -> FileStorage:
+    """Return the shared storage backend configured from application settings."""
+    return get_file_storage()
 
 
 @router.get("", response_model=list[Document])
@@ -36,6 +37,34 @@ async def list_documents(
     return await service.list_documents(client_id)
 
 
+@router.get("/export")
+async def export_case_file(
+    client_id: UUID,
+    workflow_instance_id: UUID | None = Query(None),
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user),
+):
+    """Stream a ZIP of the complete case file.
+
+    Includes every non-deleted document for the client (or only those
+    linked to *workflow_instance_id*), the servicing payload and the
+    timeline.  The archive is produced incrementally as it is sent.
+    """
+    service = CaseExportService(db, _get_storage())
+    try:
+        export = await service.prepare(client_id, workflow_instance_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+    return StreamingResponse(
+        service.stream(export),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": f'attachment; filename="{export.archive_name}"',
+        },
+    )
+
+
 @router.post("", response_model=Document, status_code=201)
 async def upload_document(
     client_id: UUID,
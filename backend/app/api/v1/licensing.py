@@ -9,8 +9,9 @@ from __future__ import annotations
 import hashlib
 from datetime import date, timedelta
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.dependencies import get_principal
 from app.domain.models.licensing import (
     RemediationInfo,
     VerifyCodeRequest,
@@ -19,7 +20,12 @@ from app.domain.models.licensing import (
     VerifyStatusResponse,
 )
 
-router = APIRouter(prefix="/licensing", tags=["licensing"])
+# Any signed-in user may run checks; authorized from token claims alone.
+router = APIRouter(
+    prefix="/licensing",
+    tags=["licensing"],
+    dependencies=[Depends(get_principal)],
+)
 
 # ---------------------------------------------------------------------------
 # Helpers
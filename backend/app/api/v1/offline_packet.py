@@ -1,39 +1,36 @@
 """Offline packet endpoints: status, submit, and template downloads."""
 
-from pathlib import Path
+import logging
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_db
+from app.api.dependencies import get_current_user, get_db, require_client_access
 from app.config import settings
 from app.domain.models.offline_packet import OfflinePacketStatusResponse
 from app.domain.services.offline_packet_service import OfflinePacketService
 from app.infrastructure.database.models.user_orm import UserORM
 from app.infrastructure.repositories.workflow_repo import WorkflowRepository
+from app.infrastructure.storage.template_catalogue import (
+    TEMPLATE_FILES,
+    get_template_catalogue,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/clients/{client_id}/offline-packet",
     tags=["offline-packet"],
+    dependencies=[Depends(require_client_access)],
 )
 
-TEMPLATE_FILES = {
-    "MASTER_APP": "MASTER_APP.pdf",
-    "DATA_GATHERING_TOOL": "DATA_GATHERING_TOOL.pdf",
-    "CENSUS_TEMPLATE": "CENSUS_TEMPLATE.pdf",
-    "COMMISSION_ACK": "COMMISSION_ACK.pdf",
-    "ENROLLMENT_FORM": "ENROLLMENT_FORM.pdf",
-}
-
-
 async def _get_workflow_instance_id(
     client_id: UUID, db: AsyncSession
 ) -> UUID:
     """Resolve the workflow instance ID for a client, raising 404 if not found."""
     repo = WorkflowRepository(db)
-    instance = await repo.get_instance_by_client(client_id)
+    instance = await repo.get_instance_summary_by_client(client_id)
     if not instance:
         raise HTTPException(status_code=404, detail="No workflow found for this client")
     if not instance.is_offline:
@@ -75,13 +72,32 @@ async def submit_packet(
         raise HTTPException(status_code=400, detail=str(exc))
 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return whether the request's If-None-Match covers *etag*."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {c.strip().removeprefix("W/") for c in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @router.get("/templates/{document_type}")
 async def download_template(
     client_id: UUID,
     document_type: str,
+    request: Request,
+    prefill: bool = Query(
+        False, description="Stamp the client's name, address and unique ID"
+    ),
+    db: AsyncSession = Depends(get_db),
     current_user: UserORM = Depends(get_current_user),
 ):
-    """Download a blank template PDF for the specified document type."""
+    """Download a template PDF for the specified document type.
+
+    Templates are served from memory with an ETag; a matching
+    ``If-None-Match`` yields ``304 Not Modified``.  With ``prefill=true``
+    the client's details are stamped onto the first page.
+    """
     filename = TEMPLATE_FILES.get(document_type)
     if not filename:
         raise HTTPException(
@@ -89,12 +105,57 @@ async def download_template(
             detail=f"No template available for document type: {document_type}",
         )
 
-    template_path = Path(settings.TEMPLATE_DIR) / filename
-    if not template_path.exists():
+    catalogue = get_template_catalogue()
+    asset = catalogue.get(document_type)
+    if asset is None:
         raise HTTPException(status_code=404, detail="Template file not found on server")
 
-    return FileResponse(
-        path=str(template_path),
-        filename=filename,
+    if not prefill:
+        headers = {
+            "ETag": asset.etag,
+            "Cache-Control": f"private, max-age={settings.TEMPLATE_CACHE_MAX_AGE}",
+        }
+        if _etag_matches(request, asset.etag):
+            return Response(status_code=304, headers=headers)
+        return Response(
+            content=asset.content,
+            media_type="application/pdf",
+            headers={
+                **headers,
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
+
+    service = OfflinePacketService(db)
+    try:
+        details = await service.get_template_prefill(client_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+    # Client details can change at any time, so prefilled copies are always
+    # revalidated; the ETag lets that round trip skip rendering.
+    etag = catalogue.prefilled_etag(asset, client_id, details.updated_at)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    try:
+        content = await catalogue.render_prefilled(
+            asset, client_id, details.updated_at, details.lines
+        )
+    except ValueError as exc:
+        logger.error(f"Failed to prefill template {filename}: {exc}")
+        raise HTTPException(
+            status_code=500, detail="Template could not be prefilled"
+        )
+
+    return Response(
+        content=content,
         media_type="application/pdf",
+        headers={
+            **headers,
+            "Content-Disposition": (
+                f'attachment; filename="{details.unique_id}_{filename}"'
+            ),
+        },
     )
@@ -5,14 +5,15 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user, get_db
-from app.domain.models.workflow import StepDataUpdate, WorkflowInstance
+from app.api.dependencies import get_current_user, get_db, require_client_access
+from app.domain.models.workflow import StepDataUpdate, StepHistory, WorkflowInstance
 from app.domain.services.workflow_service import WorkflowService
 from app.infrastructure.database.models.user_orm import UserORM
 
 router = APIRouter(
     prefix="/clients/{client_id}/workflow",
     tags=["workflow"],
+    dependencies=[Depends(require_client_access)],
 )
 
 
@@ -79,6 +80,21 @@ async def get_step_data(
         raise HTTPException(status_code=404, detail=str(exc))
 
 
+@router.get("/steps/{step_id}/history", response_model=StepHistory)
+async def get_step_history(
+    client_id: UUID,
+    step_id: str,
+    db: AsyncSession = Depends(get_db),
+    current_user: UserORM = Depends(get_current_user),
+):
+    """Get every logged version of a step's data, rebuilt from the save deltas."""
+    service = WorkflowService(db)
+    try:
+        return await service.get_step_history(client_id, step_id)
+    except ValueError as exc:
+        raise HTTPException(status_code=404, detail=str(exc))
+
+
 @router.put("/steps/{step_id}")
 async def save_step_data(
     client_id: UUID,
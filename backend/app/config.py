@@ -13,20 +13,77 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080
+    # Access tokens younger than this are authorized from their claims alone;
+    # older ones have the user's role and status re-checked in the database.
+    ACCESS_TOKEN_CLAIMS_MAX_AGE_MINUTES: int = 15
     UPLOAD_DIR: str = "./uploads"
     TEMPLATE_DIR: str = "./templates"
+    TEMPLATE_CACHE_MAX_AGE: int = 86400
+    TEMPLATE_PREFILL_WORKERS: int = 2
+    TEMPLATE_PREFILL_CACHE_SIZE: int = 256
     S3_BUCKET: Optional[str] = None
+    # Serve repeat downloads from a local disk cache, e.g. when UPLOAD_DIR
+    # is a network share.  Each worker process keeps its own cache.
+    FILE_CACHE_ENABLED: bool = False
+    FILE_CACHE_DIR: str = "./cache/files"
+    FILE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    EXPORT_FETCH_CONCURRENCY: int = 4
+    DOCUMENT_PROCESSING_WORKERS: int = 2
+    DOCUMENT_PROCESSING_QUEUE_SIZE: int = 1000
+    # A PROCESSING document is only reclaimed once its claim is this old.
+    DOCUMENT_PROCESSING_LEASE_SECONDS: int = 600
     CORS_ORIGINS: list[str] = ["http://localhost:4200"]
     INVITATION_EXPIRY_DAYS: int = 30
     FRONTEND_URL: str = "http://localhost:4200"
     SLA_WARNING_DAYS: int = 7
     SLA_CRITICAL_DAYS: int = 14
     STUCK_STEP_THRESHOLD_DAYS: int = 7
+    DASHBOARD_PREVIEW_LIMIT: int = 20
+    CLIENT_EXPORT_BATCH_SIZE: int = 5000
+    # Larger step-save deltas are logged as a content hash only.
+    STEP_SAVE_PATCH_MAX_BYTES: int = 16384
+    METRICS_RECONCILE_INTERVAL_SECONDS: int = 900
+    ALERT_SCAN_INTERVAL_SECONDS: int = 300
+
+    # event_log partitions: one per UTC month, archived to file storage and
+    # dropped once older than the retention period.
+    EVENT_LOG_RETENTION_MONTHS: int = 24
+    EVENT_LOG_PARTITIONS_AHEAD: int = 3
+    EVENT_LOG_MAINTENANCE_INTERVAL_SECONDS: int = 86400
+    EVENT_LOG_ARCHIVE_SUBFOLDER: str = "archive/event_log"
+    EVENT_LOG_ARCHIVE_BATCH_SIZE: int = 5000
+    # Runs of step autosaves older than this are merged into one row.
+    EVENT_LOG_COMPACTION_AGE_DAYS: int = 7
+    EVENT_LOG_COMPACTION_INTERVAL_SECONDS: int = 3600
+    EVENT_LOG_COMPACTION_MAX_ROWS: int = 50000
+    # event_daily_counts is topped up from event_log in batches; rows newer
+    # than the settle time are left for the next run.
+    EVENT_COUNT_ROLLUP_INTERVAL_SECONDS: int = 60
+    EVENT_COUNT_ROLLUP_SETTLE_SECONDS: int = 30
+
+    # Admin response cache
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_STALE_SECONDS: int = 300
+    SLA_ALERTS_CACHE_TTL_SECONDS: int = 60
+    STUCK_STEPS_CACHE_TTL_SECONDS: int = 60
+    DASHBOARD_METRICS_CACHE_TTL_SECONDS: int = 30
+
+    # Per-user client membership cache for require_client_access
+    CLIENT_ACCESS_CACHE_TTL_SECONDS: int = 60
+    CLIENT_ACCESS_CACHE_MAX_USERS: int = 10000
+
+    # Live timeline streams (per process)
+    TIMELINE_STREAM_HEARTBEAT_SECONDS: int = 15
+    TIMELINE_STREAM_QUEUE_SIZE: int = 100
+    # Replays re-read this far before the cursor to catch late commits.
+    TIMELINE_STREAM_REPLAY_MARGIN_SECONDS: int = 30
+    TIMELINE_STREAM_MAX_SUBSCRIBERS: int = 500
 
     # Database connection pool tuning
     DB_POOL_SIZE: int = 20
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_RECYCLE: int = 3600
+    DB_FANOUT_MAX_CONNECTIONS: int = 4
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
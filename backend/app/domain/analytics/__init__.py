@@ -0,0 +1,3 @@
+from app.domain.analytics.duration_sketch import DurationSketch
+
+__all__ = ["DurationSketch"]
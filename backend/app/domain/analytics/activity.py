@@ -0,0 +1,27 @@
+"""Event types grouped into the activity histogram series."""
+
+from datetime import date, timedelta
+
+ACTIVITY_CATEGORIES: dict[str, tuple[str, ...]] = {
+    "submissions": ("WorkflowSubmitted", "OfflinePacketSubmitted"),
+    "starts": ("GroupSetupStarted", "OfflineSetupChosen"),
+    "handoffs": ("WorkflowHandoffRequested",),
+    "document_uploads": ("DocumentUploaded",),
+}
+
+DAY = "day"
+WEEK = "week"
+
+
+def bucket_start(day: date, interval: str) -> date:
+    """Return the first day of the *interval* bucket containing *day*."""
+    if interval == WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def bucket_starts(until: date, interval: str, periods: int) -> list[date]:
+    """Return the starts of the last *periods* buckets up to *until*, oldest first."""
+    step = timedelta(days=7 if interval == WEEK else 1)
+    last = bucket_start(until, interval)
+    return [last - step * i for i in range(periods - 1, -1, -1)]
@@ -0,0 +1,72 @@
+"""Log-bucketed quantile sketch for step durations.
+
+A DDSketch-style histogram: a positive value ``x`` falls in bucket
+``ceil(log_gamma(x))`` with ``gamma = (1 + a) / (1 - a)``, so any quantile
+read back is within relative accuracy ``a`` of the true value.  Buckets are
+plain integer counts, which makes sketches cheap to store as rows and to
+merge by addition across steps, weeks or other dimensions.
+"""
+
+import math
+from collections.abc import Iterable
+
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LOG_GAMMA = math.log(GAMMA)
+
+# Values at or below one second share bucket 0.
+MIN_VALUE = 1.0
+
+
+def bucket_index(value: float) -> int:
+    """Return the bucket holding *value* (seconds)."""
+    if value <= MIN_VALUE:
+        return 0
+    return math.ceil(math.log(value) / _LOG_GAMMA)
+
+
+def bucket_value(index: int) -> float:
+    """Representative value for bucket *index* (within the accuracy bound)."""
+    if index <= 0:
+        return MIN_VALUE
+    return 2 * GAMMA ** index / (GAMMA + 1)
+
+
+class DurationSketch:
+    """Mergeable quantile sketch over bucket counts."""
+
+    def __init__(self, buckets: dict[int, int] | None = None) -> None:
+        self.buckets: dict[int, int] = dict(buckets or {})
+
+    @property
+    def count(self) -> int:
+        return sum(self.buckets.values())
+
+    def add(self, value: float, count: int = 1) -> None:
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def merge(self, other: "DurationSketch") -> None:
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple[int, int]]) -> "DurationSketch":
+        """Build a sketch from ``(bucket_index, count)`` pairs."""
+        sketch = cls()
+        for index, count in rows:
+            sketch.buckets[index] = sketch.buckets.get(index, 0) + count
+        return sketch
+
+    def quantile(self, q: float) -> float | None:
+        """Return the estimated *q*-quantile (0 <= q <= 1), or ``None`` if empty."""
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                return bucket_value(index)
+        return bucket_value(max(self.buckets))
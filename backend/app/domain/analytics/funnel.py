@@ -0,0 +1,60 @@
+"""Cohort rules for the step funnel projection.
+
+Counts are attributed to the ISO week in which a step was *entered*, so a
+week's ``entered - completed - skipped`` is exactly the steps entered that
+week that are still open.  Once the week is older than the abandonment
+threshold those open steps are reported as abandoned.
+"""
+
+from datetime import date, datetime, timedelta
+
+from app.domain.analytics.step_timing import week_start
+
+ONLINE = "online"
+OFFLINE = "offline"
+
+ENTERED = "entered"
+COMPLETED = "completed"
+SKIPPED = "skipped"
+
+STEP_STARTED = "WorkflowStepStarted"
+STEP_COMPLETED = "WorkflowStepCompleted"
+STEP_SKIPPED = "WorkflowStepSkipped"
+STEP_EVENT_TYPES = (STEP_STARTED, STEP_COMPLETED, STEP_SKIPPED)
+
+
+def channel(is_offline: bool | None) -> str:
+    return OFFLINE if is_offline else ONLINE
+
+
+def funnel_increments(
+    event_type: str,
+    timestamp: datetime,
+    started_at: datetime | None,
+    entry_counted: bool = True,
+) -> tuple[date, dict[str, int]]:
+    """Return the cohort week and counter increments for one step event.
+
+    A step finished without ever being started (skipped or completed
+    straight from PENDING) is entered and finished at once.  Pass
+    ``entry_counted=False`` when the step's start was never recorded as an
+    event, e.g. for history predating ``WorkflowStepStarted``.
+    """
+    if event_type == STEP_STARTED:
+        return week_start(started_at or timestamp), {ENTERED: 1}
+
+    outcome = COMPLETED if event_type == STEP_COMPLETED else SKIPPED
+    if started_at is None:
+        return week_start(timestamp), {ENTERED: 1, outcome: 1}
+    if not entry_counted:
+        return week_start(started_at), {ENTERED: 1, outcome: 1}
+    return week_start(started_at), {outcome: 1}
+
+
+def is_settled(cohort_week: date, today: date, abandon_after_days: int) -> bool:
+    """Whether steps still open from *cohort_week* count as abandoned.
+
+    True once every step entered that week has been open for at least
+    *abandon_after_days*.
+    """
+    return cohort_week + timedelta(days=7 + abandon_after_days) <= today
@@ -0,0 +1,28 @@
+"""Dimension helpers for the step timing fact table."""
+
+from datetime import date, datetime, timedelta, timezone
+
+# Upper bounds (exclusive) of the eligible-employee buckets.
+EMPLOYEE_BUCKETS: list[tuple[int, str]] = [
+    (50, "1-49"),
+    (100, "50-99"),
+    (500, "100-499"),
+]
+LARGEST_EMPLOYEE_BUCKET = "500+"
+UNKNOWN_EMPLOYEE_BUCKET = "unknown"
+
+
+def employee_bucket(eligible_employees: int | None) -> str:
+    """Return the reporting bucket for a client's eligible employee count."""
+    if eligible_employees is None:
+        return UNKNOWN_EMPLOYEE_BUCKET
+    for upper, label in EMPLOYEE_BUCKETS:
+        if eligible_employees < upper:
+            return label
+    return LARGEST_EMPLOYEE_BUCKET
+
+
+def week_start(moment: datetime) -> date:
+    """Return the Monday (UTC) of the ISO week containing *moment*."""
+    day = moment.astimezone(timezone.utc).date()
+    return day - timedelta(days=day.weekday())
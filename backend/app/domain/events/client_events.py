@@ -52,3 +52,15 @@ class CaseOwnerAssigned(DomainEvent):
 class OfflinePacketSubmitted(DomainEvent):
     client_id: UUID
     workflow_instance_id: UUID
+
+
+class CaseStatusChanged(DomainEvent):
+    client_id: UUID
+    previous_status: str | None = None
+    new_status: str
+
+
+class SlaBreached(DomainEvent):
+    client_id: UUID
+    severity: str
+    days_stale: int
@@ -4,26 +4,95 @@ Import and wire up domain event handlers here.  This module is called
 once during application startup from ``app.main``.
 """
 
+from typing import Protocol
+
 from app.domain.events.handlers.audit_handler import (
     AuditHandler,
     setup_audit_handlers,
 )
+from app.domain.events.handlers.cache_handler import (
+    CacheInvalidationHandler,
+    MembershipInvalidationHandler,
+    setup_cache_handlers,
+    setup_membership_handlers,
+)
+from app.domain.events.handlers.document_processing_handler import (
+    DocumentProcessingHandler,
+    setup_document_processing_handlers,
+)
+from app.domain.events.handlers.funnel_handler import (
+    FunnelHandler,
+    setup_funnel_handlers,
+)
+from app.domain.events.handlers.metrics_handler import (
+    MetricsHandler,
+    setup_metrics_handlers,
+)
 from app.domain.events.handlers.notification_handler import (
     NotificationHandler,
     setup_notification_handlers,
 )
+from app.domain.events.handlers.step_timing_handler import (
+    StepTimingHandler,
+    setup_step_timing_handlers,
+)
 
 __all__ = [
     "AuditHandler",
     "setup_audit_handlers",
+    "BackgroundWorker",
+    "CacheInvalidationHandler",
+    "setup_cache_handlers",
+    "MembershipInvalidationHandler",
+    "setup_membership_handlers",
+    "DocumentProcessingHandler",
+    "setup_document_processing_handlers",
+    "FunnelHandler",
+    "setup_funnel_handlers",
+    "MetricsHandler",
+    "setup_metrics_handlers",
     "NotificationHandler",
     "setup_notification_handlers",
+    "StepTimingHandler",
+    "setup_step_timing_handlers",
 ]
 
 
-def setup_event_handlers() -> None:
-    """Register all domain event handlers with the event bus."""
+class BackgroundWorker(Protocol):
+    """A handler that owns background tasks for the application's lifetime."""
+
+    async def start(self) -> None: ...
+
+    async def stop(self) -> None: ...
+
+
+def setup_event_handlers() -> list[BackgroundWorker]:
+    """Register all domain event handlers with the event bus.
+
+    Returns the handlers that run background tasks; the caller starts them
+    after registration and stops them on shutdown.
+    """
+    from app.config import settings
+    from app.infrastructure.cache import (
+        get_client_membership_index,
+        get_response_cache,
+    )
     from app.infrastructure.database.session import async_session_factory
+    from app.infrastructure.storage import get_file_storage
 
     setup_audit_handlers(async_session_factory)
     setup_notification_handlers()
+    setup_metrics_handlers(async_session_factory)
+    setup_step_timing_handlers(async_session_factory)
+    setup_funnel_handlers(async_session_factory)
+    document_processing = setup_document_processing_handlers(
+        async_session_factory,
+        get_file_storage(),
+        workers=settings.DOCUMENT_PROCESSING_WORKERS,
+        queue_size=settings.DOCUMENT_PROCESSING_QUEUE_SIZE,
+        lease_seconds=settings.DOCUMENT_PROCESSING_LEASE_SECONDS,
+    )
+    setup_cache_handlers(get_response_cache())
+    setup_membership_handlers(get_client_membership_index())
+
+    return [document_processing]
@@ -1,4 +1,3 @@
-import json
 import logging
 from typing import Callable
 
@@ -15,6 +14,7 @@ from app.domain.events.client_events import (
     InvitationSent,
     OfflinePacketSubmitted,
     OfflineSetupChosen,
+    SlaBreached,
 )
 from app.domain.events.event_bus import event_bus
 from app.domain.events.workflow_events import (
@@ -22,18 +22,27 @@ from app.domain.events.workflow_events import (
     DocumentUploaded,
     EnrollmentTransitionInitiated,
     MasterAppSigned,
+    StepStuck,
+    WorkflowHandoffRequested,
     WorkflowStepCompleted,
     WorkflowStepSaved,
     WorkflowStepSkipped,
     WorkflowStepStarted,
     WorkflowSubmitted,
 )
+from app.domain.models.client import TimelineEvent
+from app.infrastructure.repositories.event_log_repo import EventLogRepository
 
 logger = logging.getLogger(__name__)
 
 
 class AuditHandler:
-    """Persists domain events to the event_log table for auditing."""
+    """Persists domain events to the event_log table for auditing.
+
+    Rows for a client are announced with NOTIFY for live timeline streams.
+    The event_daily_counts rollup is not touched here; the EventCountRollup
+    job adds new rows to it in batches.
+    """
 
     def __init__(self, session_factory: Callable[..., AsyncSession]) -> None:
         self._session_factory = session_factory
@@ -43,14 +52,23 @@ class AuditHandler:
 
         try:
             async with self._session_factory() as session:
+                event_type = type(event).__name__
                 event_data = event.model_dump(mode="json")
+                description, icon = TimelineEvent.render(event_type, event_data)
                 log_entry = EventLogORM(
-                    event_type=type(event).__name__,
+                    event_type=event_type,
                     client_id=event.client_id,
                     user_id=event.user_id,
-                    payload=json.dumps(event_data),
+                    payload=event_data,
+                    description=description,
+                    icon=icon,
                 )
                 session.add(log_entry)
+                if event.client_id is not None:
+                    await session.flush()
+                    await EventLogRepository(session).notify_appended(
+                        log_entry.id, log_entry.client_id, log_entry.created_at
+                    )
                 await session.commit()
                 logger.info(
                     f"Audit log persisted for event {type(event).__name__} "
@@ -86,6 +104,9 @@ def setup_audit_handlers(session_factory: Callable[..., AsyncSession]) -> None:
         WorkflowSubmitted,
         MasterAppSigned,
         EnrollmentTransitionInitiated,
+        WorkflowHandoffRequested,
+        SlaBreached,
+        StepStuck,
     ]
 
     for event_type in all_event_types:
@@ -0,0 +1,104 @@
+import logging
+from typing import Type
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.client_events import (
+    AccessAssigned,
+    AccessRevoked,
+    CaseOwnerAssigned,
+    CaseStatusChanged,
+    SlaBreached,
+)
+from app.domain.events.event_bus import event_bus
+from app.domain.events.workflow_events import (
+    StepStuck,
+    WorkflowCompleted,
+    WorkflowSubmitted,
+)
+from app.infrastructure.cache import (
+    DASHBOARD_METRICS,
+    SLA_ALERTS,
+    STUCK_STEPS,
+    ClientMembershipIndex,
+    ResponseCache,
+)
+from app.infrastructure.database.session import run_after_commit
+
+logger = logging.getLogger(__name__)
+
+# Cached responses affected by each event type.
+INVALIDATIONS: dict[Type[DomainEvent], tuple[str, ...]] = {
+    CaseStatusChanged: (DASHBOARD_METRICS, SLA_ALERTS, STUCK_STEPS),
+    CaseOwnerAssigned: (SLA_ALERTS,),
+    WorkflowCompleted: (DASHBOARD_METRICS,),
+    WorkflowSubmitted: (DASHBOARD_METRICS,),
+    SlaBreached: (DASHBOARD_METRICS, SLA_ALERTS),
+    StepStuck: (DASHBOARD_METRICS, STUCK_STEPS),
+}
+
+# Events that change who may access a client.
+MEMBERSHIP_EVENTS: tuple[Type[DomainEvent], ...] = (
+    AccessAssigned,
+    AccessRevoked,
+    CaseOwnerAssigned,
+)
+
+
+class CacheInvalidationHandler:
+    """Expires cached admin responses when the data behind them changes.
+
+    Alerts that resolve on a scan publish no event; those changes show up
+    once the entry's TTL runs out.
+    """
+
+    def __init__(self, cache: ResponseCache) -> None:
+        self._cache = cache
+
+    async def handle(self, event: DomainEvent) -> None:
+        for namespace in INVALIDATIONS.get(type(event), ()):
+            self._cache.invalidate(namespace)
+
+
+class MembershipInvalidationHandler:
+    """Drops cached client memberships when access to a client changes.
+
+    Every set containing the client is dropped -- that covers a revoked
+    user and a previous owner, whom the events do not name -- as is the
+    new owner's.
+    """
+
+    def __init__(self, index: ClientMembershipIndex) -> None:
+        self._index = index
+
+    async def handle(self, event: DomainEvent) -> None:
+        self._invalidate(event)
+        # Handlers run before the request commits, so a load in between
+        # still reads the old rows; drop again once the change is visible.
+        run_after_commit(lambda: self._invalidate(event))
+
+    def _invalidate(self, event: DomainEvent) -> None:
+        self._index.invalidate_client(event.client_id)
+        if isinstance(event, CaseOwnerAssigned) and event.assigned_to_user_id:
+            self._index.invalidate_user(event.assigned_to_user_id)
+
+
+def setup_cache_handlers(cache: ResponseCache) -> None:
+    """Subscribe cache invalidation to the events in ``INVALIDATIONS``.
+
+    Call after the handlers that update the cached data (e.g. metrics),
+    since handlers run in subscription order.
+    """
+    handler = CacheInvalidationHandler(cache)
+    for event_type in INVALIDATIONS:
+        event_bus.subscribe(event_type, handler.handle)
+
+    logger.info("Cache invalidation handlers registered")
+
+
+def setup_membership_handlers(index: ClientMembershipIndex) -> None:
+    """Subscribe membership invalidation to ``MEMBERSHIP_EVENTS``."""
+    handler = MembershipInvalidationHandler(index)
+    for event_type in MEMBERSHIP_EVENTS:
+        event_bus.subscribe(event_type, handler.handle)
+
+    logger.info("Membership invalidation handlers registered")
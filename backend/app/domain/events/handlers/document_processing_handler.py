@@ -0,0 +1,230 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.event_bus import event_bus
+from app.domain.events.workflow_events import DocumentUploaded
+from app.domain.models.document import DocumentProcessingStatus
+from app.infrastructure.repositories.document_repo import DocumentRepository
+from app.infrastructure.storage.file_inspection import FileInspection, inspect_file
+from app.infrastructure.storage.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+# The upload request commits after the event is published, so a worker can
+# see the event before the row is visible.  Retry a few times before giving up.
+CLAIM_RETRY_DELAYS = (0.2, 0.5, 1.0, 2.0, 5.0)
+
+
+class DocumentProcessingHandler:
+    """Computes file metadata for uploaded documents in the background.
+
+    ``DocumentUploaded`` only enqueues the document id; a fixed pool of
+    workers drains the queue so uploads never wait on processing.  Anything
+    that does not fit in the queue stays PENDING in the database and is
+    picked up on the next start or periodic reclaim.
+
+    A claim is a lease of ``lease_seconds``, renewed while the document is
+    being worked on: documents left PROCESSING by a worker that died are
+    only returned to PENDING once it has expired, so a process starting
+    (e.g. during a rolling restart) does not take over documents another
+    live process is still working on.  The result is only written while
+    the claim is still held.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncSession],
+        storage: FileStorage,
+        workers: int,
+        queue_size: int,
+        lease_seconds: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self._storage = storage
+        self.lease_seconds = lease_seconds
+        self._worker_count = max(1, workers)
+        self._queue: asyncio.Queue[UUID] = asyncio.Queue(maxsize=queue_size)
+        self._workers: list[asyncio.Task] = []
+
+    async def handle_document_uploaded(self, event: DocumentUploaded) -> None:
+        if not self._workers:
+            return
+        try:
+            self._queue.put_nowait(event.document_id)
+        except asyncio.QueueFull:
+            logger.warning(
+                f"Document processing queue full; document {event.document_id} "
+                f"left PENDING until the next restart"
+            )
+
+    async def start(self) -> None:
+        """Spawn the worker pool and requeue documents left unprocessed."""
+        for i in range(self._worker_count):
+            self._workers.append(
+                asyncio.create_task(self._run(), name=f"document-processing-{i}")
+            )
+        self._workers.append(
+            asyncio.create_task(self._reclaim(), name="document-processing-reclaim")
+        )
+
+        pending = await self._requeue_backlog()
+        if pending is not None:
+            logger.info(
+                f"Document processing started with {self._worker_count} workers "
+                f"({pending} pending)"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the workers; in-flight documents are reclaimed later."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def _requeue_backlog(self) -> int | None:
+        """Reclaim expired leases and queue PENDING documents.
+
+        Returns how many were found, or ``None`` if the lookup failed.
+        """
+        try:
+            async with self._session_factory() as session:
+                repo = DocumentRepository(session)
+                await repo.reset_stale_processing(self.lease_seconds)
+                backlog = await repo.list_pending_processing(self._queue.maxsize or 1000)
+                await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to load document processing backlog: {e}")
+            return None
+
+        for document_id in backlog:
+            try:
+                self._queue.put_nowait(document_id)
+            except asyncio.QueueFull:
+                break
+        return len(backlog)
+
+    async def _reclaim(self) -> None:
+        """Periodically pick up documents whose worker died mid-way.
+
+        A document queued twice is harmless: only one claim succeeds.
+        """
+        while True:
+            await asyncio.sleep(self.lease_seconds)
+            await self._requeue_backlog()
+
+    async def _run(self) -> None:
+        while True:
+            document_id = await self._queue.get()
+            try:
+                await self._process(document_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to process document {document_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _process(self, document_id: UUID) -> None:
+        claimed = await self._claim(document_id)
+        if claimed is None:
+            return
+        file_path, file_name, claimed_at = claimed
+
+        # Renew the lease while the file is inspected, so a large document
+        # is not reclaimed by another worker part-way through.
+        work = asyncio.create_task(self._inspect(file_path, file_name))
+        try:
+            while not work.done():
+                await asyncio.wait({work}, timeout=self.lease_seconds / 3)
+                if not work.done():
+                    claimed_at = await self._renew(document_id, claimed_at)
+                    if claimed_at is None:
+                        logger.warning(
+                            f"Lost the processing lease on document {document_id}"
+                        )
+                        return
+        finally:
+            work.cancel()
+
+        try:
+            result = work.result()
+        except Exception as e:
+            logger.warning(f"Processing failed for document {document_id}: {e}")
+            await self._record(
+                document_id,
+                claimed_at,
+                status=DocumentProcessingStatus.FAILED.value,
+                processing_error=str(e)[:1000],
+            )
+            return
+
+        await self._record(
+            document_id,
+            claimed_at,
+            status=DocumentProcessingStatus.COMPLETED.value,
+            content_sha256=result.content_sha256,
+            sniffed_mime_type=result.sniffed_mime_type,
+            page_count=result.page_count,
+            text_length=result.text_length,
+        )
+
+    async def _inspect(self, file_path: str, file_name: str) -> FileInspection:
+        content = await self._storage.get(file_path)
+        return await asyncio.to_thread(inspect_file, content, file_name)
+
+    async def _claim(self, document_id: UUID) -> tuple[str, str, datetime] | None:
+        for delay in (0.0, *CLAIM_RETRY_DELAYS):
+            if delay:
+                await asyncio.sleep(delay)
+            async with self._session_factory() as session:
+                claimed = await DocumentRepository(session).claim_for_processing(
+                    document_id
+                )
+                await session.commit()
+            if claimed is not None:
+                return claimed
+        return None
+
+    async def _renew(self, document_id: UUID, claimed_at: datetime) -> datetime | None:
+        async with self._session_factory() as session:
+            renewed = await DocumentRepository(session).renew_processing_claim(
+                document_id, claimed_at
+            )
+            await session.commit()
+        return renewed
+
+    async def _record(
+        self, document_id: UUID, claimed_at: datetime, **values
+    ) -> None:
+        async with self._session_factory() as session:
+            recorded = await DocumentRepository(session).update_processing(
+                document_id, claimed_at, **values
+            )
+            await session.commit()
+        if not recorded:
+            logger.warning(
+                f"Discarded processing result for document {document_id}: "
+                f"its lease was taken over"
+            )
+
+
+def setup_document_processing_handlers(
+    session_factory: Callable[..., AsyncSession],
+    storage: FileStorage,
+    workers: int,
+    queue_size: int,
+    lease_seconds: float,
+) -> DocumentProcessingHandler:
+    """Subscribe the processing handler; the caller starts and stops it."""
+    handler = DocumentProcessingHandler(
+        session_factory, storage, workers, queue_size, lease_seconds
+    )
+    event_bus.subscribe(DocumentUploaded, handler.handle_document_uploaded)
+
+    logger.info("Document processing handlers registered")
+    return handler
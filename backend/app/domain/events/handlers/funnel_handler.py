@@ -0,0 +1,124 @@
+import logging
+from collections import defaultdict
+from typing import Callable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.analytics.funnel import STEP_STARTED, channel, funnel_increments
+from app.domain.events.event_bus import EventBus, event_bus
+from app.domain.events.workflow_events import (
+    WorkflowStepCompleted,
+    WorkflowStepSkipped,
+    WorkflowStepStarted,
+)
+from app.infrastructure.repositories.analytics_repo import AnalyticsRepository
+
+logger = logging.getLogger(__name__)
+
+StepEvent = WorkflowStepStarted | WorkflowStepCompleted | WorkflowStepSkipped
+
+
+class FunnelHandler:
+    """Keeps the step_funnel_counts projection in step with step events.
+
+    Live events arrive one at a time through :meth:`handle`; the replay
+    tool passes whole batches to :meth:`handle_batch`.
+
+    Like the metric counters this is best-effort; ``python -m
+    app.replay_events funnel --rebuild`` rebuilds the projection from
+    event_log.
+
+    Live, every step start is published, so a finished step has always
+    been counted as entered.  With ``track_entries`` (used when replaying
+    history from the beginning) the handler remembers which starts it has
+    seen, so steps whose start predates ``WorkflowStepStarted`` are counted
+    as entered when they finish.
+    """
+
+    event_types = (WorkflowStepStarted, WorkflowStepCompleted, WorkflowStepSkipped)
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncSession],
+        track_entries: bool = False,
+    ) -> None:
+        self._session_factory = session_factory
+        self._started: set[tuple[UUID, str]] | None = (
+            set() if track_entries else None
+        )
+
+    async def handle(self, event: StepEvent) -> None:
+        try:
+            await self.handle_batch([event])
+        except Exception as e:
+            logger.error(
+                f"Failed to update step funnel for {event.step_id} "
+                f"(workflow_instance_id={event.workflow_instance_id}): {e}"
+            )
+
+    async def handle_batch(self, events: list[StepEvent]) -> None:
+        """Apply *events*, in order, in one transaction.
+
+        Offline flags and step roles are read once for the whole batch, and
+        each funnel cell is upserted once.
+        """
+        if not events:
+            return
+        instance_ids = list({event.workflow_instance_id for event in events})
+        async with self._session_factory() as session:
+            repo = AnalyticsRepository(session)
+            offline = await repo.get_offline_flags(instance_ids)
+            roles: dict[tuple[UUID, str], str | None] = {}
+            if any(event.assigned_role is None for event in events):
+                # Events logged before the role was carried on them.
+                roles = await repo.get_step_roles(instance_ids)
+
+            cells: dict[tuple, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+            for event in events:
+                event_type = type(event).__name__
+                step_key = (event.workflow_instance_id, event.step_id)
+                entry_counted = True
+                if self._started is not None:
+                    entry_counted = step_key in self._started
+                    if event_type == STEP_STARTED:
+                        self._started.add(step_key)
+
+                week, increments = funnel_increments(
+                    event_type,
+                    event.timestamp,
+                    event.started_at,
+                    entry_counted=entry_counted,
+                )
+                cell = (
+                    week,
+                    event.step_id,
+                    event.assigned_role or roles.get(step_key),
+                    channel(offline.get(event.workflow_instance_id)),
+                )
+                for name, value in increments.items():
+                    cells[cell][name] += value
+
+            for (week, step_id, role, chan), increments in cells.items():
+                await repo.add_funnel_counts(
+                    week_start=week,
+                    step_id=step_id,
+                    assigned_role=role,
+                    channel=chan,
+                    **increments,
+                )
+            await session.commit()
+
+
+def setup_funnel_handlers(
+    session_factory: Callable[..., AsyncSession],
+    bus: EventBus = event_bus,
+    track_entries: bool = False,
+) -> None:
+    """Subscribe the funnel handler to step start, completion and skip events."""
+    handler = FunnelHandler(session_factory, track_entries=track_entries)
+
+    for event_type in FunnelHandler.event_types:
+        bus.subscribe(event_type, handler.handle)
+
+    logger.info("Funnel handlers registered")
@@ -0,0 +1,74 @@
+import logging
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.client_events import CaseStatusChanged
+from app.domain.events.event_bus import event_bus
+from app.domain.events.workflow_events import WorkflowCompleted, WorkflowSubmitted
+from app.infrastructure.repositories.metrics_repo import (
+    CASES_BY_STATUS,
+    COMPLETED_WORKFLOWS,
+    CYCLE_TIME_SECONDS,
+    SUBMISSIONS_BY_DAY,
+    MetricsRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsHandler:
+    """Keeps the metric_counters aggregates in step with domain events.
+
+    Counters are best-effort: an event whose transaction later rolls back
+    still counts, so the reconciliation job periodically recomputes them.
+    """
+
+    def __init__(self, session_factory: Callable[..., AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def handle_status_changed(self, event: CaseStatusChanged) -> None:
+        increments = [(CASES_BY_STATUS, event.new_status, 1)]
+        if event.previous_status:
+            increments.append((CASES_BY_STATUS, event.previous_status, -1))
+        await self._apply(event, increments)
+
+    async def handle_workflow_completed(self, event: WorkflowCompleted) -> None:
+        # Cycle time only covers workflows with both timestamps.
+        if event.started_at is None:
+            return
+        seconds = int((event.completed_at - event.started_at).total_seconds())
+        await self._apply(
+            event,
+            [(COMPLETED_WORKFLOWS, "", 1), (CYCLE_TIME_SECONDS, "", seconds)],
+        )
+
+    async def handle_workflow_submitted(self, event: WorkflowSubmitted) -> None:
+        day = MetricsRepository.day_key(event.timestamp)
+        await self._apply(event, [(SUBMISSIONS_BY_DAY, day, 1)])
+
+    async def _apply(
+        self, event: DomainEvent, increments: list[tuple[str, str, int]]
+    ) -> None:
+        try:
+            async with self._session_factory() as session:
+                repo = MetricsRepository(session)
+                for name, dimension, delta in increments:
+                    await repo.increment(name, dimension, delta)
+                await session.commit()
+        except Exception as e:
+            logger.error(
+                f"Failed to update metrics for event {type(event).__name__}: {e}"
+            )
+
+
+def setup_metrics_handlers(session_factory: Callable[..., AsyncSession]) -> None:
+    """Subscribe the metrics handler to the events that move dashboard counters."""
+    handler = MetricsHandler(session_factory)
+
+    event_bus.subscribe(CaseStatusChanged, handler.handle_status_changed)
+    event_bus.subscribe(WorkflowCompleted, handler.handle_workflow_completed)
+    event_bus.subscribe(WorkflowSubmitted, handler.handle_workflow_submitted)
+
+    logger.info("Metrics handlers registered")
@@ -5,10 +5,12 @@ from app.domain.events.client_events import (
     GroupSetupStarted,
     InvitationSent,
     OfflinePacketSubmitted,
+    SlaBreached,
 )
 from app.domain.events.workflow_events import (
     EnrollmentTransitionInitiated,
     MasterAppSigned,
+    StepStuck,
     WorkflowHandoffRequested,
     WorkflowSubmitted,
 )
@@ -78,6 +80,19 @@ class NotificationHandler:
             f"(group_number={event.group_number})"
         )
 
+    async def handle_sla_breached(self, event: SlaBreached) -> None:
+        logger.info(
+            f"SLA {event.severity} for client {event.client_id} "
+            f"(days_stale={event.days_stale})"
+        )
+
+    async def handle_step_stuck(self, event: StepStuck) -> None:
+        logger.info(
+            f"Step {event.step_id} stuck for client {event.client_id} "
+            f"(workflow_instance_id={event.workflow_instance_id}, "
+            f"days_stuck={event.days_stuck})"
+        )
+
     async def handle_workflow_submitted(self, event: WorkflowSubmitted) -> None:
         renewal = event.servicing_payload.get("renewal_notification_period")
         billing = event.servicing_payload.get("billing")
@@ -107,5 +122,7 @@ def setup_notification_handlers() -> None:
     event_bus.subscribe(WorkflowHandoffRequested, handler.handle_handoff_requested)
     event_bus.subscribe(MasterAppSigned, handler.handle_master_app_signed)
     event_bus.subscribe(EnrollmentTransitionInitiated, handler.handle_enrollment_transition)
+    event_bus.subscribe(SlaBreached, handler.handle_sla_breached)
+    event_bus.subscribe(StepStuck, handler.handle_step_stuck)
 
     logger.info("Notification handlers registered")
@@ -0,0 +1,122 @@
+import logging
+from collections import Counter
+from datetime import date
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.analytics.duration_sketch import bucket_index
+from app.domain.analytics.step_timing import employee_bucket, week_start
+from app.domain.events.event_bus import EventBus, event_bus
+from app.domain.events.workflow_events import (
+    WorkflowStepCompleted,
+    WorkflowStepSkipped,
+)
+from app.infrastructure.repositories.analytics_repo import AnalyticsRepository
+
+logger = logging.getLogger(__name__)
+
+FinishedStepEvent = WorkflowStepCompleted | WorkflowStepSkipped
+
+
+class StepTimingHandler:
+    """Records finished steps into step_timings and the duration sketches.
+
+    Live events arrive one at a time; the replay tool passes whole batches
+    to :meth:`handle_batch`.
+    """
+
+    event_types = (WorkflowStepCompleted, WorkflowStepSkipped)
+
+    def __init__(self, session_factory: Callable[..., AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def handle(self, event: FinishedStepEvent) -> None:
+        try:
+            await self.handle_batch([event])
+        except Exception as e:
+            logger.error(
+                f"Failed to record step timing for {event.step_id} "
+                f"(workflow_instance_id={event.workflow_instance_id}): {e}"
+            )
+
+    async def handle_batch(self, events: list[FinishedStepEvent]) -> None:
+        """Record *events* in one transaction.
+
+        Client sizes are read once for the batch, the fact rows are
+        inserted in one statement, and each sketch bucket is upserted once.
+        """
+        # A step finishes once; keep the first event for each.
+        first: dict[tuple, FinishedStepEvent] = {}
+        for event in events:
+            first.setdefault((event.workflow_instance_id, event.step_id), event)
+        if not first:
+            return
+
+        async with self._session_factory() as session:
+            repo = AnalyticsRepository(session)
+            employees = await repo.get_eligible_employees_by_client(
+                list({event.client_id for event in first.values()})
+            )
+            rows = []
+            durations: dict[tuple, tuple[float | None, str]] = {}
+            for key, event in first.items():
+                duration = _duration(event)
+                bucket = employee_bucket(employees.get(event.client_id))
+                durations[key] = (duration, bucket)
+                rows.append({
+                    "workflow_instance_id": event.workflow_instance_id,
+                    "client_id": event.client_id,
+                    "step_id": event.step_id,
+                    "outcome": (
+                        "COMPLETED"
+                        if isinstance(event, WorkflowStepCompleted)
+                        else "SKIPPED"
+                    ),
+                    "assigned_role": event.assigned_role,
+                    "employee_bucket": bucket,
+                    "started_at": event.started_at,
+                    "finished_at": event.timestamp,
+                    "duration_seconds": duration,
+                })
+            inserted = await repo.record_step_timings(rows)
+
+            sketch: Counter[tuple[str, date, str, int]] = Counter()
+            for key in inserted:
+                duration, bucket = durations[key]
+                if duration is None:
+                    continue
+                event = first[key]
+                sketch[(
+                    event.step_id,
+                    week_start(event.timestamp),
+                    bucket,
+                    bucket_index(duration),
+                )] += 1
+            for (step_id, week, bucket, index), count in sketch.items():
+                await repo.add_to_sketch(
+                    step_id=step_id,
+                    week_start=week,
+                    employee_bucket=bucket,
+                    bucket_index=index,
+                    count=count,
+                )
+            await session.commit()
+
+
+def _duration(event: FinishedStepEvent) -> float | None:
+    if event.started_at is None:
+        return None
+    return max((event.timestamp - event.started_at).total_seconds(), 0.0)
+
+
+def setup_step_timing_handlers(
+    session_factory: Callable[..., AsyncSession], bus: EventBus = event_bus
+) -> None:
+    """Subscribe the step timing handler to step completion events."""
+    handler = StepTimingHandler(session_factory)
+
+    for event_type in StepTimingHandler.event_types:
+        bus.subscribe(event_type, handler.handle)
+
+    logger.info("Step timing handlers registered")
@@ -0,0 +1,19 @@
+"""Lookup of domain event classes by the ``event_type`` stored in event_log."""
+
+from app.domain.events import client_events, workflow_events
+from app.domain.events.base import DomainEvent
+
+EVENT_TYPES: dict[str, type[DomainEvent]] = {
+    cls.__name__: cls
+    for module in (client_events, workflow_events)
+    for cls in vars(module).values()
+    if isinstance(cls, type) and issubclass(cls, DomainEvent) and cls is not DomainEvent
+}
+
+
+def rehydrate(event_type: str, payload: dict) -> DomainEvent | None:
+    """Rebuild a logged event, or ``None`` if *event_type* is unknown."""
+    cls = EVENT_TYPES.get(event_type)
+    if cls is None:
+        return None
+    return cls.model_validate(payload)
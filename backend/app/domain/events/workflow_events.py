@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 
 from .base import DomainEvent
@@ -6,21 +7,37 @@ from .base import DomainEvent
 class WorkflowStepStarted(DomainEvent):
     workflow_instance_id: UUID
     step_id: str
+    started_at: datetime | None = None
+    assigned_role: str | None = None
 
 
 class WorkflowStepCompleted(DomainEvent):
     workflow_instance_id: UUID
     step_id: str
+    started_at: datetime | None = None
+    assigned_role: str | None = None
+
+
+class WorkflowCompleted(DomainEvent):
+    workflow_instance_id: UUID
+    started_at: datetime | None = None
+    completed_at: datetime
 
 
 class WorkflowStepSaved(DomainEvent):
     workflow_instance_id: UUID
     step_id: str
+    # RFC 6902 delta from the previous data (None if over the size cap) and
+    # the content hash of the data as saved.
+    patch: list[dict] | None = None
+    data_hash: str | None = None
 
 
 class WorkflowStepSkipped(DomainEvent):
     workflow_instance_id: UUID
     step_id: str
+    started_at: datetime | None = None
+    assigned_role: str | None = None
 
 
 class DocumentUploaded(DomainEvent):
@@ -60,3 +77,10 @@ class WorkflowHandoffRequested(DomainEvent):
     client_name: str
     next_step_name: str
     broker_name: str
+
+
+class StepStuck(DomainEvent):
+    client_id: UUID
+    workflow_instance_id: UUID
+    step_id: str
+    days_stuck: int
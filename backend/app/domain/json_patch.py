@@ -0,0 +1,142 @@
+"""Reversible JSON Patch (RFC 6902) deltas between JSON documents.
+
+:func:`diff` recurses into objects and treats any other changed value --
+including arrays -- as a single replacement.  Every ``remove`` and
+``replace`` is preceded by a ``test`` op carrying the old value, which is
+still a valid RFC 6902 patch but also lets :func:`invert` undo it.
+"""
+
+import copy
+import hashlib
+import json
+from typing import Any
+
+
+def content_hash(document: Any) -> str:
+    """SHA-256 of the canonical JSON encoding of *document*."""
+    encoded = json.dumps(
+        document, sort_keys=True, separators=(",", ":"), default=str
+    ).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def diff(old: Any, new: Any, path: str = "") -> list[dict]:
+    """Return the ops that turn *old* into *new*."""
+    if old == new:
+        return []
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return [
+            {"op": "test", "path": path, "value": old},
+            {"op": "replace", "path": path, "value": new},
+        ]
+
+    ops: list[dict] = []
+    for key in old:
+        child = f"{path}/{_escape(key)}"
+        if key not in new:
+            ops.append({"op": "test", "path": child, "value": old[key]})
+            ops.append({"op": "remove", "path": child})
+        else:
+            ops.extend(diff(old[key], new[key], child))
+    for key in new:
+        if key not in old:
+            ops.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": new[key]})
+    return ops
+
+
+def apply(document: Any, patch: list[dict]) -> Any:
+    """Return a copy of *document* with *patch* applied.
+
+    Raises ``ValueError`` if an op does not fit the document, including a
+    failed ``test``.
+    """
+    result = copy.deepcopy(document)
+    for op in patch:
+        result = _apply_op(result, op)
+    return result
+
+
+def invert(patch: list[dict]) -> list[dict]:
+    """Return the patch that undoes *patch* (as produced by :func:`diff`)."""
+    inverse: list[dict] = []
+    previous: dict[str, Any] = {}
+    for op in patch:
+        kind, path = op["op"], op["path"]
+        if kind == "test":
+            previous[path] = op["value"]
+        elif kind == "add":
+            inverse.append({"op": "remove", "path": path})
+        elif kind in ("remove", "replace"):
+            if path not in previous:
+                raise ValueError(f"'{kind}' at '{path}' has no preceding test")
+            undo = "add" if kind == "remove" else "replace"
+            inverse.append({"op": undo, "path": path, "value": previous.pop(path)})
+        else:
+            raise ValueError(f"Unsupported patch op '{kind}'")
+    inverse.reverse()
+    return inverse
+
+
+def _escape(key: str) -> str:
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def _apply_op(document: Any, op: dict) -> Any:
+    kind, path = op.get("op"), op.get("path", "")
+    if path == "":
+        if kind == "test":
+            if document != op["value"]:
+                raise ValueError("Patch test failed at document root")
+            return document
+        if kind in ("add", "replace"):
+            return copy.deepcopy(op["value"])
+        raise ValueError(f"Cannot '{kind}' the document root")
+
+    *parents, last = [_unescape(token) for token in path.split("/")[1:]]
+    container = document
+    for token in parents:
+        container = _child(container, token, path)
+    if isinstance(container, list):
+        index = len(container) if last == "-" else _index(last, path)
+    elif isinstance(container, dict):
+        index = last
+    else:
+        raise ValueError(f"Patch path '{path}' does not exist")
+
+    if kind == "test":
+        if _child(container, last, path) != op["value"]:
+            raise ValueError(f"Patch test failed at '{path}'")
+    elif kind == "add":
+        value = copy.deepcopy(op["value"])
+        if isinstance(container, list):
+            container.insert(index, value)
+        else:
+            container[index] = value
+    elif kind == "remove":
+        _child(container, last, path)
+        del container[index]
+    elif kind == "replace":
+        _child(container, last, path)
+        container[index] = copy.deepcopy(op["value"])
+    else:
+        raise ValueError(f"Unsupported patch op '{kind}'")
+    return document
+
+
+def _child(container: Any, token: str, path: str) -> Any:
+    try:
+        if isinstance(container, list):
+            return container[_index(token, path)]
+        return container[token]
+    except (KeyError, IndexError, TypeError):
+        raise ValueError(f"Patch path '{path}' does not exist")
+
+
+def _index(token: str, path: str) -> int:
+    if not token.isdigit():
+        raise ValueError(f"Invalid array index in patch path '{path}'")
+    return int(token)
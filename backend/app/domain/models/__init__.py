@@ -30,6 +30,7 @@ from app.domain.models.workflow import (
 from app.domain.models.document import (
     Document,
     DocumentListResponse,
+    DocumentProcessingStatus,
     DocumentType,
     DocumentUpload,
 )
@@ -70,6 +71,7 @@ __all__ = [
     # Document
     "Document",
     "DocumentListResponse",
+    "DocumentProcessingStatus",
     "DocumentType",
     "DocumentUpload",
     # Licensing
@@ -0,0 +1,114 @@
+"""Domain models for the admin dashboard and SLA alerting."""
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class SlaAlert(BaseModel):
+    client_id: str
+    client_name: str
+    status: str
+    days_stale: int
+    severity: str  # "warning" | "critical"
+
+
+class SlaAlertsResponse(BaseModel):
+    alerts: list[SlaAlert]
+    total: int
+    page: int = 1
+    per_page: int = 0
+
+
+class StuckStep(BaseModel):
+    client_id: str
+    client_name: str
+    step_id: str
+    days_stuck: int
+
+
+class StuckStepsResponse(BaseModel):
+    steps: list[StuckStep]
+    total: int
+    page: int
+    per_page: int
+    by_step: dict[str, int]
+
+
+class DashboardMetrics(BaseModel):
+    total_cases: int
+    by_status: dict[str, int]
+    stuck_steps: list[StuckStep]
+    stuck_steps_total: int = 0
+    stale_cases: list[SlaAlert]
+    stale_cases_total: int = 0
+    avg_cycle_time_days: float | None = None
+    submissions_last_7_days: int
+    submissions_last_30_days: int
+
+
+class FileCacheStats(BaseModel):
+    enabled: bool
+    hits: int = 0
+    misses: int = 0
+    hit_ratio: float = 0.0
+    evictions: int = 0
+    entries: int = 0
+    bytes: int = 0
+    max_bytes: int = 0
+
+
+class StepDurationStats(BaseModel):
+    step_id: str
+    week_start: date | None = None
+    count: int
+    p50_seconds: float | None = None
+    p90_seconds: float | None = None
+    p99_seconds: float | None = None
+
+
+class StepDurationReport(BaseModel):
+    since_week: date
+    employee_bucket: str | None = None
+    steps: list[StepDurationStats]
+    weekly: list[StepDurationStats]
+
+
+class FunnelStepStats(BaseModel):
+    step_id: str
+    week_start: date | None = None
+    assigned_role: str | None = None
+    channel: str | None = None
+    entered: int = 0
+    completed: int = 0
+    skipped: int = 0
+    in_progress: int = 0
+    abandoned: int = 0
+
+
+class FunnelReport(BaseModel):
+    since_week: date
+    channel: str | None = None
+    assigned_role: str | None = None
+    steps: list[FunnelStepStats]
+    by_role_and_channel: list[FunnelStepStats]
+    weekly: list[FunnelStepStats]
+
+
+class ActivityBucket(BaseModel):
+    start: date
+    count: int
+
+
+class ActivitySeries(BaseModel):
+    category: str
+    event_types: list[str]
+    total: int
+    buckets: list[ActivityBucket]
+
+
+class ActivityHistogram(BaseModel):
+    interval: str
+    since: date
+    until: date
+    series: list[ActivitySeries]
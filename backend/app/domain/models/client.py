@@ -60,6 +60,18 @@ class ClientListParams(BaseModel):
     sort_order: Literal["asc", "desc"] = "desc"
 
 
+class ClientExportParams(BaseModel):
+    """The ``ClientListParams`` filters and sort, without pagination."""
+
+    search: str | None = None
+    status: ClientStatus | None = None
+    assigned_to_user_id: UUID | None = None
+    stale: bool | None = None
+    stale_threshold_days: int = 7
+    sort_by: str = "client_name"
+    sort_order: Literal["asc", "desc"] = "asc"
+
+
 # --- Story 4: Case Readiness ---
 
 class ReadinessBlocker(BaseModel):
@@ -107,13 +119,45 @@ class TimelineEvent(BaseModel):
             "MasterAppSigned": ("Master Application signed by {accepted_by}", "draw"),
             "EnrollmentTransitionInitiated": ("Enrollment transition initiated (group: {group_number})", "swap_horiz"),
             "WorkflowHandoffRequested": ("Workflow handed off to {target_role} ({target_email})", "forward_to_inbox"),
+            "SlaBreached": ("Case stale for {days_stale} days ({severity})", "schedule"),
+            "StepStuck": ("Workflow step stuck for {days_stuck} days: {step_id}", "hourglass_empty"),
         }
 
+    @staticmethod
+    def compacted_descriptions() -> dict[str, tuple[str, str]]:
+        """Templates for rows that summarise a run of events (``save_count``)."""
+        return {
+            "WorkflowStepSaved": (
+                "Workflow step saved {save_count} times: {step_id}", "save"
+            ),
+        }
+
+    @staticmethod
+    def render(event_type: str, payload: dict) -> tuple[str, str]:
+        """Return the ``(description, icon)`` shown for an event.
+
+        Rendered when the event is written to event_log, and again when
+        compaction merges a run of events into one row; fields missing
+        from *payload* fall back to the template's static prefix.
+        """
+        templates = TimelineEvent.event_descriptions()
+        if payload.get("save_count"):
+            templates = {**templates, **TimelineEvent.compacted_descriptions()}
+        desc_template, icon = templates.get(
+            event_type, ("{event_type} occurred", "event")
+        )
+        try:
+            description = desc_template.format(event_type=event_type, **payload)
+        except (KeyError, IndexError):
+            description = desc_template.split("{")[0].strip() or event_type
+        return description, icon
+
 
 class TimelineResponse(BaseModel):
     client_id: UUID
     events: list[TimelineEvent]
-    total: int
+    total: int | None = None
+    next_cursor: str | None = None
 
 
 # --- Diagnostics ---
@@ -15,6 +15,13 @@ class DocumentType(str, Enum):
     HIPAA_AUTHORIZATION = "HIPAA_AUTHORIZATION"
 
 
+class DocumentProcessingStatus(str, Enum):
+    PENDING = "PENDING"
+    PROCESSING = "PROCESSING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
 class Document(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -29,6 +36,12 @@ class Document(BaseModel):
     mime_type: str | None = None
     uploaded_by_user_id: UUID | None = None
     uploaded_at: datetime | None = None
+    processing_status: DocumentProcessingStatus = DocumentProcessingStatus.PENDING
+    content_sha256: str | None = None
+    sniffed_mime_type: str | None = None
+    page_count: int | None = None
+    text_length: int | None = None
+    processed_at: datetime | None = None
 
 
 class DocumentUpload(BaseModel):
@@ -1,5 +1,6 @@
 """Domain models for the offline packet lifecycle."""
 
+from datetime import datetime
 from enum import Enum
 
 from pydantic import BaseModel
@@ -38,3 +39,11 @@ class OfflinePacketStatusResponse(BaseModel):
     is_complete: bool
     files: list[RequiredFileStatus]
     missing_required: list[str]
+
+
+class TemplatePrefill(BaseModel):
+    """Client details stamped onto a prefilled offline template."""
+
+    unique_id: str
+    updated_at: datetime
+    lines: list[str]
@@ -90,3 +90,20 @@ class WorkflowInstanceResponse(BaseModel):
 
 class StepDataUpdate(BaseModel):
     data: dict
+
+
+class StepVersion(BaseModel):
+    """One logged save of a step, with its data when it can be rebuilt."""
+
+    saved_at: datetime
+    user_id: UUID | None = None
+    user_name: str | None = None
+    save_count: int = 1
+    data_hash: str | None = None
+    data: dict | None = None
+
+
+class StepHistory(BaseModel):
+    client_id: UUID
+    step_id: str
+    versions: list[StepVersion]
@@ -0,0 +1,107 @@
+"""Service layer for incremental SLA and stuck-step scanning."""
+
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.events.base import DomainEvent
+from app.domain.events.client_events import SlaBreached
+from app.domain.events.workflow_events import StepStuck
+from app.infrastructure.repositories.alert_repo import (
+    SLA,
+    STUCK_STEP,
+    AlertRepository,
+)
+
+SCANNER_NAME = "alert-scanner"
+
+
+class AlertScanService:
+    """Maintains the alerts table from client and step timestamps.
+
+    Each scan only looks at rows that crossed a threshold since the
+    previous scan: a client becomes stale when ``updated_at`` passes
+    ``now - SLA_WARNING_DAYS``, so the newly stale clients are exactly
+    those with ``updated_at`` between the previous and current cutoffs.
+    The first scan (no recorded state) covers everything.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.repo = AlertRepository(session)
+        self.session = session
+
+    async def scan(self, now: datetime) -> list[DomainEvent]:
+        """Update alerts and return events for new breaches and escalations."""
+        last_run = await self.repo.get_last_run(SCANNER_NAME)
+        events: list[DomainEvent] = []
+
+        await self.repo.resolve_recovered()
+
+        events.extend(await self._scan_sla(now, last_run))
+        events.extend(await self._scan_stuck_steps(now, last_run))
+
+        await self.repo.set_last_run(SCANNER_NAME, now)
+        return events
+
+    async def _scan_sla(
+        self, now: datetime, last_run: datetime | None
+    ) -> list[DomainEvent]:
+        warning = timedelta(days=settings.SLA_WARNING_DAYS)
+        critical = timedelta(days=settings.SLA_CRITICAL_DAYS)
+
+        # client_id -> updated_at for clients crossing either threshold
+        # since the last run; severity follows from updated_at alone.
+        crossed: dict[UUID, datetime] = {}
+        for threshold in (warning, critical):
+            lower = last_run - threshold if last_run else None
+            for row in await self.repo.clients_stale_between(lower, now - threshold):
+                crossed[row.id] = row.updated_at
+
+        events: list[DomainEvent] = []
+        for client_id, updated_at in crossed.items():
+            severity = "critical" if updated_at <= now - critical else "warning"
+            opened = await self.repo.open_alert(
+                SLA,
+                subject_id=client_id,
+                client_id=client_id,
+                severity=severity,
+                reference_at=updated_at,
+            )
+            if opened:
+                events.append(
+                    SlaBreached(
+                        client_id=client_id,
+                        severity=severity,
+                        days_stale=(now - updated_at).days,
+                    )
+                )
+        return events
+
+    async def _scan_stuck_steps(
+        self, now: datetime, last_run: datetime | None
+    ) -> list[DomainEvent]:
+        threshold = timedelta(days=settings.STUCK_STEP_THRESHOLD_DAYS)
+        lower = last_run - threshold if last_run else None
+
+        events: list[DomainEvent] = []
+        for row in await self.repo.steps_started_between(lower, now - threshold):
+            opened = await self.repo.open_alert(
+                STUCK_STEP,
+                subject_id=row.id,
+                client_id=row.client_id,
+                severity="warning",
+                reference_at=row.started_at,
+                step_id=row.step_id,
+            )
+            if opened:
+                events.append(
+                    StepStuck(
+                        client_id=row.client_id,
+                        workflow_instance_id=row.workflow_instance_id,
+                        step_id=row.step_id,
+                        days_stuck=(now - row.started_at).days,
+                    )
+                )
+        return events
@@ -0,0 +1,221 @@
+"""Service layer for workflow step analytics."""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.analytics.activity import (
+    ACTIVITY_CATEGORIES,
+    bucket_start,
+    bucket_starts,
+)
+from app.domain.analytics.duration_sketch import DurationSketch
+from app.domain.analytics.funnel import is_settled
+from app.domain.analytics.step_timing import week_start
+from app.domain.models.admin import (
+    ActivityBucket,
+    ActivityHistogram,
+    ActivitySeries,
+    FunnelReport,
+    FunnelStepStats,
+    StepDurationReport,
+    StepDurationStats,
+)
+from app.infrastructure.repositories.analytics_repo import AnalyticsRepository
+from app.infrastructure.repositories.metrics_repo import MetricsRepository
+from app.infrastructure.repositories.workflow_repo import WorkflowRepository
+
+
+class AnalyticsService:
+    """Reports step analytics from pre-aggregated tables.
+
+    Duration percentiles come from the sketches and are within the
+    sketch's relative accuracy (1%) of the exact values; the funnel comes
+    from the step_funnel_counts projection and activity histograms from
+    the event_daily_counts rollup.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.repo = AnalyticsRepository(session)
+        self.metrics_repo = MetricsRepository(session)
+        self.workflow_repo = WorkflowRepository(session)
+        self.session = session
+
+    async def get_step_durations(
+        self,
+        weeks: int = 12,
+        step_id: str | None = None,
+        employee_bucket: str | None = None,
+    ) -> StepDurationReport:
+        """Return p50/p90/p99 per step over the window and per step per week."""
+        since = week_start(datetime.now(timezone.utc)) - timedelta(weeks=weeks - 1)
+        rows = await self.repo.get_sketch_buckets(
+            since, step_id=step_id, employee_bucket=employee_bucket
+        )
+
+        weekly_sketches: dict[tuple[str, date], DurationSketch] = {}
+        step_sketches: dict[str, DurationSketch] = {}
+        for row in rows:
+            for sketches, key in (
+                (weekly_sketches, (row.step_id, row.week_start)),
+                (step_sketches, row.step_id),
+            ):
+                sketch = sketches.setdefault(key, DurationSketch())
+                sketch.buckets[row.bucket_index] = (
+                    sketch.buckets.get(row.bucket_index, 0) + row.count
+                )
+
+        return StepDurationReport(
+            since_week=since,
+            employee_bucket=employee_bucket,
+            steps=[
+                _stats(sketch, key)
+                for key, sketch in sorted(step_sketches.items())
+            ],
+            weekly=[
+                _stats(sketch, key[0], key[1])
+                for key, sketch in sorted(weekly_sketches.items())
+            ],
+        )
+
+    async def get_funnel(
+        self,
+        weeks: int = 12,
+        channel: str | None = None,
+        assigned_role: str | None = None,
+    ) -> FunnelReport:
+        """Return per-step entered/completed/skipped/abandoned counts.
+
+        Counts belong to the week a step was entered.  Steps still open are
+        ``in_progress`` until their week is older than the stuck-step
+        threshold, then ``abandoned``.  Steps are listed in workflow order.
+        """
+        today = datetime.now(timezone.utc).date()
+        since = week_start(datetime.now(timezone.utc)) - timedelta(weeks=weeks - 1)
+        rows = await self.repo.get_funnel_rows(
+            since, channel=channel, assigned_role=assigned_role
+        )
+
+        steps: dict[str, FunnelStepStats] = {}
+        breakdown: dict[tuple[str, str, str], FunnelStepStats] = {}
+        weekly: dict[tuple[str, date], FunnelStepStats] = {}
+        for row in rows:
+            open_steps = max(row.entered - row.completed - row.skipped, 0)
+            settled = is_settled(
+                row.week_start, today, settings.STUCK_STEP_THRESHOLD_DAYS
+            )
+            for target in (
+                steps.setdefault(row.step_id, FunnelStepStats(step_id=row.step_id)),
+                breakdown.setdefault(
+                    (row.step_id, row.assigned_role, row.channel),
+                    FunnelStepStats(
+                        step_id=row.step_id,
+                        assigned_role=row.assigned_role or None,
+                        channel=row.channel,
+                    ),
+                ),
+                weekly.setdefault(
+                    (row.step_id, row.week_start),
+                    FunnelStepStats(step_id=row.step_id, week_start=row.week_start),
+                ),
+            ):
+                target.entered += row.entered
+                target.completed += row.completed
+                target.skipped += row.skipped
+                if settled:
+                    target.abandoned += open_steps
+                else:
+                    target.in_progress += open_steps
+
+        order = await self._step_order()
+
+        def position(step_id: str) -> int:
+            return order.get(step_id, len(order))
+
+        return FunnelReport(
+            since_week=since,
+            channel=channel,
+            assigned_role=assigned_role,
+            steps=[
+                steps.get(step_id, FunnelStepStats(step_id=step_id))
+                for step_id in sorted(
+                    {*order, *steps}, key=lambda s: (position(s), s)
+                )
+            ],
+            by_role_and_channel=sorted(
+                breakdown.values(),
+                key=lambda s: (position(s.step_id), s.assigned_role or "", s.channel),
+            ),
+            weekly=sorted(
+                weekly.values(), key=lambda s: (position(s.step_id), s.week_start)
+            ),
+        )
+
+    async def get_activity_histogram(
+        self, interval: str = "day", periods: int = 30
+    ) -> ActivityHistogram:
+        """Return per-day or per-week counts of key case activity.
+
+        Each series sums the event types of one ``ACTIVITY_CATEGORIES``
+        entry; buckets with no events are included with a zero count.
+        """
+        today = datetime.now(timezone.utc).date()
+        starts = bucket_starts(today, interval, periods)
+        event_types = [t for types in ACTIVITY_CATEGORIES.values() for t in types]
+        rows = await self.metrics_repo.get_event_counts(starts[0], event_types)
+
+        counts: dict[tuple[str, date], int] = {}
+        for day, event_type, count in rows:
+            key = (event_type, bucket_start(day, interval))
+            counts[key] = counts.get(key, 0) + count
+
+        series = []
+        for category, types in ACTIVITY_CATEGORIES.items():
+            buckets = [
+                ActivityBucket(
+                    start=start,
+                    count=sum(counts.get((t, start), 0) for t in types),
+                )
+                for start in starts
+            ]
+            series.append(
+                ActivitySeries(
+                    category=category,
+                    event_types=list(types),
+                    total=sum(b.count for b in buckets),
+                    buckets=buckets,
+                )
+            )
+        return ActivityHistogram(
+            interval=interval, since=starts[0], until=today, series=series
+        )
+
+    async def _step_order(self) -> dict[str, int]:
+        definition = await self.workflow_repo.get_definition("group_setup")
+        if not definition:
+            return {}
+        steps_def = (
+            definition.steps
+            if isinstance(definition.steps, list)
+            else json.loads(definition.steps)
+        )
+        return {s["step_id"]: s["order"] for s in steps_def}
+
+
+def _stats(
+    sketch: DurationSketch, step_id: str, week: date | None = None
+) -> StepDurationStats:
+    def q(value: float) -> float | None:
+        result = sketch.quantile(value)
+        return round(result, 1) if result is not None else None
+
+    return StepDurationStats(
+        step_id=step_id,
+        week_start=week,
+        count=sketch.count,
+        p50_seconds=q(0.5),
+        p90_seconds=q(0.9),
+        p99_seconds=q(0.99),
+    )
@@ -0,0 +1,197 @@
+"""Service layer for exporting a complete case file as a ZIP archive."""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.models.document import Document
+from app.domain.services.client_service import ClientService
+from app.domain.services.workflow_service import WorkflowService
+from app.infrastructure.repositories.document_repo import DocumentRepository
+from app.infrastructure.storage.file_storage import FileStorage
+from app.infrastructure.storage.zip_stream import ZipStreamWriter
+
+logger = logging.getLogger(__name__)
+
+TIMELINE_PAGE_SIZE = 200
+
+
+@dataclass
+class CaseFileExport:
+    """Everything needed to stream a case file, gathered up front.
+
+    Only document metadata is held here; file contents are pulled from
+    storage while the archive is being streamed.
+    """
+
+    client_id: UUID
+    archive_name: str
+    documents: list[Document]
+    servicing_payload: dict | None = None
+    payload_is_final: bool = False
+    timeline: list[dict] = field(default_factory=list)
+
+
+class CaseExportService:
+    """Builds streaming ZIP exports of a client's documents and history."""
+
+    def __init__(self, session: AsyncSession, storage: FileStorage) -> None:
+        self.doc_repo = DocumentRepository(session)
+        self.client_service = ClientService(session)
+        self.workflow_service = WorkflowService(session)
+        self.storage = storage
+        self.session = session
+
+    async def prepare(
+        self, client_id: UUID, workflow_instance_id: UUID | None = None
+    ) -> CaseFileExport:
+        """Load all database-backed content for the export.
+
+        Everything that needs the session is done here so the archive can
+        be streamed after the request's session has been released.
+
+        Raises ``ValueError`` if the client does not exist.
+        """
+        client = await self.client_service.get_client(client_id)
+        if not client:
+            raise ValueError("Client not found")
+
+        if workflow_instance_id:
+            docs = await self.doc_repo.list_by_workflow_instance(workflow_instance_id)
+            docs = [d for d in docs if d.client_id == client_id]
+        else:
+            docs = await self.doc_repo.list_by_client(client_id)
+        documents = [Document.model_validate(d) for d in docs]
+
+        payload_is_final = True
+        try:
+            payload = await self.workflow_service.get_submission_payload(client_id)
+        except ValueError:
+            payload_is_final = False
+            payload = await self.workflow_service.get_payload_preview(client_id)
+
+        timeline: list[dict] = []
+        cursor = None
+        while True:
+            page = await self.client_service.get_timeline(
+                client_id,
+                limit=TIMELINE_PAGE_SIZE,
+                before=cursor,
+                include_total=False,
+            )
+            timeline.extend(e.model_dump(mode="json") for e in page.events)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        return CaseFileExport(
+            client_id=client_id,
+            archive_name=f"{client.unique_id}_case_file.zip",
+            documents=documents,
+            servicing_payload=payload,
+            payload_is_final=payload_is_final,
+            timeline=timeline,
+        )
+
+    async def stream(self, export: CaseFileExport) -> AsyncIterator[bytes]:
+        """Yield the ZIP archive incrementally.
+
+        Document contents are fetched from storage at most
+        ``EXPORT_FETCH_CONCURRENCY`` at a time, ahead of the writer, and
+        written in upload order.  Files missing from storage are listed in
+        ``manifest.json`` instead of failing the whole export.
+        """
+        writer = ZipStreamWriter()
+        included: list[dict] = []
+        missing: list[dict] = []
+
+        if export.servicing_payload is not None:
+            name = (
+                "servicing_payload.json"
+                if export.payload_is_final
+                else "servicing_payload_draft.json"
+            )
+            for chunk in writer.write_entry(name, _json_bytes(export.servicing_payload)):
+                yield chunk
+
+        for chunk in writer.write_entry("timeline.json", _json_bytes(export.timeline)):
+            yield chunk
+
+        async for doc, content in self._fetch_documents(export.documents):
+            entry = {
+                "document_id": str(doc.id),
+                "file_type": doc.file_type.value,
+                "file_name": doc.file_name,
+            }
+            if content is None:
+                missing.append(entry)
+                continue
+            member = _member_name(doc)
+            included.append({**entry, "archive_path": member})
+            for chunk in writer.write_entry(member, content, compress=False):
+                yield chunk
+
+        manifest = {
+            "client_id": str(export.client_id),
+            "documents": included,
+            "missing_documents": missing,
+            "servicing_payload_final": export.payload_is_final,
+            "timeline_events": len(export.timeline),
+        }
+        for chunk in writer.write_entry("manifest.json", _json_bytes(manifest)):
+            yield chunk
+
+        yield writer.close()
+
+    async def _fetch_documents(
+        self, documents: list[Document]
+    ) -> AsyncIterator[tuple[Document, bytes | None]]:
+        """Prefetch document contents with bounded concurrency, in order."""
+        concurrency = max(1, settings.EXPORT_FETCH_CONCURRENCY)
+        remaining = iter(documents)
+        pending: deque[tuple[Document, asyncio.Task]] = deque()
+
+        def schedule_next() -> None:
+            doc = next(remaining, None)
+            if doc is not None:
+                pending.append((doc, asyncio.create_task(self.storage.get(doc.file_path))))
+
+        for _ in range(concurrency):
+            schedule_next()
+
+        try:
+            while pending:
+                doc, task = pending.popleft()
+                try:
+                    content = await task
+                except (FileNotFoundError, OSError) as e:
+                    logger.warning(f"Case export skipped document {doc.id}: {e}")
+                    content = None
+                schedule_next()
+                yield doc, content
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+
+def _member_name(doc: Document) -> str:
+    """Archive path for *doc*: never outside its folder, unique per document.
+
+    ``file_name`` is user supplied, so only its last path component is kept
+    (with ``..`` and separators removed), and the document id prefix keeps
+    two uploads with the same name apart.
+    """
+    base = doc.file_name.replace("\\", "/").rsplit("/", 1)[-1]
+    base = base.replace("..", "").strip(". ") or "document"
+    return f"documents/{doc.file_type.value}/{doc.id}_{base}"
+
+
+def _json_bytes(data: object) -> bytes:
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
@@ -0,0 +1,73 @@
+"""Service layer for exporting the case list as CSV or Parquet."""
+
+from collections.abc import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.models.client import ClientExportParams
+from app.infrastructure.repositories.client_repo import ClientRepository
+from app.infrastructure.storage.table_stream import (
+    Column,
+    ColumnType,
+    CsvStreamWriter,
+    ParquetStreamWriter,
+)
+
+# Must match the columns selected by ClientRepository.stream_export_rows.
+EXPORT_COLUMNS: list[Column] = [
+    ("id", ColumnType.STRING),
+    ("unique_id", ColumnType.STRING),
+    ("client_name", ColumnType.STRING),
+    ("status", ColumnType.STRING),
+    ("group_id", ColumnType.STRING),
+    ("eligible_employees", ColumnType.INTEGER),
+    ("primary_address_city", ColumnType.STRING),
+    ("primary_address_state", ColumnType.STRING),
+    ("created_at", ColumnType.TIMESTAMP),
+    ("updated_at", ColumnType.TIMESTAMP),
+    ("days_since_update", ColumnType.INTEGER),
+    ("is_stale", ColumnType.BOOLEAN),
+    ("is_offline", ColumnType.BOOLEAN),
+    ("owner_name", ColumnType.STRING),
+    ("owner_email", ColumnType.STRING),
+]
+
+WRITERS = {
+    "csv": CsvStreamWriter,
+    "parquet": ParquetStreamWriter,
+}
+
+
+class ClientExportService:
+    """Streams every client matching the case-list filters in one response."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.repo = ClientRepository(session)
+        self.session = session
+
+    async def stream(
+        self, params: ClientExportParams, export_format: str = "csv"
+    ) -> AsyncIterator[bytes]:
+        """Yield the export file batch by batch.
+
+        The caller must keep the session open until iteration finishes;
+        rows come from a server-side cursor.
+        """
+        writer = WRITERS[export_format](EXPORT_COLUMNS)
+        async for rows in self.repo.stream_export_rows(
+            search=params.search,
+            status=params.status,
+            assigned_to_user_id=params.assigned_to_user_id,
+            stale=params.stale,
+            stale_threshold_days=params.stale_threshold_days,
+            sort_by=params.sort_by,
+            sort_order=params.sort_order,
+            batch_size=settings.CLIENT_EXPORT_BATCH_SIZE,
+        ):
+            chunk = writer.write_rows(rows)
+            if chunk:
+                yield chunk
+        chunk = writer.close()
+        if chunk:
+            yield chunk
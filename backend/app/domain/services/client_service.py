@@ -1,13 +1,18 @@
 """Service layer for Client business logic."""
 
-import json
+import base64
 import math
 from datetime import datetime, timezone
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.domain.events.client_events import CaseMarkedSold, CaseOwnerAssigned
+from app.domain.events.client_events import (
+    CaseMarkedSold,
+    CaseOwnerAssigned,
+    CaseStatusChanged,
+)
 from app.domain.events.event_bus import event_bus
 from app.domain.models.client import (
     CaseDiagnostics,
@@ -21,10 +26,16 @@ from app.domain.models.client import (
     TimelineEvent,
     TimelineResponse,
 )
+from app.infrastructure.database.fanout import fanout
+from app.infrastructure.database.models.client_orm import ClientORM
+from app.infrastructure.database.models.user_orm import UserORM
 from app.infrastructure.repositories.access_repo import AccessRepository
 from app.infrastructure.repositories.client_repo import ClientRepository
 from app.infrastructure.repositories.workflow_repo import WorkflowRepository
 
+# Roles that may own a case; owning one grants access to it.
+CASE_HANDLER_ROLES = ("BROKER", "GA", "TPA", "BROKER_TPA_GA_ADMIN")
+
 
 class ClientService:
     """Encapsulates all business operations on the Client aggregate."""
@@ -96,7 +107,9 @@ class ClientService:
         self, client_id: UUID, user_id: UUID | None = None
     ) -> Client | None:
         """Mark a case as sold, setting status to APPLICATION_NOT_STARTED."""
-        client = await self.repo.update_status(client_id, "APPLICATION_NOT_STARTED")
+        client = await self.change_status(
+            client_id, "APPLICATION_NOT_STARTED", user_id=user_id
+        )
         if client:
             await event_bus.publish(
                 CaseMarkedSold(client_id=client_id, user_id=user_id)
@@ -104,10 +117,43 @@ class ClientService:
             return Client.model_validate(client)
         return None
 
+    async def change_status(
+        self, client_id: UUID, status: str, user_id: UUID | None = None
+    ) -> ClientORM | None:
+        """Set a client's status, publishing ``CaseStatusChanged`` if it moved.
+
+        Returns the updated ``ClientORM`` or ``None`` if the client does not
+        exist.  All status transitions should go through here so derived
+        aggregates stay in step.
+        """
+        client, previous = await self.repo.change_status(client_id, status)
+        if client is not None and previous != status:
+            await event_bus.publish(
+                CaseStatusChanged(
+                    client_id=client_id,
+                    user_id=user_id,
+                    previous_status=previous,
+                    new_status=status,
+                )
+            )
+        return client
+
     async def assign_owner(
         self, client_id: UUID, user_id: UUID | None, acting_user_id: UUID | None = None
     ) -> Client | None:
-        """Assign an owner to a client case."""
+        """Assign an owner to a client case.
+
+        Raises ValueError if *user_id* is not an active case handler.
+        """
+        if user_id is not None:
+            result = await self.session.execute(
+                select(UserORM).where(UserORM.id == user_id)
+            )
+            owner = result.scalars().first()
+            if owner is None or not owner.is_active:
+                raise ValueError("User not found")
+            if owner.role not in CASE_HANDLER_ROLES:
+                raise ValueError("User cannot be assigned as case owner")
         client = await self.repo.assign_owner(client_id, user_id)
         if client:
             await event_bus.publish(
@@ -120,11 +166,42 @@ class ClientService:
             return Client.model_validate(client)
         return None
 
+    async def claim_owner(self, client_id: UUID, user_id: UUID) -> Client | None:
+        """Assign an unowned case to *user_id*.
+
+        Raises ValueError if another user already owns the case; returns
+        ``None`` if the client does not exist.
+        """
+        claimed = await self.repo.claim_owner(client_id, user_id)
+        client = await self.repo.get_by_id(client_id)
+        if client is None:
+            return None
+        if not claimed:
+            raise ValueError("Case is already assigned to another user")
+        await self.session.refresh(client)
+        await event_bus.publish(
+            CaseOwnerAssigned(
+                client_id=client_id,
+                assigned_to_user_id=user_id,
+                user_id=user_id,
+            )
+        )
+        return Client.model_validate(client)
+
     async def check_readiness(self, client_id: UUID) -> CaseReadiness:
-        """Pre-flight validation before allowing group setup to start."""
+        """Pre-flight validation before allowing group setup to start.
+
+        The client, access and workflow lookups run concurrently.
+        """
         blockers: list[ReadinessBlocker] = []
 
-        client = await self.repo.get_by_id(client_id)
+        client, access_entries, existing_workflow = await fanout(
+            lambda session: ClientRepository(session).get_by_id(client_id),
+            lambda session: AccessRepository(session).list_by_client(client_id),
+            lambda session: WorkflowRepository(session).get_instance_summary_by_client(
+                client_id
+            ),
+        )
         if not client:
             blockers.append(ReadinessBlocker(code="CLIENT_NOT_FOUND", message="Client not found"))
             return CaseReadiness(is_ready=False, blockers=blockers)
@@ -141,7 +218,6 @@ class ClientService:
                 message="At least one eligible employee must be recorded.",
             ))
 
-        access_entries = await self.access_repo.list_by_client(client_id)
         has_employer = any(a.role_type == "EMPLOYER" for a in access_entries)
         if not has_employer:
             blockers.append(ReadinessBlocker(
@@ -149,7 +225,6 @@ class ClientService:
                 message="At least one employer must be assigned before starting setup.",
             ))
 
-        existing_workflow = await self.workflow_repo.get_instance_by_client(client_id)
         if existing_workflow:
             blockers.append(ReadinessBlocker(
                 code="WORKFLOW_EXISTS",
@@ -160,58 +235,63 @@ class ClientService:
 
     async def get_timeline(
         self, client_id: UUID, limit: int = 50, offset: int = 0,
-        event_type: str | None = None,
+        event_type: str | None = None, before: str | None = None,
+        include_total: bool = True, step_id: str | None = None,
     ) -> TimelineResponse:
-        """Get chronological event history for a case."""
+        """Get chronological event history for a case.
+
+        *before* is the ``next_cursor`` of the previous page; raises
+        ``ValueError`` if it is malformed.
+        """
         rows, total = await self.repo.get_timeline_events(
-            client_id, limit, offset, event_type=event_type
+            client_id,
+            limit + 1,
+            offset,
+            event_type=event_type,
+            step_id=step_id,
+            before=decode_timeline_cursor(before) if before else None,
+            include_total=include_total,
         )
-        descriptions = TimelineEvent.event_descriptions()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
 
-        events: list[TimelineEvent] = []
-        for event_log, user_orm in rows:
-            desc_template, icon = descriptions.get(
-                event_log.event_type, ("{event_type} occurred", "event")
-            )
+        events = [_timeline_event(event_log, user_orm) for event_log, user_orm in rows]
 
-            payload = event_log.payload
-            if isinstance(payload, str):
-                try:
-                    payload = json.loads(payload)
-                except (json.JSONDecodeError, TypeError):
-                    payload = {}
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_timeline_cursor(
+                (events[-1].created_at, events[-1].id)
+            )
+        return TimelineResponse(
+            client_id=client_id, events=events, total=total, next_cursor=next_cursor
+        )
 
-            try:
-                description = desc_template.format(
-                    event_type=event_log.event_type, **payload
-                )
-            except (KeyError, IndexError):
-                description = desc_template.split("{")[0].strip() or event_log.event_type
-
-            user_name = None
-            if user_orm:
-                user_name = f"{user_orm.first_name} {user_orm.last_name}"
-
-            events.append(TimelineEvent(
-                id=event_log.id,
-                event_type=event_log.event_type,
-                description=description,
-                icon=icon,
-                user_id=event_log.user_id,
-                user_name=user_name,
-                created_at=event_log.created_at,
-                payload=payload if payload else None,
-            ))
+    async def get_timeline_after(
+        self, client_id: UUID, after: tuple[datetime, UUID], limit: int = 200
+    ) -> list[TimelineEvent]:
+        """Events positioned after ``(created_at, id)``, oldest first."""
+        rows = await self.repo.get_timeline_events_after(client_id, after, limit)
+        return [_timeline_event(event_log, user_orm) for event_log, user_orm in rows]
 
-        return TimelineResponse(client_id=client_id, events=events, total=total)
+    async def get_timeline_events_by_keys(
+        self, client_id: UUID, keys: list[tuple[datetime, UUID]]
+    ) -> list[TimelineEvent]:
+        """The client's events with the given ``(created_at, id)``, oldest first."""
+        rows = await self.repo.get_timeline_events_by_keys(client_id, keys)
+        return [_timeline_event(event_log, user_orm) for event_log, user_orm in rows]
 
     async def get_diagnostics(self, client_id: UUID) -> CaseDiagnostics:
-        """Build a diagnostic snapshot for a single case."""
-        from sqlalchemy import select
-
-        from app.infrastructure.database.models.event_log_orm import EventLogORM
-
-        client = await self.repo.get_by_id(client_id)
+        """Build a diagnostic snapshot for a single case.
+
+        The client, workflow and last-activity lookups run concurrently.
+        """
+        client, wf, last_activity = await fanout(
+            lambda session: ClientRepository(session).get_by_id(client_id),
+            lambda session: WorkflowRepository(session).get_instance_by_client(
+                client_id
+            ),
+            lambda session: ClientRepository(session).get_last_activity(client_id),
+        )
         if not client:
             raise ValueError("Client not found")
 
@@ -222,8 +302,6 @@ class ClientService:
             else 0
         )
 
-        wf = await self.workflow_repo.get_instance_by_client(client_id)
-
         step_diagnostics: list[StepDiagnostic] = []
         blockers: list[str] = []
         current_step_id: str | None = None
@@ -257,16 +335,6 @@ class ClientService:
                         f"Step '{step_name_map.get(si.step_id, si.step_id)}' in progress for {days_in} days"
                     )
 
-        # Most recent event for last_activity
-        last_event_query = (
-            select(EventLogORM.created_at)
-            .where(EventLogORM.client_id == client_id)
-            .order_by(EventLogORM.created_at.desc())
-            .limit(1)
-        )
-        result = await self.session.execute(last_event_query)
-        last_activity = result.scalar_one_or_none()
-
         return CaseDiagnostics(
             client_id=client.id,
             client_name=client.client_name,
@@ -279,3 +347,42 @@ class ClientService:
             is_stale=days_since >= 7,
             blockers=blockers,
         )
+
+
+def _timeline_event(event_log, user_orm) -> TimelineEvent:
+    payload = event_log.payload
+    description, icon = event_log.description, event_log.icon
+    if description is None or icon is None:
+        # Written before descriptions were stored on the row.
+        description, icon = TimelineEvent.render(event_log.event_type, payload or {})
+
+    user_name = None
+    if user_orm:
+        user_name = f"{user_orm.first_name} {user_orm.last_name}"
+
+    return TimelineEvent(
+        id=event_log.id,
+        event_type=event_log.event_type,
+        description=description,
+        icon=icon,
+        user_id=event_log.user_id,
+        user_name=user_name,
+        created_at=event_log.created_at,
+        payload=payload if payload else None,
+    )
+
+
+def encode_timeline_cursor(position: tuple[datetime, UUID]) -> str:
+    """Opaque form of a ``(created_at, id)`` position in a client's timeline."""
+    created_at, event_id = position
+    raw = f"{created_at.isoformat()}|{event_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_timeline_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, event_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(event_id)
+    except ValueError:
+        raise ValueError("Invalid timeline cursor")
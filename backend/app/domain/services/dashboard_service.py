@@ -0,0 +1,153 @@
+"""Service layer for the admin dashboard and SLA alerts."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.models.admin import (
+    DashboardMetrics,
+    SlaAlert,
+    SlaAlertsResponse,
+    StuckStep,
+    StuckStepsResponse,
+)
+from app.infrastructure.database.fanout import fanout
+from app.infrastructure.repositories.alert_repo import AlertRepository
+from app.infrastructure.repositories.metrics_repo import (
+    CASES_BY_STATUS,
+    COMPLETED_WORKFLOWS,
+    CYCLE_TIME_SECONDS,
+    SUBMISSIONS_BY_DAY,
+    MetricsRepository,
+)
+
+
+class DashboardService:
+    """Builds admin dashboard views.
+
+    Headline figures come from the metric_counters aggregates maintained by
+    ``MetricsHandler`` and ``MetricsReconciler``, so they cost a single
+    small read regardless of case volume.  SLA and stuck-step listings read
+    the open rows of the alerts table kept by ``AlertScanner``.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.alert_repo = AlertRepository(session)
+        self.metrics_repo = MetricsRepository(session)
+        self.session = session
+
+    async def get_sla_alerts(
+        self,
+        severity: str | None = None,
+        assigned_to_user_id: UUID | None = None,
+        page: int = 1,
+        per_page: int = 50,
+        count_only: bool = False,
+    ) -> SlaAlertsResponse:
+        """Return a page of open SLA alerts, oldest first.
+
+        With ``count_only`` only the total is computed.
+        """
+        filters = dict(severity=severity, assigned_to_user_id=assigned_to_user_id)
+        total = await self.alert_repo.count_open_sla(**filters)
+        alerts: list[SlaAlert] = []
+        if not count_only and total > (page - 1) * per_page:
+            rows = await self.alert_repo.list_open_sla(
+                **filters, limit=per_page, offset=(page - 1) * per_page
+            )
+            alerts = [_sla_alert(row) for row in rows]
+        return SlaAlertsResponse(
+            alerts=alerts, total=total, page=page, per_page=per_page
+        )
+
+    async def get_metrics(self) -> DashboardMetrics:
+        """Aggregate dashboard metrics for the admin overview.
+
+        The counters, stuck-step and SLA reads are independent and run
+        concurrently on separate connections.
+        """
+        now = datetime.now(timezone.utc)
+        preview = settings.DASHBOARD_PREVIEW_LIMIT
+        counters, stuck, stale = await fanout(
+            lambda session: MetricsRepository(session).get_all(),
+            lambda session: DashboardService(session).get_stuck_steps(per_page=preview),
+            lambda session: DashboardService(session).get_sla_alerts(per_page=preview),
+        )
+
+        by_status = {
+            status: count
+            for status, count in counters.get(CASES_BY_STATUS, {}).items()
+            if count
+        }
+
+        completed = counters.get(COMPLETED_WORKFLOWS, {}).get("", 0)
+        cycle_seconds = counters.get(CYCLE_TIME_SECONDS, {}).get("", 0)
+        avg_cycle_time_days = (
+            round(cycle_seconds / completed / 86400, 1)
+            if completed and cycle_seconds
+            else None
+        )
+
+        daily = counters.get(SUBMISSIONS_BY_DAY, {})
+        today = now.date()
+
+        def submissions_since(days: int) -> int:
+            first_day = MetricsRepository.day_key(today - timedelta(days=days - 1))
+            return sum(count for day, count in daily.items() if day >= first_day)
+
+        return DashboardMetrics(
+            total_cases=sum(by_status.values()),
+            by_status=by_status,
+            stuck_steps=stuck.steps,
+            stuck_steps_total=stuck.total,
+            stale_cases=stale.alerts,
+            stale_cases_total=stale.total,
+            avg_cycle_time_days=avg_cycle_time_days,
+            submissions_last_7_days=submissions_since(7),
+            submissions_last_30_days=submissions_since(30),
+        )
+
+    async def get_stuck_steps(
+        self,
+        step_id: str | None = None,
+        page: int = 1,
+        per_page: int = 50,
+    ) -> StuckStepsResponse:
+        """Return a page of open stuck-step alerts, oldest first.
+
+        ``by_step`` counts stuck steps per ``step_id`` across all pages and
+        is not narrowed by the ``step_id`` filter, so it can drive a facet.
+        """
+        by_step = await self.alert_repo.count_open_stuck_by_step()
+        total = by_step.get(step_id, 0) if step_id else sum(by_step.values())
+
+        steps: list[StuckStep] = []
+        if total > (page - 1) * per_page:
+            rows = await self.alert_repo.list_open_stuck(
+                step_id=step_id, limit=per_page, offset=(page - 1) * per_page
+            )
+            steps = [
+                StuckStep(
+                    client_id=str(row.client_id),
+                    client_name=row.client_name,
+                    step_id=row.step_id,
+                    days_stuck=row.days_stuck,
+                )
+                for row in rows
+            ]
+        return StuckStepsResponse(
+            steps=steps, total=total, page=page, per_page=per_page, by_step=by_step
+        )
+
+
+def _sla_alert(row: Row) -> SlaAlert:
+    return SlaAlert(
+        client_id=str(row.client_id),
+        client_name=row.client_name,
+        status=row.status,
+        days_stale=row.days_stale,
+        severity=row.severity,
+    )
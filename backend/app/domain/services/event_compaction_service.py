@@ -0,0 +1,134 @@
+"""Service layer for compacting runs of step autosave events in event_log."""
+
+import json
+from datetime import datetime, timedelta
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.domain.models.client import TimelineEvent
+from app.infrastructure.database.models.event_log_orm import EventLogORM
+from app.infrastructure.repositories.alert_repo import AlertRepository
+from app.infrastructure.repositories.event_log_repo import EventLogRepository
+
+COMPACTOR_NAME = "event-log-compactor"
+SAVE_EVENT = "WorkflowStepSaved"
+
+# event_log is walked one window at a time, oldest first.
+WINDOW = timedelta(days=1)
+
+
+class EventCompactionService:
+    """Merges consecutive ``WorkflowStepSaved`` rows into summary rows.
+
+    A run is a sequence of saves in a client's timeline with nothing else
+    in between, all by the same user on the same step.  The first row of
+    each run is kept -- so its position in the timeline and partition do
+    not change -- and its payload gains ``save_count``, ``first_saved_at``
+    and ``last_saved_at`` and carries the whole run's data delta; the rest
+    are deleted.  The event_daily_counts rollup is left alone and still
+    counts every save.
+
+    Progress is recorded in job_state, so each run only reads rows logged
+    since the previous one.  A run crossing that boundary is merged into
+    the row it continues.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.repo = EventLogRepository(session)
+        self.state = AlertRepository(session)
+
+    async def compact(self, cutoff: datetime, max_rows: int) -> int:
+        """Compact saves logged before *cutoff*; returns the rows removed.
+
+        Stops after the window in which *max_rows* rows have been read;
+        the next call carries on from there.
+        """
+        lower = await self.state.get_last_run(COMPACTOR_NAME)
+        if lower is None:
+            lower = await self.repo.first_event_at(SAVE_EVENT) or cutoff
+
+        removed = examined = 0
+        while lower < cutoff and examined < max_rows:
+            upper = min(lower + WINDOW, cutoff)
+            client_ids = await self.repo.clients_with_events_between(
+                SAVE_EVENT, lower, upper
+            )
+            for client_id in client_ids:
+                rows = await self.repo.list_client_events_between(
+                    client_id, lower, upper
+                )
+                examined += len(rows)
+                previous = await self.repo.get_client_event_before(client_id, lower)
+                removed += await self._compact_client(previous, rows)
+            lower = upper
+
+        await self.state.set_last_run(COMPACTOR_NAME, lower)
+        return removed
+
+    async def _compact_client(
+        self, previous: EventLogORM | None, rows: list[EventLogORM]
+    ) -> int:
+        runs: list[list[EventLogORM]] = []
+        run = [previous] if previous is not None else []
+        for row in rows:
+            if run and _continues(run[0], row):
+                run.append(row)
+            else:
+                runs.append(run)
+                run = [row]
+        runs.append(run)
+
+        removed = 0
+        for run in runs:
+            if len(run) < 2:
+                continue
+            head, rest = run[0], run[1:]
+            payload = _summary(run)
+            description, icon = TimelineEvent.render(SAVE_EVENT, payload)
+            await self.repo.rewrite_event(
+                (head.created_at, head.id), payload, description, icon
+            )
+            await self.repo.delete_events([(row.created_at, row.id) for row in rest])
+            removed += len(rest)
+        return removed
+
+
+def _continues(head: EventLogORM, row: EventLogORM) -> bool:
+    return (
+        head.event_type == SAVE_EVENT
+        and row.event_type == SAVE_EVENT
+        and head.user_id == row.user_id
+        and head.payload.get("step_id") == row.payload.get("step_id")
+        and head.payload.get("workflow_instance_id")
+        == row.payload.get("workflow_instance_id")
+    )
+
+
+def _saved_range(row: EventLogORM) -> tuple[datetime, datetime]:
+    payload = row.payload
+    saved_at = payload.get("timestamp")
+    first = payload.get("first_saved_at") or saved_at
+    last = payload.get("last_saved_at") or saved_at
+    if first is None or last is None:
+        return row.created_at, row.created_at
+    return datetime.fromisoformat(first), datetime.fromisoformat(last)
+
+
+def _summary(run: list[EventLogORM]) -> dict:
+    ranges = [_saved_range(row) for row in run]
+    # Consecutive deltas concatenate into the delta of the whole run.
+    patches = [row.payload.get("patch") for row in run]
+    patch = None
+    if all(p is not None for p in patches):
+        patch = [op for p in patches for op in p]
+        if len(json.dumps(patch, default=str)) > settings.STEP_SAVE_PATCH_MAX_BYTES:
+            patch = None
+    return {
+        **run[0].payload,
+        "save_count": sum(row.payload.get("save_count", 1) for row in run),
+        "first_saved_at": min(first for first, _ in ranges).isoformat(),
+        "last_saved_at": max(last for _, last in ranges).isoformat(),
+        "patch": patch,
+        "data_hash": run[-1].payload.get("data_hash"),
+    }
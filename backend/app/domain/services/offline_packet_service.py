@@ -12,7 +12,9 @@ from app.domain.models.offline_packet import (
     OfflinePacketStatus,
     OfflinePacketStatusResponse,
     RequiredFileStatus,
+    TemplatePrefill,
 )
+from app.infrastructure.repositories.client_repo import ClientRepository
 from app.infrastructure.repositories.document_repo import DocumentRepository
 from app.infrastructure.repositories.workflow_repo import WorkflowRepository
 
@@ -30,6 +32,7 @@ class OfflinePacketService:
 
     def __init__(self, session: AsyncSession) -> None:
         self.doc_repo = DocumentRepository(session)
+        self.client_repo = ClientRepository(session)
         self.workflow_repo = WorkflowRepository(session)
         self.session = session
 
@@ -37,13 +40,8 @@ class OfflinePacketService:
         self, client_id: UUID, workflow_instance_id: UUID
     ) -> OfflinePacketStatusResponse:
         """Build the file matrix and completeness check for an offline packet."""
-        documents = await self.doc_repo.list_by_workflow_instance(workflow_instance_id)
-
-        # Build a lookup: file_type -> most recent document
-        uploaded_map: dict[str, object] = {}
-        for doc in documents:
-            if doc.file_type not in uploaded_map:
-                uploaded_map[doc.file_type] = doc
+        latest = await self.doc_repo.latest_by_type(workflow_instance_id)
+        uploaded_map = {doc.file_type: doc for doc in latest}
 
         files: list[RequiredFileStatus] = []
         missing_required: list[str] = []
@@ -68,7 +66,7 @@ class OfflinePacketService:
             )
 
         # Determine overall packet status from workflow status
-        instance = await self.workflow_repo.get_instance_by_client(client_id)
+        instance = await self.workflow_repo.get_instance_summary_by_client(client_id)
         if instance and instance.status == "OFFLINE_SUBMITTED":
             status = OfflinePacketStatus.SUBMITTED
         elif instance and instance.status == "OFFLINE_IN_REVIEW":
@@ -121,3 +119,37 @@ class OfflinePacketService:
 
         # Re-fetch status to reflect the new state
         return await self.get_packet_status(client_id, workflow_instance_id)
+
+    async def get_template_prefill(self, client_id: UUID) -> TemplatePrefill:
+        """Return the client details to stamp onto a prefilled template.
+
+        Raises ``ValueError`` if the client does not exist.
+        """
+        identity = await self.client_repo.get_identity(client_id)
+        if identity is None:
+            raise ValueError("Client not found")
+
+        locality = " ".join(
+            part
+            for part in (identity.primary_address_state, identity.primary_address_zip)
+            if part
+        )
+        address = ", ".join(
+            part
+            for part in (
+                identity.primary_address_street,
+                identity.primary_address_city,
+                locality,
+            )
+            if part
+        )
+        lines = [f"Client: {identity.client_name}"]
+        if address:
+            lines.append(f"Address: {address}")
+        lines.append(f"Unique ID: {identity.unique_id}")
+
+        return TemplatePrefill(
+            unique_id=identity.unique_id,
+            updated_at=identity.updated_at,
+            lines=lines,
+        )
@@ -0,0 +1,139 @@
+"""Service layer for streaming a client's timeline as Server-Sent Events."""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.domain.models.client import TimelineEvent
+from app.domain.services.client_service import (
+    ClientService,
+    decode_timeline_cursor,
+    encode_timeline_cursor,
+)
+from app.infrastructure.database.event_log_listener import (
+    RESYNC,
+    EventLogListener,
+    TimelineSubscription,
+)
+from app.infrastructure.database.session import async_session_factory
+
+REPLAY_PAGE_SIZE = 200
+RETRY_MILLISECONDS = 3000
+
+
+class TimelineStreamService:
+    """Pushes a client's new timeline events as they are committed.
+
+    Each frame's SSE ``id`` is the timeline cursor of the newest event sent
+    so far, so a browser reconnecting with ``Last-Event-ID`` is first sent
+    everything it missed.  Database reads use short-lived sessions; the
+    stream itself holds no connection while idle.
+
+    ``created_at`` is the inserting transaction's start time, so a row can
+    commit after one stamped later than it.  Replays therefore start
+    ``replay_margin_seconds`` before the cursor, and ids already sent on
+    this stream are skipped; after a reconnect, events inside the margin
+    may be sent again and clients drop them by event id.
+    """
+
+    def __init__(
+        self,
+        listener: EventLogListener,
+        heartbeat_seconds: float,
+        replay_margin_seconds: float,
+    ) -> None:
+        self.listener = listener
+        self.heartbeat_seconds = heartbeat_seconds
+        self.replay_margin = timedelta(seconds=replay_margin_seconds)
+
+    async def stream(
+        self, client_id: UUID, last_event_id: str | None = None
+    ) -> AsyncIterator[str]:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        async with self.listener.subscribe(client_id) as subscription:
+            # Subscribed before replaying, so nothing falls in between; ids
+            # sent by the replay are skipped if they are queued as well.
+            position = (
+                decode_timeline_cursor(last_event_id)
+                if last_event_id is not None
+                else None
+            )
+            # Ids sent within the replay margin of the newest event sent.
+            sent: dict[UUID, datetime] = {}
+
+            def send(events: list[TimelineEvent]) -> Iterator[str]:
+                nonlocal position
+                for event in events:
+                    if event.id in sent:
+                        continue
+                    sent[event.id] = event.created_at
+                    key = (event.created_at, event.id)
+                    if position is None or key > position:
+                        position = key
+                    yield _frame(event, encode_timeline_cursor(position))
+                if position is not None:
+                    horizon = position[0] - self.replay_margin
+                    for event_id in [i for i, at in sent.items() if at < horizon]:
+                        del sent[event_id]
+
+            if position is not None:
+                async for page in self._replay(client_id, position):
+                    for frame in send(page):
+                        yield frame
+
+            while True:
+                batch = await self._next_batch(subscription)
+                if batch is None:
+                    yield ": heartbeat\n\n"
+                    continue
+                if RESYNC in batch:
+                    if position is None:
+                        continue
+                    async for page in self._replay(client_id, position):
+                        for frame in send(page):
+                            yield frame
+                else:
+                    events = await self._load(
+                        client_id,
+                        [(e.created_at, e.id) for e in batch if e.id not in sent],
+                    )
+                    for frame in send(events):
+                        yield frame
+
+    async def _next_batch(self, subscription: TimelineSubscription) -> list | None:
+        """Wait for notifications; ``None`` if the heartbeat interval passed."""
+        try:
+            first = await asyncio.wait_for(
+                subscription.get(), timeout=self.heartbeat_seconds
+            )
+        except asyncio.TimeoutError:
+            return None
+        return [first, *subscription.drain()]
+
+    async def _replay(
+        self, client_id: UUID, position: tuple[datetime, UUID]
+    ) -> AsyncIterator[list[TimelineEvent]]:
+        """Pages of events from the replay margin before *position* on."""
+        after = (position[0] - self.replay_margin, UUID(int=0))
+        while True:
+            async with async_session_factory() as session:
+                events = await ClientService(session).get_timeline_after(
+                    client_id, after, REPLAY_PAGE_SIZE
+                )
+            yield events
+            if len(events) < REPLAY_PAGE_SIZE:
+                return
+            after = (events[-1].created_at, events[-1].id)
+
+    async def _load(self, client_id: UUID, keys: list) -> list[TimelineEvent]:
+        if not keys:
+            return []
+        async with async_session_factory() as session:
+            return await ClientService(session).get_timeline_events_by_keys(
+                client_id, keys
+            )
+
+
+def _frame(event: TimelineEvent, cursor: str) -> str:
+    return f"id: {cursor}\nevent: timeline\ndata: {event.model_dump_json()}\n\n"
@@ -6,6 +6,7 @@ from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.config import settings
 from app.domain.events.client_events import GroupSetupStarted, OfflineSetupChosen
 from app.domain.events.event_bus import event_bus
 from sqlalchemy import select
@@ -13,19 +14,36 @@ from sqlalchemy import select
 from app.domain.events.workflow_events import (
     EnrollmentTransitionInitiated,
     MasterAppSigned,
+    WorkflowCompleted,
     WorkflowHandoffRequested,
     WorkflowStepCompleted,
     WorkflowStepSaved,
     WorkflowStepSkipped,
+    WorkflowStepStarted,
     WorkflowSubmitted,
 )
-from app.domain.models.workflow import WorkflowInstance
+from app.domain.json_patch import apply, content_hash, diff, invert
+from app.domain.models.workflow import StepHistory, StepVersion, WorkflowInstance
+from app.domain.services.client_service import ClientService
 from app.infrastructure.database.models.access_orm import ClientAccessORM
 from app.infrastructure.database.models.user_orm import UserORM
 from app.infrastructure.repositories.client_repo import ClientRepository
+from app.infrastructure.repositories.event_log_repo import EventLogRepository
 from app.infrastructure.repositories.workflow_repo import WorkflowRepository
 
 
+def step_save_delta(previous: dict, data: dict) -> tuple[list[dict] | None, str]:
+    """Return the logged ``(patch, data_hash)`` for saving *data* over *previous*.
+
+    The patch is dropped when its JSON encoding exceeds
+    ``STEP_SAVE_PATCH_MAX_BYTES``; the hash is always kept.
+    """
+    patch = diff(previous, data)
+    if len(json.dumps(patch, default=str)) > settings.STEP_SAVE_PATCH_MAX_BYTES:
+        patch = None
+    return patch, content_hash(data)
+
+
 class WorkflowService:
     """Encapsulates all business operations on the Workflow aggregate.
 
@@ -36,6 +54,7 @@ class WorkflowService:
     def __init__(self, session: AsyncSession) -> None:
         self.repo = WorkflowRepository(session)
         self.client_repo = ClientRepository(session)
+        self.client_service = ClientService(session)
         self.session = session
 
     # ------------------------------------------------------------------
@@ -89,6 +108,36 @@ class WorkflowService:
             "data": step.data or {},
         }
 
+    async def get_step_history(self, client_id: UUID, step_id: str) -> StepHistory:
+        """Rebuild each logged version of a step's data, newest first.
+
+        Versions are replayed forward from the empty data a step starts
+        with, and backward from the current data; a version neither pass
+        can reach (a save logged without a delta, or data changed outside
+        ``save_step_data``) is returned with its hash only.
+
+        Raises ``ValueError`` if the workflow or step does not exist.
+        """
+        current = await self.get_step_data(client_id, step_id)
+        rows = await EventLogRepository(self.session).list_step_saves(
+            client_id, step_id
+        )
+        states = _rebuild_versions([row.payload for row, _, _ in rows], current["data"])
+
+        versions = []
+        for (row, first_name, last_name), data in zip(rows, states):
+            last_saved_at = row.payload.get("last_saved_at")
+            versions.append(StepVersion(
+                saved_at=last_saved_at or row.created_at,
+                user_id=row.user_id,
+                user_name=f"{first_name} {last_name}" if first_name else None,
+                save_count=row.payload.get("save_count", 1),
+                data_hash=row.payload.get("data_hash"),
+                data=data,
+            ))
+        versions.reverse()
+        return StepHistory(client_id=client_id, step_id=step_id, versions=versions)
+
     # ------------------------------------------------------------------
     # Workflow creation
     # ------------------------------------------------------------------
@@ -143,7 +192,9 @@ class WorkflowService:
         instance.current_step_id = first_step_id
 
         # Update client status to reflect that the application is underway
-        await self.client_repo.update_status(client_id, "APPLICATION_IN_PROGRESS")
+        await self.client_service.change_status(
+            client_id, "APPLICATION_IN_PROGRESS", user_id=user_id
+        )
 
         await self.session.flush()
 
@@ -185,7 +236,9 @@ class WorkflowService:
         instance.started_at = datetime.now(timezone.utc)
 
         # Update client status to reflect that the application is underway
-        await self.client_repo.update_status(client_id, "APPLICATION_IN_PROGRESS")
+        await self.client_service.change_status(
+            client_id, "APPLICATION_IN_PROGRESS", user_id=user_id
+        )
 
         await self.session.flush()
 
@@ -214,7 +267,8 @@ class WorkflowService:
         """Save form data for a workflow step.
 
         Automatically transitions a PENDING step to IN_PROGRESS on the first
-        save.  Publishes a ``WorkflowStepSaved`` domain event.
+        save, publishing ``WorkflowStepStarted``.  Publishes a
+        ``WorkflowStepSaved`` domain event.
 
         Raises ``ValueError`` if the workflow or step does not exist.
         """
@@ -248,6 +302,7 @@ class WorkflowService:
             )
 
         now = datetime.now(timezone.utc)
+        patch, data_hash = step_save_delta(step.data or {}, data)
         await self.repo.update_step_instance(step.id, data=data, last_saved_at=now)
 
         # Auto-advance from PENDING to IN_PROGRESS on first interaction
@@ -258,12 +313,25 @@ class WorkflowService:
             instance.current_step_id = step_id
             await self.session.flush()
 
+            await event_bus.publish(
+                WorkflowStepStarted(
+                    client_id=client_id,
+                    user_id=user_id,
+                    workflow_instance_id=instance.id,
+                    step_id=step_id,
+                    started_at=now,
+                    assigned_role=step.assigned_role,
+                )
+            )
+
         await event_bus.publish(
             WorkflowStepSaved(
                 client_id=client_id,
                 user_id=user_id,
                 workflow_instance_id=instance.id,
                 step_id=step_id,
+                patch=patch,
+                data_hash=data_hash,
             )
         )
 
@@ -297,6 +365,8 @@ class WorkflowService:
             raise ValueError(f"Step {step_id} not found")
 
         now = datetime.now(timezone.utc)
+        step_started_at = step.started_at
+        step_role = step.assigned_role
         await self.repo.update_step_instance(
             step.id, status="COMPLETED", completed_at=now
         )
@@ -360,9 +430,22 @@ class WorkflowService:
                 user_id=user_id,
                 workflow_instance_id=instance.id,
                 step_id=step_id,
+                started_at=step_started_at,
+                assigned_role=step_role,
             )
         )
 
+        if all_completed:
+            await event_bus.publish(
+                WorkflowCompleted(
+                    client_id=client_id,
+                    user_id=user_id,
+                    workflow_instance_id=instance.id,
+                    started_at=instance.started_at,
+                    completed_at=now,
+                )
+            )
+
         return {
             "step_id": step_id,
             "status": "COMPLETED",
@@ -393,6 +476,8 @@ class WorkflowService:
         if not step:
             raise ValueError(f"Step {step_id} not found")
 
+        step_started_at = step.started_at
+        step_role = step.assigned_role
         await self.repo.update_step_instance(step.id, status="SKIPPED")
 
         await event_bus.publish(
@@ -401,6 +486,8 @@ class WorkflowService:
                 user_id=user_id,
                 workflow_instance_id=instance.id,
                 step_id=step_id,
+                started_at=step_started_at,
+                assigned_role=step_role,
             )
         )
 
@@ -678,6 +765,15 @@ class WorkflowService:
             instance.status = "COMPLETED"
             instance.completed_at = now
             await self.session.flush()
+            await event_bus.publish(
+                WorkflowCompleted(
+                    client_id=client_id,
+                    user_id=user_id,
+                    workflow_instance_id=instance.id,
+                    started_at=instance.started_at,
+                    completed_at=now,
+                )
+            )
 
         # Generate and persist group number
         group_number = self._generate_group_number(client_id)
@@ -687,7 +783,9 @@ class WorkflowService:
             await self.session.flush()
 
         # Update client status
-        await self.client_repo.update_status(client_id, "SUBMITTED")
+        await self.client_service.change_status(
+            client_id, "SUBMITTED", user_id=user_id
+        )
 
         payload = self._build_servicing_payload(instance, steps_sorted)
         payload["group_number"] = group_number
@@ -737,3 +835,49 @@ class WorkflowService:
             payload["group_number"] = client.group_id
 
         return payload
+
+    async def get_payload_preview(self, client_id: UUID) -> dict | None:
+        """Assemble the servicing payload from the current step data.
+
+        Unlike :meth:`get_submission_payload` this does not require the
+        workflow to be completed; returns ``None`` if no workflow exists.
+        """
+        instance = await self.repo.get_instance_by_client(client_id)
+        if not instance:
+            return None
+
+        steps_sorted = sorted(
+            instance.step_instances, key=lambda s: s.step_order
+        )
+        return self._build_servicing_payload(instance, steps_sorted)
+
+
+def _rebuild_versions(saves: list[dict], current: dict) -> list[dict | None]:
+    """Data after each save in *saves* (oldest first), or ``None`` if unknown."""
+    states: list[dict | None] = [None] * len(saves)
+
+    state: dict = {}
+    for i, save in enumerate(saves):
+        if save.get("patch") is None:
+            break
+        try:
+            state = apply(state, save["patch"])
+        except ValueError:
+            break
+        if content_hash(state) != save.get("data_hash"):
+            break
+        states[i] = state
+
+    state = current
+    for i in range(len(saves) - 1, -1, -1):
+        save = saves[i]
+        if content_hash(state) != save.get("data_hash"):
+            break
+        states[i] = state
+        if save.get("patch") is None:
+            break
+        try:
+            state = apply(state, invert(save["patch"]))
+        except ValueError:
+            break
+    return states
@@ -0,0 +1,21 @@
+from app.infrastructure.cache.client_membership import (
+    ClientMembershipIndex,
+    get_client_membership_index,
+)
+from app.infrastructure.cache.response_cache import (
+    DASHBOARD_METRICS,
+    SLA_ALERTS,
+    STUCK_STEPS,
+    ResponseCache,
+    get_response_cache,
+)
+
+__all__ = [
+    "ClientMembershipIndex",
+    "get_client_membership_index",
+    "DASHBOARD_METRICS",
+    "SLA_ALERTS",
+    "STUCK_STEPS",
+    "ResponseCache",
+    "get_response_cache",
+]
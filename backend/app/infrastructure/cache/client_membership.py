@@ -0,0 +1,109 @@
+"""In-process index of the clients each user may access.
+
+Each user's set of client ids is loaded with one query and kept for a
+TTL in a bounded LRU.  A client missing from a cached set is re-checked
+against the database before access is refused, so a new grant applies
+immediately; revocations and owner changes drop the affected sets through
+:meth:`ClientMembershipIndex.invalidate_client`, with the TTL as a bound
+for any change that publishes no event.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Awaitable, Callable
+from uuid import UUID
+
+from app.config import settings
+
+
+@dataclass
+class _Entry:
+    client_ids: frozenset[UUID]
+    expires_at: float
+
+
+class ClientMembershipIndex:
+    """Bounded LRU of per-user client id sets with a TTL."""
+
+    def __init__(self, max_users: int, ttl_seconds: float) -> None:
+        self.max_users = max_users
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[UUID, _Entry] = OrderedDict()
+        # Bumped on every invalidation; a load that started before one is
+        # used for its own check but not stored.
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    async def has_access(
+        self,
+        user_id: UUID,
+        client_id: UUID,
+        load: Callable[[], Awaitable[set[UUID]]],
+    ) -> bool:
+        """Whether *user_id* may access *client_id*.
+
+        *load* returns the user's client ids from the database; it is only
+        called on a miss, an expired entry, or a client not in the cached
+        set.
+        """
+        entry = self._entries.get(user_id)
+        if entry is not None and time.monotonic() < entry.expires_at:
+            self._entries.move_to_end(user_id)
+            if client_id in entry.client_ids:
+                self.hits += 1
+                return True
+        self.misses += 1
+
+        generation = self._generation
+        client_ids = frozenset(await load())
+        if generation == self._generation:
+            self._store(user_id, client_ids)
+        return client_id in client_ids
+
+    def invalidate_client(self, client_id: UUID) -> None:
+        """Drop every cached set that includes *client_id*."""
+        self._generation += 1
+        stale = [
+            user_id
+            for user_id, entry in self._entries.items()
+            if client_id in entry.client_ids
+        ]
+        for user_id in stale:
+            del self._entries[user_id]
+
+    def invalidate_user(self, user_id: UUID) -> None:
+        self._generation += 1
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "users": len(self._entries),
+            "max_users": self.max_users,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _store(self, user_id: UUID, client_ids: frozenset[UUID]) -> None:
+        self._entries[user_id] = _Entry(
+            client_ids=client_ids,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+
+
+@lru_cache(maxsize=1)
+def get_client_membership_index() -> ClientMembershipIndex:
+    """Return the process-wide client membership index."""
+    return ClientMembershipIndex(
+        max_users=settings.CLIENT_ACCESS_CACHE_MAX_USERS,
+        ttl_seconds=settings.CLIENT_ACCESS_CACHE_TTL_SECONDS,
+    )
@@ -0,0 +1,175 @@
+"""In-process response cache with stale-while-revalidate.
+
+Entries are keyed by a namespace (one per endpoint) and the request's
+query parameters.  A fresh entry is returned as is; a stale one is
+returned immediately while a single background task recomputes it; a
+missing or expired one is computed once, with concurrent callers for the
+same key awaiting the same computation.  Invalidating a namespace marks
+its entries stale rather than dropping them, so readers keep getting an
+answer while the refresh runs.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Namespaces
+SLA_ALERTS = "admin.sla_alerts"
+STUCK_STEPS = "admin.stuck_steps"
+DASHBOARD_METRICS = "admin.dashboard_metrics"
+
+CacheKey = tuple[str, tuple]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    generation: int
+
+
+class ResponseCache:
+    """Bounded LRU of computed responses with single-flight refresh."""
+
+    def __init__(self, max_entries: int, stale_seconds: float) -> None:
+        self.max_entries = max_entries
+        self.stale_seconds = stale_seconds
+        self._entries: OrderedDict[CacheKey, _Entry] = OrderedDict()
+        self._in_flight: dict[CacheKey, asyncio.Future] = {}
+        self._generations: dict[str, int] = {}
+        self._refreshes: set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        params: dict[str, Any],
+        compute: Callable[[], Awaitable[T]],
+        ttl: float,
+    ) -> T:
+        """Return the cached value for *namespace* and *params*.
+
+        *compute* is called without arguments and must not depend on the
+        caller's request (e.g. its database session), since it may run in
+        the background after the request has finished.
+        """
+        key = (namespace, tuple(sorted(params.items())))
+        now = time.monotonic()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            self._apply_invalidation(namespace, entry)
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._in_flight:
+                    task = asyncio.create_task(self._refresh(key, compute, ttl))
+                    self._refreshes.add(task)
+                    task.add_done_callback(self._refreshes.discard)
+                return entry.value
+
+        self.misses += 1
+        return await self._compute(key, compute, ttl)
+
+    def invalidate(self, namespace: str) -> None:
+        """Mark every entry of *namespace* stale.
+
+        Stale entries are still served (within the stale window) while one
+        request refreshes them; results of computations already in flight
+        are stored as stale too, so they cannot mask the change.
+        """
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+        }
+
+    async def close(self) -> None:
+        """Cancel background refreshes."""
+        for task in self._refreshes:
+            task.cancel()
+        await asyncio.gather(*self._refreshes, return_exceptions=True)
+        self._refreshes.clear()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _apply_invalidation(self, namespace: str, entry: _Entry) -> None:
+        """Expire *entry* if its namespace was invalidated since it was stored."""
+        generation = self._generations.get(namespace, 0)
+        if entry.generation != generation:
+            entry.fresh_until = 0.0
+            entry.generation = generation
+
+    async def _compute(
+        self, key: CacheKey, compute: Callable[[], Awaitable[T]], ttl: float
+    ) -> T:
+        pending = self._in_flight.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._run(key, compute, ttl))
+            self._in_flight[key] = pending
+            pending.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _refresh(
+        self, key: CacheKey, compute: Callable[[], Awaitable[T]], ttl: float
+    ) -> None:
+        try:
+            await self._compute(key, compute, ttl)
+        except Exception as e:
+            logger.warning(f"Background refresh of {key[0]} failed: {e}")
+
+    async def _run(
+        self, key: CacheKey, compute: Callable[[], Awaitable[T]], ttl: float
+    ) -> T:
+        namespace = key[0]
+        generation = self._generations.get(namespace, 0)
+        value = await compute()
+
+        now = time.monotonic()
+        current = generation == self._generations.get(namespace, 0)
+        self._entries[key] = _Entry(
+            value=value,
+            fresh_until=now + ttl if current else 0.0,
+            stale_until=now + ttl + self.stale_seconds,
+            generation=self._generations.get(namespace, 0),
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+
+@lru_cache(maxsize=1)
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache."""
+    return ResponseCache(
+        max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+        stale_seconds=settings.RESPONSE_CACHE_STALE_SECONDS,
+    )
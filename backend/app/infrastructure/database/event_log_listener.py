@@ -0,0 +1,171 @@
+"""Route event_log appends to live timeline subscribers.
+
+The audit handler issues ``NOTIFY`` on :data:`EVENT_LOG_CHANNEL` in the
+transaction that inserts each row, so Postgres delivers it to every
+application process on commit -- and never for a rolled-back event.  Each
+process holds one dedicated ``LISTEN`` connection and hands notifications
+to its in-process subscribers for the matching client.
+
+Subscriber queues are bounded.  A subscriber that falls behind has its
+queue replaced by a single :data:`RESYNC` marker, as does every
+subscriber after the listen connection is re-established; on ``RESYNC``
+the consumer re-reads the log from the last event it delivered.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import AsyncIterator
+from uuid import UUID
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.infrastructure.repositories.event_log_repo import EVENT_LOG_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+RECONNECT_DELAY_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class AppendedEvent:
+    id: UUID
+    created_at: datetime
+
+
+RESYNC = None
+
+
+class TimelineSubscription:
+    """Bounded queue of :class:`AppendedEvent` for one client."""
+
+    def __init__(self, client_id: UUID, queue_size: int) -> None:
+        self.client_id = client_id
+        self._queue: asyncio.Queue[AppendedEvent | None] = asyncio.Queue(
+            maxsize=max(1, queue_size)
+        )
+
+    def push(self, item: AppendedEvent | None) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._reset()
+
+    def _reset(self) -> None:
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(RESYNC)
+
+    async def get(self) -> AppendedEvent | None:
+        return await self._queue.get()
+
+    def drain(self) -> list[AppendedEvent | None]:
+        """Return everything queued without waiting."""
+        items = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        return items
+
+
+class EventLogListener:
+    """Holds the LISTEN connection and the subscribers of this process."""
+
+    def __init__(self, dsn: str, queue_size: int, max_subscribers: int) -> None:
+        self._dsn = dsn
+        self.queue_size = queue_size
+        self.max_subscribers = max_subscribers
+        self._subscribers: dict[UUID, set[TimelineSubscription]] = defaultdict(set)
+        self._count = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def at_capacity(self) -> bool:
+        return self._count >= self.max_subscribers
+
+    @asynccontextmanager
+    async def subscribe(self, client_id: UUID) -> AsyncIterator[TimelineSubscription]:
+        subscription = TimelineSubscription(client_id, self.queue_size)
+        self._subscribers[client_id].add(subscription)
+        self._count += 1
+        try:
+            yield subscription
+        finally:
+            self._count -= 1
+            subscribers = self._subscribers.get(client_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[client_id]
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-log-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def _run(self) -> None:
+        connected_before = False
+        while True:
+            conn = None
+            try:
+                conn = await asyncpg.connect(self._dsn)
+                closed = asyncio.Event()
+                conn.add_termination_listener(lambda _conn: closed.set())
+                await conn.add_listener(EVENT_LOG_CHANNEL, self._on_notify)
+                if connected_before:
+                    # Anything appended while disconnected was missed.
+                    self._broadcast_resync()
+                connected_before = True
+                logger.info(f"Listening for {EVENT_LOG_CHANNEL} notifications")
+                await closed.wait()
+                logger.warning("Event log listener connection lost; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Event log listener failed: {e}")
+            finally:
+                if conn is not None and not conn.is_closed():
+                    await conn.close()
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _on_notify(self, _conn, _pid: int, _channel: str, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+            client_id = UUID(data["client_id"])
+            event = AppendedEvent(
+                id=UUID(data["id"]),
+                created_at=datetime.fromisoformat(data["created_at"]),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring malformed {EVENT_LOG_CHANNEL} payload: {e}")
+            return
+        for subscription in self._subscribers.get(client_id, ()):
+            subscription.push(event)
+
+    def _broadcast_resync(self) -> None:
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                subscription.push(RESYNC)
+
+
+@lru_cache(maxsize=1)
+def get_event_log_listener() -> EventLogListener:
+    """Return the process-wide event log listener."""
+    dsn = make_url(settings.DATABASE_URL).set(drivername="postgresql")
+    return EventLogListener(
+        dsn.render_as_string(hide_password=False),
+        queue_size=settings.TIMELINE_STREAM_QUEUE_SIZE,
+        max_subscribers=settings.TIMELINE_STREAM_MAX_SUBSCRIBERS,
+    )
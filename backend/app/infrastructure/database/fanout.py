@@ -0,0 +1,49 @@
+"""Run independent read-only queries concurrently.
+
+A single ``AsyncSession`` executes one statement at a time, so queries
+issued through it run back to back.  :func:`fanout` gives each query its
+own pooled session instead, so a handler's latency is the slowest query
+rather than the sum of all of them.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.infrastructure.database.session import async_session_factory
+
+Query = Callable[[AsyncSession], Awaitable[Any]]
+
+
+async def fanout(*queries: Query, max_connections: int | None = None) -> list[Any]:
+    """Await every ``query(session)`` concurrently and return their results in order.
+
+    Each query gets a fresh session that is rolled back and closed when it
+    finishes, so queries must only read -- and cannot see uncommitted
+    writes made through the caller's session.  At most *max_connections*
+    (default ``DB_FANOUT_MAX_CONNECTIONS``) sessions are open at once for
+    one call, which bounds how much of the pool a single request can take.
+    Returned ORM objects are detached; only what was loaded is available.
+    """
+    limit = max(1, max_connections or settings.DB_FANOUT_MAX_CONNECTIONS)
+    if len(queries) == 1 or limit == 1:
+        results = []
+        for query in queries:
+            results.append(await _run(query))
+        return results
+
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(query: Query) -> Any:
+        async with semaphore:
+            return await _run(query)
+
+    return list(await asyncio.gather(*(bounded(query) for query in queries)))
+
+
+async def _run(query: Query) -> Any:
+    async with async_session_factory() as session:
+        return await query(session)
@@ -1,4 +1,5 @@
 from app.infrastructure.database.models.user_orm import UserORM
+from app.infrastructure.database.models.alert_orm import AlertORM, JobStateORM
 from app.infrastructure.database.models.client_orm import ClientORM
 from app.infrastructure.database.models.access_orm import ClientAccessORM
 from app.infrastructure.database.models.workflow_orm import (
@@ -8,8 +9,18 @@ from app.infrastructure.database.models.workflow_orm import (
 )
 from app.infrastructure.database.models.document_orm import DocumentORM
 from app.infrastructure.database.models.event_log_orm import EventLogORM
+from app.infrastructure.database.models.event_daily_count_orm import EventDailyCountORM
+from app.infrastructure.database.models.funnel_orm import StepFunnelCountORM
+from app.infrastructure.database.models.metric_counter_orm import MetricCounterORM
+from app.infrastructure.database.models.replay_checkpoint_orm import ReplayCheckpointORM
+from app.infrastructure.database.models.step_timing_orm import (
+    StepDurationSketchORM,
+    StepTimingORM,
+)
 
 __all__ = [
+    "AlertORM",
+    "JobStateORM",
     "UserORM",
     "ClientORM",
     "ClientAccessORM",
@@ -18,4 +29,10 @@ __all__ = [
     "WorkflowStepInstanceORM",
     "DocumentORM",
     "EventLogORM",
+    "EventDailyCountORM",
+    "MetricCounterORM",
+    "ReplayCheckpointORM",
+    "StepDurationSketchORM",
+    "StepFunnelCountORM",
+    "StepTimingORM",
 ]
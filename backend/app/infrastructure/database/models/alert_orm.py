@@ -0,0 +1,72 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, String, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class AlertORM(Base):
+    """ORM model for the alerts table.
+
+    Open alerts (``resolved_at IS NULL``) are unique per
+    ``(alert_type, subject_id)``; the subject is the client for SLA alerts
+    and the step instance for stuck-step alerts.
+    """
+
+    __tablename__ = "alerts"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    alert_type: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )
+    subject_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), nullable=False
+    )
+    client_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("clients.id"),
+        nullable=False,
+    )
+    step_id: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )
+    severity: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )
+    reference_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    opened_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    resolved_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AlertORM(id={self.id}, alert_type='{self.alert_type}', "
+            f"client_id={self.client_id}, severity='{self.severity}')>"
+        )
+
+
+class JobStateORM(Base):
+    """ORM model for the job_state table (last run time per background job)."""
+
+    __tablename__ = "job_state"
+
+    name: Mapped[str] = mapped_column(
+        String(64), primary_key=True
+    )
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
@@ -2,7 +2,16 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, String, Text, text
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -64,6 +73,32 @@ class DocumentORM(Base):
         Boolean, default=False, server_default=text("false")
     )
 
+    # ---- post-upload processing ----
+    processing_status: Mapped[str] = mapped_column(
+        String(20), nullable=False, server_default=text("'PENDING'")
+    )
+    content_sha256: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )
+    sniffed_mime_type: Mapped[Optional[str]] = mapped_column(
+        String(100), nullable=True
+    )
+    page_count: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )
+    text_length: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )
+    processing_claimed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    processed_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    processing_error: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True
+    )
+
     # ---- relationships ----
     client: Mapped["ClientORM"] = relationship(
         "ClientORM", back_populates="documents", lazy="selectin"
@@ -0,0 +1,32 @@
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.base import Base
+
+
+class EventDailyCountORM(Base):
+    """ORM model for the event_daily_counts rollup.
+
+    Number of event_log rows per UTC day and event type, added in batches
+    by the EventCountRollup job.
+    """
+
+    __tablename__ = "event_daily_counts"
+
+    day: Mapped[date] = mapped_column(
+        Date, primary_key=True
+    )
+    event_type: Mapped[str] = mapped_column(
+        String(100), primary_key=True
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<EventDailyCountORM(day={self.day}, "
+            f"event_type='{self.event_type}', count={self.count})>"
+        )
@@ -2,7 +2,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import DateTime, ForeignKey, String, text
+from sqlalchemy import DateTime, ForeignKey, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -11,7 +11,11 @@ from app.infrastructure.database.base import Base
 
 
 class EventLogORM(Base):
-    """ORM model for the event_log table."""
+    """ORM model for the event_log table.
+
+    The table is range-partitioned by month on ``created_at`` (migration
+    013), so the primary key is ``(id, created_at)``.
+    """
 
     __tablename__ = "event_log"
 
@@ -26,6 +30,8 @@ class EventLogORM(Base):
     payload: Mapped[dict] = mapped_column(
         JSONB, nullable=False
     )
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    icon: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     client_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("clients.id"),
@@ -37,7 +43,10 @@ class EventLogORM(Base):
         nullable=True,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, server_default=func.now()
+        DateTime(timezone=True),
+        primary_key=True,
+        nullable=False,
+        server_default=func.now(),
     )
 
     def __repr__(self) -> str:
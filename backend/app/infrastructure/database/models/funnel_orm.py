@@ -0,0 +1,45 @@
+from datetime import date
+
+from sqlalchemy import BigInteger, Date, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.base import Base
+
+
+class StepFunnelCountORM(Base):
+    """ORM model for the step_funnel_counts projection.
+
+    Entered/completed/skipped counts per workflow step, keyed by the ISO
+    week the step was entered, the step's assigned role and whether the
+    workflow is online or offline; see ``app.domain.analytics.funnel``.
+    """
+
+    __tablename__ = "step_funnel_counts"
+
+    week_start: Mapped[date] = mapped_column(
+        Date, primary_key=True
+    )
+    step_id: Mapped[str] = mapped_column(
+        String(50), primary_key=True
+    )
+    assigned_role: Mapped[str] = mapped_column(
+        String(50), primary_key=True
+    )
+    channel: Mapped[str] = mapped_column(
+        String(10), primary_key=True
+    )
+    entered: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+    completed: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+    skipped: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<StepFunnelCountORM(week_start={self.week_start}, "
+            f"step_id='{self.step_id}', entered={self.entered})>"
+        )
@@ -0,0 +1,36 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class MetricCounterORM(Base):
+    """ORM model for the metric_counters table.
+
+    Each row is one named counter, optionally split by a dimension (for
+    example a status value or a calendar day).
+    """
+
+    __tablename__ = "metric_counters"
+
+    name: Mapped[str] = mapped_column(
+        String(64), primary_key=True
+    )
+    dimension: Mapped[str] = mapped_column(
+        String(100), primary_key=True, server_default=text("''")
+    )
+    value: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<MetricCounterORM(name='{self.name}', "
+            f"dimension='{self.dimension}', value={self.value})>"
+        )
@@ -0,0 +1,44 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import BigInteger, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.infrastructure.database.base import Base
+
+
+class ReplayCheckpointORM(Base):
+    """ORM model for the replay_checkpoints table.
+
+    One row per ``(name, partition)`` of an ``app.replay_events`` run: the
+    last event_log key handled in that client-id partition, so an
+    interrupted replay resumes where it stopped.
+    """
+
+    __tablename__ = "replay_checkpoints"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    partition: Mapped[int] = mapped_column(Integer, primary_key=True)
+    partitions: Mapped[int] = mapped_column(Integer, nullable=False)
+    until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    last_created_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), nullable=True
+    )
+    replayed: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ReplayCheckpointORM(name='{self.name}', partition={self.partition}, "
+            f"replayed={self.replayed})>"
+        )
@@ -0,0 +1,105 @@
+import uuid
+from datetime import date, datetime
+from typing import Optional
+
+from sqlalchemy import (
+    BigInteger,
+    Date,
+    DateTime,
+    Float,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.base import Base
+
+
+class StepTimingORM(Base):
+    """ORM model for the step_timings fact table.
+
+    One row per finished (completed or skipped) workflow step.
+    """
+
+    __tablename__ = "step_timings"
+    __table_args__ = (
+        UniqueConstraint(
+            "workflow_instance_id",
+            "step_id",
+            name="uq_step_timings_instance_step",
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    workflow_instance_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workflow_instances.id"),
+        nullable=False,
+    )
+    client_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("clients.id"),
+        nullable=False,
+    )
+    step_id: Mapped[str] = mapped_column(
+        String(50), nullable=False
+    )
+    outcome: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )
+    assigned_role: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )
+    employee_bucket: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )
+    started_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    finished_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    duration_seconds: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<StepTimingORM(step_id='{self.step_id}', outcome='{self.outcome}', "
+            f"duration_seconds={self.duration_seconds})>"
+        )
+
+
+class StepDurationSketchORM(Base):
+    """ORM model for the step_duration_sketches table.
+
+    Each row is one bucket of a log-bucketed duration sketch for a step,
+    ISO week and employee-count bucket; see
+    ``app.domain.analytics.duration_sketch``.
+    """
+
+    __tablename__ = "step_duration_sketches"
+
+    week_start: Mapped[date] = mapped_column(
+        Date, primary_key=True
+    )
+    step_id: Mapped[str] = mapped_column(
+        String(50), primary_key=True
+    )
+    employee_bucket: Mapped[str] = mapped_column(
+        String(20), primary_key=True
+    )
+    bucket_index: Mapped[int] = mapped_column(
+        Integer, primary_key=True
+    )
+    count: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default=text("0")
+    )
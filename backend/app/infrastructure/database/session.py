@@ -1,4 +1,5 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable
+from contextvars import ContextVar
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
@@ -24,8 +25,30 @@ async_session_factory = async_sessionmaker(
 )
 
 
+# Callbacks waiting for the current request's session to commit.
+_after_commit: ContextVar[list[Callable[[], None]] | None] = ContextVar(
+    "after_commit", default=None
+)
+
+
+def run_after_commit(callback: Callable[[], None]) -> None:
+    """Call *callback* once the current request's session has committed.
+
+    For event handlers, which run before the request commits.  Outside a
+    request (background jobs, scripts) *callback* is called straight away;
+    if the request fails it is not called at all.
+    """
+    callbacks = _after_commit.get()
+    if callbacks is None:
+        callback()
+    else:
+        callbacks.append(callback)
+
+
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency that yields an async database session."""
+    callbacks: list[Callable[[], None]] = []
+    _after_commit.set(callbacks)
     async with async_session_factory() as session:
         try:
             yield session
@@ -33,3 +56,5 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         except Exception:
             await session.rollback()
             raise
+    for callback in callbacks:
+        callback()
@@ -0,0 +1,56 @@
+"""Background jobs started from the application lifespan."""
+
+from app.infrastructure.jobs.alert_scanner import AlertScanner
+from app.infrastructure.jobs.event_count_rollup import EventCountRollup
+from app.infrastructure.jobs.event_log_compactor import EventLogCompactor
+from app.infrastructure.jobs.event_log_maintenance import EventLogMaintenance
+from app.infrastructure.jobs.metrics_reconciler import MetricsReconciler
+from app.infrastructure.jobs.periodic import PeriodicJob
+
+__all__ = [
+    "AlertScanner",
+    "EventCountRollup",
+    "EventLogCompactor",
+    "EventLogMaintenance",
+    "MetricsReconciler",
+    "PeriodicJob",
+    "setup_background_jobs",
+]
+
+
+def setup_background_jobs() -> list[PeriodicJob]:
+    """Build the periodic jobs; the caller starts and stops them."""
+    from app.config import settings
+    from app.infrastructure.database.session import async_session_factory
+    from app.infrastructure.storage.factory import get_file_storage
+
+    return [
+        AlertScanner(
+            async_session_factory,
+            interval_seconds=settings.ALERT_SCAN_INTERVAL_SECONDS,
+        ),
+        EventCountRollup(
+            async_session_factory,
+            interval_seconds=settings.EVENT_COUNT_ROLLUP_INTERVAL_SECONDS,
+            settle_seconds=settings.EVENT_COUNT_ROLLUP_SETTLE_SECONDS,
+        ),
+        EventLogCompactor(
+            async_session_factory,
+            interval_seconds=settings.EVENT_LOG_COMPACTION_INTERVAL_SECONDS,
+            age_days=settings.EVENT_LOG_COMPACTION_AGE_DAYS,
+            max_rows=settings.EVENT_LOG_COMPACTION_MAX_ROWS,
+        ),
+        EventLogMaintenance(
+            async_session_factory,
+            interval_seconds=settings.EVENT_LOG_MAINTENANCE_INTERVAL_SECONDS,
+            storage=get_file_storage(),
+            retention_months=settings.EVENT_LOG_RETENTION_MONTHS,
+            partitions_ahead=settings.EVENT_LOG_PARTITIONS_AHEAD,
+            archive_subfolder=settings.EVENT_LOG_ARCHIVE_SUBFOLDER,
+            batch_size=settings.EVENT_LOG_ARCHIVE_BATCH_SIZE,
+        ),
+        MetricsReconciler(
+            async_session_factory,
+            interval_seconds=settings.METRICS_RECONCILE_INTERVAL_SECONDS,
+        ),
+    ]
@@ -0,0 +1,35 @@
+"""Periodic SLA and stuck-step scanner."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.event_bus import event_bus
+from app.domain.services.alert_scan_service import AlertScanService
+from app.infrastructure.jobs.periodic import PeriodicJob
+
+
+class AlertScanner(PeriodicJob):
+    """Keeps the alerts table current and announces new breaches.
+
+    Events are published only after the scan commits, so handlers never
+    see an alert that was rolled back.
+    """
+
+    name = "alert-scanner"
+    lock_key = 0x616C7274  # "alrt"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._pending: list[DomainEvent] = []
+
+    async def run_once(self, session: AsyncSession) -> None:
+        self._pending = await AlertScanService(session).scan(
+            datetime.now(timezone.utc)
+        )
+
+    async def after_commit(self) -> None:
+        events, self._pending = self._pending, []
+        for event in events:
+            await event_bus.publish(event)
@@ -0,0 +1,36 @@
+"""Periodic compaction of step autosave events in event_log."""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.services.event_compaction_service import EventCompactionService
+from app.infrastructure.jobs.periodic import PeriodicJob
+
+logger = logging.getLogger(__name__)
+
+
+class EventLogCompactor(PeriodicJob):
+    """Merges runs of ``WorkflowStepSaved`` rows older than ``age_days``."""
+
+    name = "event-log-compactor"
+    lock_key = 0x636D7074  # "cmpt"
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncSession],
+        interval_seconds: float,
+        age_days: int,
+        max_rows: int,
+    ) -> None:
+        super().__init__(session_factory, interval_seconds)
+        self.age_days = age_days
+        self.max_rows = max_rows
+
+    async def run_once(self, session: AsyncSession) -> None:
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.age_days)
+        removed = await EventCompactionService(session).compact(cutoff, self.max_rows)
+        if removed:
+            logger.info(f"Compacted {removed} step save events")
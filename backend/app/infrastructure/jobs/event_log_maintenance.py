@@ -0,0 +1,126 @@
+"""Periodic creation, detachment and archival of event_log partitions."""
+
+import gzip
+import json
+import logging
+import tempfile
+from datetime import datetime, timezone
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.jobs.periodic import PeriodicJob
+from app.infrastructure.repositories.event_log_repo import (
+    EventLogRepository,
+    add_months,
+    partition_month,
+)
+from app.infrastructure.storage.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+
+class EventLogMaintenance(PeriodicJob):
+    """Keeps event_log partitioned ahead of time and within retention.
+
+    Each run creates the partitions for the current and next
+    ``partitions_ahead`` months, and for any month whose rows fell into
+    ``event_log_default`` meanwhile, and detaches those wholly older than
+    ``retention_months``.  Apart from moving rows out of the default
+    partition, which is normally empty, these are catalogue-only
+    operations, so the transaction holding the lock on event_log stays
+    short.
+
+    Detached partitions are archived after that commit, one at a time in
+    their own transaction: the rows are written to file storage as gzipped
+    JSON lines and the table is then dropped.  A failed archive leaves the
+    table in place to be retried on the next run.
+    """
+
+    name = "event-log-maintenance"
+    lock_key = 0x65766C67  # "evlg"
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncSession],
+        interval_seconds: float,
+        storage: FileStorage,
+        retention_months: int,
+        partitions_ahead: int,
+        archive_subfolder: str,
+        batch_size: int,
+    ) -> None:
+        super().__init__(session_factory, interval_seconds)
+        self._storage = storage
+        self.retention_months = retention_months
+        self.partitions_ahead = partitions_ahead
+        self.archive_subfolder = archive_subfolder
+        self.batch_size = batch_size
+
+    async def run_once(self, session: AsyncSession) -> None:
+        repo = EventLogRepository(session)
+        current = datetime.now(timezone.utc).date().replace(day=1)
+        for ahead in range(self.partitions_ahead + 1):
+            await repo.ensure_partition(add_months(current, ahead))
+        # Months that were missed while the job was not running.
+        for month in await repo.default_partition_months():
+            await repo.ensure_partition(month)
+
+        oldest_kept = add_months(current, -self.retention_months)
+        for name in await repo.list_partitions():
+            if partition_month(name) < oldest_kept:
+                await repo.detach_partition(name)
+                logger.info(f"Detached event_log partition {name}")
+
+    async def after_commit(self) -> None:
+        async with self._session_factory() as session:
+            names = await EventLogRepository(session).list_detached()
+        for name in names:
+            try:
+                await self._archive(name)
+            except Exception as e:
+                logger.error(f"Failed to archive event_log partition {name}: {e}")
+
+    async def _archive(self, name: str) -> None:
+        async with self._session_factory() as session:
+            acquired = await session.scalar(
+                text("SELECT pg_try_advisory_xact_lock(:key)"),
+                {"key": self.lock_key},
+            )
+            if not acquired:
+                return
+            repo = EventLogRepository(session)
+            if name not in await repo.list_detached():
+                return
+
+            # Spooled to a temporary file, so memory use does not grow with
+            # the size of the partition.
+            with tempfile.TemporaryFile() as spool:
+                count = 0
+                with gzip.GzipFile(fileobj=spool, mode="wb") as archive:
+                    async for row in repo.stream_table(name, self.batch_size):
+                        archive.write(_archive_line(row))
+                        count += 1
+                spool.seek(0)
+                path = await self._storage.save_file(
+                    spool, f"{name}.jsonl.gz", self.archive_subfolder
+                )
+            await repo.drop_table(name)
+            await session.commit()
+        logger.info(f"Archived {count} events from {name} to {path}")
+
+
+def _archive_line(row) -> bytes:
+    payload = row.payload
+    if isinstance(payload, str):
+        payload = json.loads(payload)
+    record = {
+        "id": str(row.id),
+        "event_type": row.event_type,
+        "payload": payload,
+        "client_id": str(row.client_id) if row.client_id else None,
+        "user_id": str(row.user_id) if row.user_id else None,
+        "created_at": row.created_at.isoformat(),
+    }
+    return json.dumps(record).encode() + b"\n"
@@ -0,0 +1,20 @@
+"""Periodic recomputation of the dashboard metric counters."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.jobs.periodic import PeriodicJob
+from app.infrastructure.repositories.metrics_repo import MetricsRepository
+
+
+class MetricsReconciler(PeriodicJob):
+    """Rebuilds metric_counters from the source tables.
+
+    Runs once at startup (so a fresh deployment has counters) and then on
+    an interval to correct any drift in the event-driven increments.
+    """
+
+    name = "metrics-reconciler"
+    lock_key = 0x6D657472  # "metr"
+
+    async def run_once(self, session: AsyncSession) -> None:
+        await MetricsRepository(session).reconcile()
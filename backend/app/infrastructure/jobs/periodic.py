@@ -0,0 +1,77 @@
+"""Base class for in-process periodic background jobs."""
+
+import abc
+import asyncio
+import logging
+from typing import Callable
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob(abc.ABC):
+    """Runs :meth:`run_once` every ``interval_seconds`` until stopped.
+
+    Each run gets its own session and transaction, committed on success.
+    When ``lock_key`` is set the run first takes a transaction-scoped
+    Postgres advisory lock and is skipped if another process holds it, so
+    only one application worker does the work per interval.
+    """
+
+    name: str = "periodic-job"
+    lock_key: int | None = None
+
+    def __init__(
+        self,
+        session_factory: Callable[..., AsyncSession],
+        interval_seconds: float,
+    ) -> None:
+        self._session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    @abc.abstractmethod
+    async def run_once(self, session: AsyncSession) -> None:
+        """Do one interval's work in *session*; the caller commits."""
+        ...
+
+    async def after_commit(self) -> None:
+        """Hook run once the work of :meth:`run_once` is committed."""
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop(), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+
+    async def tick(self) -> bool:
+        """Run the job once now; returns ``False`` if the lock was busy."""
+        async with self._session_factory() as session:
+            if self.lock_key is not None:
+                acquired = await session.scalar(
+                    text("SELECT pg_try_advisory_xact_lock(:key)"),
+                    {"key": self.lock_key},
+                )
+                if not acquired:
+                    return False
+            await self.run_once(session)
+            await session.commit()
+        await self.after_commit()
+        return True
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Background job {self.name} failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
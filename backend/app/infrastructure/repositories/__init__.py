@@ -1,11 +1,19 @@
+from app.infrastructure.repositories.alert_repo import AlertRepository
+from app.infrastructure.repositories.analytics_repo import AnalyticsRepository
 from app.infrastructure.repositories.client_repo import ClientRepository
 from app.infrastructure.repositories.access_repo import AccessRepository
 from app.infrastructure.repositories.workflow_repo import WorkflowRepository
 from app.infrastructure.repositories.document_repo import DocumentRepository
+from app.infrastructure.repositories.metrics_repo import MetricsRepository
+from app.infrastructure.repositories.event_log_repo import EventLogRepository
 
 __all__ = [
+    "AlertRepository",
+    "AnalyticsRepository",
     "ClientRepository",
     "AccessRepository",
     "WorkflowRepository",
     "DocumentRepository",
+    "MetricsRepository",
+    "EventLogRepository",
 ]
@@ -3,10 +3,12 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import func, or_, select, union
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.database.models.access_orm import ClientAccessORM
+from app.infrastructure.database.models.client_orm import ClientORM
+from app.infrastructure.database.models.user_orm import UserORM
 
 
 class AccessRepository:
@@ -31,6 +33,24 @@ class AccessRepository:
         )
         return list(result.scalars().all())
 
+    async def list_client_ids_for_user(self, user_id: UUID) -> set[UUID]:
+        """Return the ids of every client a user may work on.
+
+        That is each client with an access entry linked to the user (by
+        ``user_id``, or by email for invitations not yet accepted) and each
+        case assigned to them.
+        """
+        email = select(UserORM.email).where(UserORM.id == user_id).scalar_subquery()
+        entries = select(ClientAccessORM.client_id).where(
+            or_(
+                ClientAccessORM.user_id == user_id,
+                func.lower(ClientAccessORM.email) == func.lower(email),
+            )
+        )
+        owned = select(ClientORM.id).where(ClientORM.assigned_to_user_id == user_id)
+        result = await self.session.execute(union(entries, owned))
+        return set(result.scalars().all())
+
     async def create(
         self,
         client_id: UUID,
@@ -0,0 +1,262 @@
+"""Repository for SLA / stuck-step alerts and background job state."""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import Integer, Row, Select, cast, exists, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.infrastructure.database.models.alert_orm import AlertORM, JobStateORM
+from app.infrastructure.database.models.client_orm import ClientORM
+from app.infrastructure.database.models.workflow_orm import (
+    WorkflowInstanceORM,
+    WorkflowStepInstanceORM,
+)
+
+SLA = "SLA"
+STUCK_STEP = "STUCK_STEP"
+
+
+class AlertRepository:
+    """Handles all database operations for the alerts and job_state tables."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    # ------------------------------------------------------------------
+    # Job state
+    # ------------------------------------------------------------------
+
+    async def get_last_run(self, name: str) -> datetime | None:
+        result = await self.session.execute(
+            select(JobStateORM.last_run_at).where(JobStateORM.name == name)
+        )
+        return result.scalar_one_or_none()
+
+    async def set_last_run(self, name: str, at: datetime) -> None:
+        stmt = insert(JobStateORM).values(name=name, last_run_at=at)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[JobStateORM.name],
+            set_={"last_run_at": stmt.excluded.last_run_at},
+        )
+        await self.session.execute(stmt)
+
+    # ------------------------------------------------------------------
+    # Scanning source tables
+    # ------------------------------------------------------------------
+
+    async def clients_stale_between(
+        self, lower: datetime | None, upper: datetime
+    ) -> list[Row]:
+        """Clients whose ``updated_at`` is in ``[lower, upper)``.
+
+        Served by ``idx_clients_updated_at``.  ``lower=None`` scans from the
+        beginning (first run).
+        """
+        query = select(ClientORM.id, ClientORM.updated_at).where(
+            ClientORM.updated_at < upper
+        )
+        if lower is not None:
+            query = query.where(ClientORM.updated_at >= lower)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def steps_started_between(
+        self, lower: datetime | None, upper: datetime
+    ) -> list[Row]:
+        """IN_PROGRESS steps whose ``started_at`` is in ``[lower, upper)``.
+
+        Served by ``idx_workflow_steps_in_progress_started``.
+        """
+        query = (
+            select(
+                WorkflowStepInstanceORM.id,
+                WorkflowStepInstanceORM.workflow_instance_id,
+                WorkflowStepInstanceORM.step_id,
+                WorkflowStepInstanceORM.started_at,
+                WorkflowInstanceORM.client_id,
+            )
+            .join(
+                WorkflowInstanceORM,
+                WorkflowStepInstanceORM.workflow_instance_id == WorkflowInstanceORM.id,
+            )
+            .where(
+                WorkflowStepInstanceORM.status == "IN_PROGRESS",
+                WorkflowStepInstanceORM.started_at < upper,
+            )
+        )
+        if lower is not None:
+            query = query.where(WorkflowStepInstanceORM.started_at >= lower)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    # ------------------------------------------------------------------
+    # Maintaining alerts
+    # ------------------------------------------------------------------
+
+    async def open_alert(
+        self,
+        alert_type: str,
+        subject_id: UUID,
+        client_id: UUID,
+        severity: str,
+        reference_at: datetime,
+        step_id: str | None = None,
+    ) -> bool:
+        """Open an alert, or escalate the open one to ``critical``.
+
+        Returns ``True`` if a new alert was opened or an existing one was
+        escalated -- i.e. when there is something to notify about.
+        """
+        stmt = insert(AlertORM).values(
+            alert_type=alert_type,
+            subject_id=subject_id,
+            client_id=client_id,
+            step_id=step_id,
+            severity=severity,
+            reference_at=reference_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AlertORM.alert_type, AlertORM.subject_id],
+            index_where=AlertORM.resolved_at.is_(None),
+            set_={"severity": stmt.excluded.severity},
+            where=(stmt.excluded.severity == "critical")
+            & (AlertORM.severity != "critical"),
+        ).returning(AlertORM.id)
+        result = await self.session.execute(stmt)
+        return result.first() is not None
+
+    async def resolve_recovered(self) -> int:
+        """Resolve open alerts whose subject has moved on since they opened.
+
+        An SLA alert resolves once the client has been updated; a
+        stuck-step alert once the step leaves IN_PROGRESS or restarts.
+        Only open alerts are visited, so the cost tracks the alert count.
+        """
+        now = datetime.now(timezone.utc)
+        sla = await self.session.execute(
+            update(AlertORM)
+            .where(
+                AlertORM.alert_type == SLA,
+                AlertORM.resolved_at.is_(None),
+                AlertORM.subject_id == ClientORM.id,
+                ClientORM.updated_at != AlertORM.reference_at,
+            )
+            .values(resolved_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        stuck = await self.session.execute(
+            update(AlertORM)
+            .where(
+                AlertORM.alert_type == STUCK_STEP,
+                AlertORM.resolved_at.is_(None),
+                AlertORM.subject_id == WorkflowStepInstanceORM.id,
+                (WorkflowStepInstanceORM.status != "IN_PROGRESS")
+                | (WorkflowStepInstanceORM.started_at != AlertORM.reference_at),
+            )
+            .values(resolved_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        # Subjects that no longer exist at all.
+        orphans = await self.session.execute(
+            update(AlertORM)
+            .where(
+                AlertORM.alert_type == STUCK_STEP,
+                AlertORM.resolved_at.is_(None),
+                ~exists().where(WorkflowStepInstanceORM.id == AlertORM.subject_id),
+            )
+            .values(resolved_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        return (sla.rowcount or 0) + (stuck.rowcount or 0) + (orphans.rowcount or 0)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def _open_sla_query(
+        self, severity: str | None, assigned_to_user_id: UUID | None
+    ) -> Select:
+        query = (
+            select(AlertORM)
+            .join(ClientORM, ClientORM.id == AlertORM.client_id)
+            .where(AlertORM.alert_type == SLA, AlertORM.resolved_at.is_(None))
+        )
+        if severity:
+            query = query.where(AlertORM.severity == severity)
+        if assigned_to_user_id:
+            query = query.where(ClientORM.assigned_to_user_id == assigned_to_user_id)
+        return query
+
+    async def list_open_sla(
+        self,
+        severity: str | None = None,
+        assigned_to_user_id: UUID | None = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> list[Row]:
+        """Open SLA alerts, oldest first, with client name/status and days stale."""
+        query = (
+            self._open_sla_query(severity, assigned_to_user_id)
+            .with_only_columns(
+                AlertORM.client_id,
+                ClientORM.client_name,
+                ClientORM.status,
+                AlertORM.severity,
+                _days_since(AlertORM.reference_at).label("days_stale"),
+            )
+            .order_by(AlertORM.reference_at.asc())
+            .offset(offset)
+            .limit(limit)
+        )
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def count_open_sla(
+        self, severity: str | None = None, assigned_to_user_id: UUID | None = None
+    ) -> int:
+        query = self._open_sla_query(severity, assigned_to_user_id).with_only_columns(
+            func.count()
+        )
+        result = await self.session.execute(query)
+        return result.scalar() or 0
+
+    async def list_open_stuck(
+        self, step_id: str | None = None, limit: int = 50, offset: int = 0
+    ) -> list[Row]:
+        """Open stuck-step alerts, oldest first, with client name and days stuck."""
+        query = (
+            select(
+                AlertORM.client_id,
+                ClientORM.client_name,
+                AlertORM.step_id,
+                _days_since(AlertORM.reference_at).label("days_stuck"),
+            )
+            .join(ClientORM, ClientORM.id == AlertORM.client_id)
+            .where(AlertORM.alert_type == STUCK_STEP, AlertORM.resolved_at.is_(None))
+            .order_by(AlertORM.reference_at.asc())
+            .offset(offset)
+            .limit(limit)
+        )
+        if step_id:
+            query = query.where(AlertORM.step_id == step_id)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    async def count_open_stuck_by_step(self) -> dict[str, int]:
+        result = await self.session.execute(
+            select(AlertORM.step_id, func.count())
+            .where(AlertORM.alert_type == STUCK_STEP, AlertORM.resolved_at.is_(None))
+            .group_by(AlertORM.step_id)
+        )
+        return {step_id: count for step_id, count in result.all()}
+
+
+def _days_since(column: ColumnElement) -> ColumnElement:
+    """Whole days between *column* and now, computed in SQL."""
+    now = datetime.now(timezone.utc)
+    return cast(
+        func.floor(func.extract("epoch", literal(now) - column) / 86400), Integer
+    )
@@ -0,0 +1,206 @@
+"""Repository for step timing facts, duration sketches and the step funnel."""
+
+from datetime import date, datetime
+from uuid import UUID
+
+from sqlalchemy import Row, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models.client_orm import ClientORM
+from app.infrastructure.database.models.funnel_orm import StepFunnelCountORM
+from app.infrastructure.database.models.step_timing_orm import (
+    StepDurationSketchORM,
+    StepTimingORM,
+)
+from app.infrastructure.database.models.workflow_orm import (
+    WorkflowInstanceORM,
+    WorkflowStepInstanceORM,
+)
+
+
+class AnalyticsRepository:
+    """Handles all database operations for the step analytics tables."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def get_eligible_employees_by_client(
+        self, client_ids: list[UUID]
+    ) -> dict[UUID, int | None]:
+        if not client_ids:
+            return {}
+        result = await self.session.execute(
+            select(ClientORM.id, ClientORM.eligible_employees).where(
+                ClientORM.id.in_(client_ids)
+            )
+        )
+        return {row.id: row.eligible_employees for row in result.all()}
+
+    async def record_step_timings(
+        self, rows: list[dict]
+    ) -> set[tuple[UUID, str]]:
+        """Insert fact rows for finished steps in one statement.
+
+        Each row maps step_timings columns to values.  Returns the
+        ``(workflow_instance_id, step_id)`` of the rows inserted, so callers
+        do not count an already recorded step into the sketches twice.
+        """
+        if not rows:
+            return set()
+        result = await self.session.execute(
+            insert(StepTimingORM)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="uq_step_timings_instance_step")
+            .returning(StepTimingORM.workflow_instance_id, StepTimingORM.step_id)
+        )
+        return {(row.workflow_instance_id, row.step_id) for row in result.all()}
+
+    async def add_to_sketch(
+        self,
+        step_id: str,
+        week_start: date,
+        employee_bucket: str,
+        bucket_index: int,
+        count: int = 1,
+    ) -> None:
+        """Add *count* to one bucket of a step's weekly duration sketch."""
+        stmt = insert(StepDurationSketchORM).values(
+            step_id=step_id,
+            week_start=week_start,
+            employee_bucket=employee_bucket,
+            bucket_index=bucket_index,
+            count=count,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                StepDurationSketchORM.week_start,
+                StepDurationSketchORM.step_id,
+                StepDurationSketchORM.employee_bucket,
+                StepDurationSketchORM.bucket_index,
+            ],
+            set_={"count": StepDurationSketchORM.count + stmt.excluded.count},
+        )
+        await self.session.execute(stmt)
+
+    async def get_sketch_buckets(
+        self,
+        since_week: date,
+        step_id: str | None = None,
+        employee_bucket: str | None = None,
+    ) -> list[Row]:
+        """Return ``(step_id, week_start, bucket_index, count)`` rows.
+
+        Employee buckets are summed unless one is selected.
+        """
+        query = (
+            select(
+                StepDurationSketchORM.step_id,
+                StepDurationSketchORM.week_start,
+                StepDurationSketchORM.bucket_index,
+                func.sum(StepDurationSketchORM.count).label("count"),
+            )
+            .where(StepDurationSketchORM.week_start >= since_week)
+            .group_by(
+                StepDurationSketchORM.step_id,
+                StepDurationSketchORM.week_start,
+                StepDurationSketchORM.bucket_index,
+            )
+        )
+        if step_id:
+            query = query.where(StepDurationSketchORM.step_id == step_id)
+        if employee_bucket:
+            query = query.where(StepDurationSketchORM.employee_bucket == employee_bucket)
+        result = await self.session.execute(query)
+        return list(result.all())
+
+    # ------------------------------------------------------------------
+    # Step funnel
+    # ------------------------------------------------------------------
+
+    async def get_offline_flags(
+        self, workflow_instance_ids: list[UUID]
+    ) -> dict[UUID, bool]:
+        """Return ``{workflow_instance_id: is_offline}``."""
+        if not workflow_instance_ids:
+            return {}
+        result = await self.session.execute(
+            select(WorkflowInstanceORM.id, WorkflowInstanceORM.is_offline).where(
+                WorkflowInstanceORM.id.in_(workflow_instance_ids)
+            )
+        )
+        return {row.id: bool(row.is_offline) for row in result.all()}
+
+    async def get_step_roles(
+        self, workflow_instance_ids: list[UUID]
+    ) -> dict[tuple[UUID, str], str | None]:
+        """Return ``{(workflow_instance_id, step_id): assigned_role}``."""
+        if not workflow_instance_ids:
+            return {}
+        result = await self.session.execute(
+            select(
+                WorkflowStepInstanceORM.workflow_instance_id,
+                WorkflowStepInstanceORM.step_id,
+                WorkflowStepInstanceORM.assigned_role,
+            ).where(
+                WorkflowStepInstanceORM.workflow_instance_id.in_(workflow_instance_ids)
+            )
+        )
+        return {
+            (row.workflow_instance_id, row.step_id): row.assigned_role
+            for row in result.all()
+        }
+
+    async def add_funnel_counts(
+        self,
+        week_start: date,
+        step_id: str,
+        assigned_role: str | None,
+        channel: str,
+        entered: int = 0,
+        completed: int = 0,
+        skipped: int = 0,
+    ) -> None:
+        """Atomically add to one cell of the step funnel."""
+        stmt = insert(StepFunnelCountORM).values(
+            week_start=week_start,
+            step_id=step_id,
+            assigned_role=assigned_role or "",
+            channel=channel,
+            entered=entered,
+            completed=completed,
+            skipped=skipped,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                StepFunnelCountORM.week_start,
+                StepFunnelCountORM.step_id,
+                StepFunnelCountORM.assigned_role,
+                StepFunnelCountORM.channel,
+            ],
+            set_={
+                "entered": StepFunnelCountORM.entered + stmt.excluded.entered,
+                "completed": StepFunnelCountORM.completed + stmt.excluded.completed,
+                "skipped": StepFunnelCountORM.skipped + stmt.excluded.skipped,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def clear_funnel(self) -> None:
+        await self.session.execute(delete(StepFunnelCountORM))
+
+    async def get_funnel_rows(
+        self,
+        since_week: date,
+        channel: str | None = None,
+        assigned_role: str | None = None,
+    ) -> list[StepFunnelCountORM]:
+        query = select(StepFunnelCountORM).where(
+            StepFunnelCountORM.week_start >= since_week
+        )
+        if channel:
+            query = query.where(StepFunnelCountORM.channel == channel)
+        if assigned_role:
+            query = query.where(StepFunnelCountORM.assigned_role == assigned_role)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
@@ -1,15 +1,17 @@
 """Repository for Client entity data access."""
 
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Integer, Row, cast, func, literal, or_, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.infrastructure.database.models.client_orm import ClientORM
 from app.infrastructure.database.models.event_log_orm import EventLogORM
 from app.infrastructure.database.models.user_orm import UserORM
+from app.infrastructure.database.models.workflow_orm import WorkflowInstanceORM
 
 
 class ClientRepository:
@@ -25,6 +27,34 @@ class ClientRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_last_activity(self, client_id: UUID) -> datetime | None:
+        """Return when the most recent event for the client was logged."""
+        result = await self.session.execute(
+            select(EventLogORM.created_at)
+            .where(EventLogORM.client_id == client_id)
+            .order_by(EventLogORM.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_identity(self, client_id: UUID) -> Row | None:
+        """Return name, address, ``unique_id`` and ``updated_at`` for a client.
+
+        A column projection that skips the client's relationship graph.
+        """
+        result = await self.session.execute(
+            select(
+                ClientORM.client_name,
+                ClientORM.primary_address_street,
+                ClientORM.primary_address_city,
+                ClientORM.primary_address_state,
+                ClientORM.primary_address_zip,
+                ClientORM.unique_id,
+                ClientORM.updated_at,
+            ).where(ClientORM.id == client_id)
+        )
+        return result.one_or_none()
+
     async def list_clients(
         self,
         search: str | None = None,
@@ -38,63 +68,144 @@ class ClientRepository:
         sort_order: str = "asc",
     ) -> tuple[list[ClientORM], int]:
         """Return a paginated, filterable, sortable list of clients."""
-        query = select(ClientORM)
-        count_query = select(func.count()).select_from(ClientORM)
+        filters = self._list_filters(
+            search, status, assigned_to_user_id, stale, stale_threshold_days
+        )
+        query = (
+            select(ClientORM)
+            .where(*filters)
+            .order_by(self._list_ordering(sort_by, sort_order))
+            .offset((page - 1) * per_page)
+            .limit(per_page)
+        )
+        count_query = select(func.count()).select_from(ClientORM).where(*filters)
+
+        total_result = await self.session.execute(count_query)
+        total = total_result.scalar()
+
+        result = await self.session.execute(query)
+        clients = list(result.scalars().all())
+
+        return clients, total
+
+    async def stream_export_rows(
+        self,
+        search: str | None = None,
+        status: str | None = None,
+        assigned_to_user_id: UUID | None = None,
+        stale: bool | None = None,
+        stale_threshold_days: int = 7,
+        sort_by: str = "client_name",
+        sort_order: str = "asc",
+        batch_size: int = 5000,
+    ) -> AsyncIterator[list[Row]]:
+        """Yield every client matching the ``list_clients`` filters, in batches.
+
+        Rows are read through a server-side cursor, so memory is bounded by
+        *batch_size*.  Owner, offline flag, days since update and staleness
+        are computed in SQL; no ORM entities are built.
+        """
+        now = datetime.now(timezone.utc)
+        cutoff = now - timedelta(days=stale_threshold_days)
+        days_since_update = cast(
+            func.floor(
+                func.extract("epoch", literal(now) - ClientORM.updated_at) / 86400
+            ),
+            Integer,
+        )
+        is_offline = (
+            select(WorkflowInstanceORM.is_offline)
+            .where(WorkflowInstanceORM.client_id == ClientORM.id)
+            .order_by(WorkflowInstanceORM.created_at.desc())
+            .limit(1)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                ClientORM.id,
+                ClientORM.unique_id,
+                ClientORM.client_name,
+                ClientORM.status,
+                ClientORM.group_id,
+                ClientORM.eligible_employees,
+                ClientORM.primary_address_city,
+                ClientORM.primary_address_state,
+                ClientORM.created_at,
+                ClientORM.updated_at,
+                days_since_update.label("days_since_update"),
+                (ClientORM.updated_at < cutoff).label("is_stale"),
+                is_offline.label("is_offline"),
+                func.concat_ws(" ", UserORM.first_name, UserORM.last_name).label(
+                    "owner_name"
+                ),
+                UserORM.email.label("owner_email"),
+            )
+            .outerjoin(UserORM, UserORM.id == ClientORM.assigned_to_user_id)
+            .where(
+                *self._list_filters(
+                    search, status, assigned_to_user_id, stale, stale_threshold_days
+                )
+            )
+            .order_by(self._list_ordering(sort_by, sort_order), ClientORM.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(query)
+        async for partition in result.partitions():
+            yield partition
+
+    @staticmethod
+    def _list_filters(
+        search: str | None,
+        status: str | None,
+        assigned_to_user_id: UUID | None,
+        stale: bool | None,
+        stale_threshold_days: int,
+    ) -> list:
+        filters = []
 
         # -- Full-text-ish search across name and unique_id --
         if search:
-            search_filter = or_(
-                ClientORM.client_name.ilike(f"%{search}%"),
-                ClientORM.unique_id.ilike(f"%{search}%"),
+            filters.append(
+                or_(
+                    ClientORM.client_name.ilike(f"%{search}%"),
+                    ClientORM.unique_id.ilike(f"%{search}%"),
+                )
             )
-            query = query.where(search_filter)
-            count_query = count_query.where(search_filter)
 
         # -- Status filter --
         if status:
-            query = query.where(ClientORM.status == status)
-            count_query = count_query.where(ClientORM.status == status)
+            filters.append(ClientORM.status == status)
 
         # -- Owner filter --
         if assigned_to_user_id:
-            query = query.where(ClientORM.assigned_to_user_id == assigned_to_user_id)
-            count_query = count_query.where(ClientORM.assigned_to_user_id == assigned_to_user_id)
+            filters.append(ClientORM.assigned_to_user_id == assigned_to_user_id)
 
         # -- Stale filter --
         if stale is not None:
             cutoff = datetime.now(timezone.utc) - timedelta(days=stale_threshold_days)
             if stale:
-                query = query.where(ClientORM.updated_at < cutoff)
-                count_query = count_query.where(ClientORM.updated_at < cutoff)
+                filters.append(ClientORM.updated_at < cutoff)
             else:
-                query = query.where(ClientORM.updated_at >= cutoff)
-                count_query = count_query.where(ClientORM.updated_at >= cutoff)
-
-        # -- Sorting --
-        sort_column = getattr(ClientORM, sort_by, ClientORM.client_name)
-        if sort_order == "desc":
-            query = query.order_by(sort_column.desc())
-        else:
-            query = query.order_by(sort_column.asc())
+                filters.append(ClientORM.updated_at >= cutoff)
 
-        # -- Pagination --
-        query = query.offset((page - 1) * per_page).limit(per_page)
+        return filters
 
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar()
-
-        result = await self.session.execute(query)
-        clients = list(result.scalars().all())
-
-        return clients, total
+    @staticmethod
+    def _list_ordering(sort_by: str, sort_order: str):
+        sort_column = getattr(ClientORM, sort_by, ClientORM.client_name)
+        return sort_column.desc() if sort_order == "desc" else sort_column.asc()
 
-    async def update_status(self, client_id: UUID, status: str) -> ClientORM | None:
-        """Update the status field of an existing client."""
+    async def change_status(
+        self, client_id: UUID, status: str
+    ) -> tuple[ClientORM | None, str | None]:
+        """Update a client's status and return ``(client, previous_status)``."""
         client = await self.get_by_id(client_id)
-        if client:
-            client.status = status
-            await self.session.flush()
-        return client
+        if client is None:
+            return None, None
+        previous = client.status
+        client.status = status
+        await self.session.flush()
+        return client, previous
 
     async def assign_owner(self, client_id: UUID, user_id: UUID | None) -> ClientORM | None:
         """Assign (or unassign) an owner to a client."""
@@ -105,35 +216,106 @@ class ClientRepository:
             await self.session.refresh(client)
         return client
 
+    async def claim_owner(self, client_id: UUID, user_id: UUID) -> bool:
+        """Make *user_id* the owner of a client that has none.
+
+        Returns ``False`` if the client does not exist or is owned by
+        someone else.  Done in one conditional UPDATE, so two concurrent
+        claims cannot both succeed.
+        """
+        result = await self.session.execute(
+            update(ClientORM)
+            .where(
+                ClientORM.id == client_id,
+                or_(
+                    ClientORM.assigned_to_user_id.is_(None),
+                    ClientORM.assigned_to_user_id == user_id,
+                ),
+            )
+            .values(assigned_to_user_id=user_id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
     async def get_timeline_events(
         self,
         client_id: UUID,
         limit: int = 50,
         offset: int = 0,
         event_type: str | None = None,
-    ) -> tuple[list[tuple[EventLogORM, UserORM | None]], int]:
-        """Query event_log rows for a client with optional user info and event type filter."""
-        count_query = (
-            select(func.count())
-            .select_from(EventLogORM)
-            .where(EventLogORM.client_id == client_id)
-        )
+        before: tuple[datetime, UUID] | None = None,
+        include_total: bool = True,
+        step_id: str | None = None,
+    ) -> tuple[list[tuple[EventLogORM, UserORM | None]], int | None]:
+        """Query event_log rows for a client, newest first, with user info.
+
+        Pass *before* -- the ``(created_at, id)`` of the last row already
+        seen -- to page by keyset instead of *offset*; each page is then a
+        range scan on the (client_id[, event_type], created_at) indexes.
+        The total is ``None`` unless *include_total* is set.  *step_id*
+        matches ``payload->>'step_id'`` (``idx_event_log_payload_step``).
+        """
+        filters = [EventLogORM.client_id == client_id]
         if event_type:
-            count_query = count_query.where(EventLogORM.event_type == event_type)
-        total_result = await self.session.execute(count_query)
-        total = total_result.scalar()
+            filters.append(EventLogORM.event_type == event_type)
+        if step_id:
+            filters.append(EventLogORM.payload["step_id"].astext == step_id)
+
+        total = None
+        if include_total:
+            count_query = (
+                select(func.count()).select_from(EventLogORM).where(*filters)
+            )
+            total_result = await self.session.execute(count_query)
+            total = total_result.scalar()
 
         query = (
             select(EventLogORM, UserORM)
             .outerjoin(UserORM, EventLogORM.user_id == UserORM.id)
-            .where(EventLogORM.client_id == client_id)
-            .order_by(EventLogORM.created_at.desc())
-            .offset(offset)
+            .where(*filters)
+            .order_by(EventLogORM.created_at.desc(), EventLogORM.id.desc())
             .limit(limit)
         )
-        if event_type:
-            query = query.where(EventLogORM.event_type == event_type)
+        if before is not None:
+            query = query.where(
+                tuple_(EventLogORM.created_at, EventLogORM.id) < tuple_(*before)
+            )
+        elif offset:
+            query = query.offset(offset)
         result = await self.session.execute(query)
         rows = result.all()
 
         return [(row[0], row[1]) for row in rows], total
+
+    async def get_timeline_events_after(
+        self, client_id: UUID, after: tuple[datetime, UUID], limit: int
+    ) -> list[tuple[EventLogORM, UserORM | None]]:
+        """Event_log rows for a client after *after*, oldest first."""
+        result = await self.session.execute(
+            select(EventLogORM, UserORM)
+            .outerjoin(UserORM, EventLogORM.user_id == UserORM.id)
+            .where(
+                EventLogORM.client_id == client_id,
+                tuple_(EventLogORM.created_at, EventLogORM.id) > tuple_(*after),
+            )
+            .order_by(EventLogORM.created_at, EventLogORM.id)
+            .limit(limit)
+        )
+        return [(row[0], row[1]) for row in result.all()]
+
+    async def get_timeline_events_by_keys(
+        self, client_id: UUID, keys: list[tuple[datetime, UUID]]
+    ) -> list[tuple[EventLogORM, UserORM | None]]:
+        """Event_log rows for a client by ``(created_at, id)``, oldest first."""
+        if not keys:
+            return []
+        result = await self.session.execute(
+            select(EventLogORM, UserORM)
+            .outerjoin(UserORM, EventLogORM.user_id == UserORM.id)
+            .where(
+                EventLogORM.client_id == client_id,
+                tuple_(EventLogORM.created_at, EventLogORM.id).in_(keys),
+            )
+            .order_by(EventLogORM.created_at, EventLogORM.id)
+        )
+        return [(row[0], row[1]) for row in result.all()]
@@ -1,13 +1,23 @@
 """Repository for Document entity data access."""
 
+from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from app.infrastructure.database.models.document_orm import DocumentORM
 
 
+# Listings are mapped straight onto the ``Document`` model, which needs
+# neither relationship; skip the selectin cascade into the client graph.
+_LISTING_OPTIONS = (
+    raiseload(DocumentORM.client),
+    raiseload(DocumentORM.uploaded_by),
+)
+
+
 class DocumentRepository:
     """Handles all database operations for the documents table."""
 
@@ -30,6 +40,7 @@ class DocumentRepository:
                 DocumentORM.is_deleted.is_(False),
             )
             .order_by(DocumentORM.uploaded_at.desc())
+            .options(*_LISTING_OPTIONS)
         )
         return list(result.scalars().all())
 
@@ -44,9 +55,27 @@ class DocumentRepository:
                 DocumentORM.is_deleted.is_(False),
             )
             .order_by(DocumentORM.uploaded_at.desc())
+            .options(*_LISTING_OPTIONS)
         )
         return list(result.scalars().all())
 
+    async def latest_by_type(self, workflow_instance_id: UUID) -> list[Row]:
+        """Return the newest non-deleted document of each file type.
+
+        Rows carry ``id``, ``file_type`` and ``file_name`` only.  Served by
+        ``idx_documents_instance_type_uploaded``.
+        """
+        result = await self.session.execute(
+            select(DocumentORM.id, DocumentORM.file_type, DocumentORM.file_name)
+            .where(
+                DocumentORM.workflow_instance_id == workflow_instance_id,
+                DocumentORM.is_deleted.is_(False),
+            )
+            .distinct(DocumentORM.file_type)
+            .order_by(DocumentORM.file_type, DocumentORM.uploaded_at.desc())
+        )
+        return list(result.all())
+
     async def create(
         self,
         client_id: UUID,
@@ -86,3 +115,122 @@ class DocumentRepository:
         document.is_deleted = True
         await self.session.flush()
         return True
+
+    # ------------------------------------------------------------------
+    # Post-upload processing
+    # ------------------------------------------------------------------
+
+    async def claim_for_processing(
+        self, document_id: UUID
+    ) -> tuple[str, str, datetime] | None:
+        """Atomically move a PENDING document to PROCESSING.
+
+        Returns ``(file_path, file_name, claimed_at)`` for the claimed
+        document, or ``None`` if it does not exist (yet) or another worker
+        owns it.  ``claimed_at`` identifies the claim in later updates.
+        """
+        result = await self.session.execute(
+            update(DocumentORM)
+            .where(
+                DocumentORM.id == document_id,
+                DocumentORM.processing_status == "PENDING",
+            )
+            .values(
+                processing_status="PROCESSING",
+                processing_claimed_at=func.now(),
+            )
+            .returning(
+                DocumentORM.file_path,
+                DocumentORM.file_name,
+                DocumentORM.processing_claimed_at,
+            )
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return row.file_path, row.file_name, row.processing_claimed_at
+
+    async def renew_processing_claim(
+        self, document_id: UUID, claimed_at: datetime
+    ) -> datetime | None:
+        """Extend a claim that is still held; returns its new ``claimed_at``.
+
+        Returns ``None`` if the lease expired and the document was
+        reclaimed in the meantime.
+        """
+        result = await self.session.execute(
+            update(DocumentORM)
+            .where(
+                DocumentORM.id == document_id,
+                DocumentORM.processing_status == "PROCESSING",
+                DocumentORM.processing_claimed_at == claimed_at,
+            )
+            .values(processing_claimed_at=func.clock_timestamp())
+            .returning(DocumentORM.processing_claimed_at)
+        )
+        return result.scalar_one_or_none()
+
+    async def update_processing(
+        self,
+        document_id: UUID,
+        claimed_at: datetime,
+        status: str,
+        content_sha256: str | None = None,
+        sniffed_mime_type: str | None = None,
+        page_count: int | None = None,
+        text_length: int | None = None,
+        processing_error: str | None = None,
+    ) -> bool:
+        """Record the outcome of processing a document.
+
+        Only applies while the claim made at *claimed_at* is still held;
+        returns ``False`` if it was lost to another worker.
+        """
+        result = await self.session.execute(
+            update(DocumentORM)
+            .where(
+                DocumentORM.id == document_id,
+                DocumentORM.processing_status == "PROCESSING",
+                DocumentORM.processing_claimed_at == claimed_at,
+            )
+            .values(
+                processing_status=status,
+                content_sha256=content_sha256,
+                sniffed_mime_type=sniffed_mime_type,
+                page_count=page_count,
+                text_length=text_length,
+                processing_error=processing_error,
+                processed_at=datetime.now(timezone.utc),
+            )
+        )
+        return bool(result.rowcount)
+
+    async def reset_stale_processing(self, lease_seconds: float) -> int:
+        """Return PROCESSING documents whose lease has expired to PENDING.
+
+        Those are documents whose worker died (e.g. in a restart); younger
+        claims may belong to a live worker in another process.
+        """
+        expired = func.now() - timedelta(seconds=lease_seconds)
+        result = await self.session.execute(
+            update(DocumentORM)
+            .where(
+                DocumentORM.processing_status == "PROCESSING",
+                or_(
+                    DocumentORM.processing_claimed_at.is_(None),
+                    DocumentORM.processing_claimed_at < expired,
+                ),
+            )
+            .values(processing_status="PENDING", processing_claimed_at=None)
+        )
+        return result.rowcount or 0
+
+    async def list_pending_processing(self, limit: int) -> list[UUID]:
+        """Return ids of documents still waiting to be processed, oldest first."""
+        result = await self.session.execute(
+            select(DocumentORM.id)
+            .where(DocumentORM.processing_status == "PENDING")
+            .order_by(DocumentORM.uploaded_at)
+            .limit(limit)
+        )
+        return list(result.scalars().all())
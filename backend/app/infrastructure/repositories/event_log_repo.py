@@ -0,0 +1,372 @@
+"""Repository for event_log notifications, replay, compaction and partitions.
+
+Partitions are named ``event_log_pYYYY_MM`` and cover one UTC calendar
+month each.  Table names are only ever built from dates or checked
+against :data:`PARTITION_NAME`, so they are safe to interpolate into DDL.
+"""
+
+import json
+import re
+from datetime import date, datetime, time, timezone
+from typing import AsyncIterator
+from uuid import UUID
+
+from sqlalchemy import Row, String, cast, delete, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models.event_log_orm import EventLogORM
+from app.infrastructure.database.models.replay_checkpoint_orm import (
+    ReplayCheckpointORM,
+)
+from app.infrastructure.database.models.user_orm import UserORM
+
+PARTITION_NAME = re.compile(r"^event_log_p(\d{4})_(\d{2})$")
+
+# Catches rows for months whose partition does not exist yet.
+DEFAULT_PARTITION = "event_log_default"
+
+# NOTIFY channel announcing committed event_log rows (see event_log_listener).
+EVENT_LOG_CHANNEL = "event_log_appended"
+
+
+def add_months(month: date, months: int) -> date:
+    """First day of the month *months* after *month* (may be negative)."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"event_log_p{month.year:04d}_{month.month:02d}"
+
+
+def partition_month(name: str) -> date:
+    match = PARTITION_NAME.match(name)
+    if match is None:
+        raise ValueError(f"Not an event_log partition: {name}")
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _month_bound(month: date) -> str:
+    return datetime.combine(month, time(), tzinfo=timezone.utc).isoformat()
+
+
+class EventLogRepository:
+    """Announces, replays, compacts and partitions event_log rows."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def notify_appended(
+        self, event_id: UUID, client_id: UUID, created_at: datetime
+    ) -> None:
+        """Queue a notification for a new row, delivered when this commits."""
+        payload = json.dumps({
+            "id": str(event_id),
+            "client_id": str(client_id),
+            "created_at": created_at.isoformat(),
+        })
+        await self.session.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": EVENT_LOG_CHANNEL, "payload": payload},
+        )
+
+    async def list_step_saves(
+        self, client_id: UUID, step_id: str
+    ) -> list[tuple[EventLogORM, str | None, str | None]]:
+        """A step's ``WorkflowStepSaved`` rows, oldest first, with user names.
+
+        Served by ``idx_event_log_payload_step``.
+        """
+        result = await self.session.execute(
+            select(EventLogORM, UserORM.first_name, UserORM.last_name)
+            .outerjoin(UserORM, EventLogORM.user_id == UserORM.id)
+            .where(
+                EventLogORM.client_id == client_id,
+                EventLogORM.payload["step_id"].astext == step_id,
+                EventLogORM.event_type == "WorkflowStepSaved",
+            )
+            .order_by(EventLogORM.created_at, EventLogORM.id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    async def stream_for_replay(
+        self,
+        event_types: list[str],
+        partition: int,
+        partitions: int,
+        after: tuple[datetime, UUID] | None,
+        until: datetime,
+        batch_size: int,
+    ) -> AsyncIterator[Row]:
+        """Yield rows of one client-id partition in ``(created_at, id)`` order.
+
+        Rows are split into *partitions* by a hash of ``client_id`` so each
+        client's events stay in one partition, in order.  Only rows created
+        before *until* and after the *after* key are read.
+        """
+        query = (
+            select(
+                EventLogORM.id,
+                EventLogORM.event_type,
+                EventLogORM.payload,
+                EventLogORM.created_at,
+            )
+            .where(
+                EventLogORM.event_type.in_(event_types),
+                EventLogORM.created_at < until,
+            )
+            .order_by(EventLogORM.created_at, EventLogORM.id)
+            .execution_options(yield_per=batch_size)
+        )
+        if partitions > 1:
+            client_key = func.coalesce(cast(EventLogORM.client_id, String), "")
+            query = query.where(
+                func.abs(func.hashtext(client_key) % partitions) == partition
+            )
+        if after is not None:
+            query = query.where(
+                tuple_(EventLogORM.created_at, EventLogORM.id) > tuple_(*after)
+            )
+        result = await self.session.stream(query)
+        async for row in result:
+            yield row
+
+    async def get_checkpoints(self, name: str) -> list[ReplayCheckpointORM]:
+        result = await self.session.execute(
+            select(ReplayCheckpointORM)
+            .where(ReplayCheckpointORM.name == name)
+            .order_by(ReplayCheckpointORM.partition)
+        )
+        return list(result.scalars().all())
+
+    async def save_checkpoint(
+        self,
+        name: str,
+        partition: int,
+        partitions: int,
+        until: datetime,
+        last: tuple[datetime, UUID] | None,
+        replayed: int,
+    ) -> None:
+        last_created_at, last_id = last if last is not None else (None, None)
+        stmt = insert(ReplayCheckpointORM).values(
+            name=name,
+            partition=partition,
+            partitions=partitions,
+            until=until,
+            last_created_at=last_created_at,
+            last_id=last_id,
+            replayed=replayed,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ReplayCheckpointORM.name, ReplayCheckpointORM.partition],
+            set_={
+                "last_created_at": stmt.excluded.last_created_at,
+                "last_id": stmt.excluded.last_id,
+                "replayed": stmt.excluded.replayed,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def clear_checkpoints(self, name: str) -> None:
+        await self.session.execute(
+            delete(ReplayCheckpointORM).where(ReplayCheckpointORM.name == name)
+        )
+
+    # ------------------------------------------------------------------
+    # Compaction
+    # ------------------------------------------------------------------
+
+    async def first_event_at(self, event_type: str) -> datetime | None:
+        result = await self.session.execute(
+            select(func.min(EventLogORM.created_at)).where(
+                EventLogORM.event_type == event_type
+            )
+        )
+        return result.scalar()
+
+    async def clients_with_events_between(
+        self, event_type: str, lower: datetime, upper: datetime
+    ) -> list[UUID]:
+        """Clients with an *event_type* row created in ``[lower, upper)``."""
+        result = await self.session.execute(
+            select(EventLogORM.client_id)
+            .where(
+                EventLogORM.event_type == event_type,
+                EventLogORM.client_id.isnot(None),
+                EventLogORM.created_at >= lower,
+                EventLogORM.created_at < upper,
+            )
+            .distinct()
+        )
+        return list(result.scalars().all())
+
+    async def list_client_events_between(
+        self, client_id: UUID, lower: datetime, upper: datetime
+    ) -> list[EventLogORM]:
+        """A client's rows created in ``[lower, upper)``, oldest first.
+
+        Like :meth:`get_client_event_before`, refreshes rows already in the
+        session, since :meth:`rewrite_event` bypasses the identity map.
+        """
+        result = await self.session.execute(
+            select(EventLogORM)
+            .where(
+                EventLogORM.client_id == client_id,
+                EventLogORM.created_at >= lower,
+                EventLogORM.created_at < upper,
+            )
+            .order_by(EventLogORM.created_at, EventLogORM.id)
+            .execution_options(populate_existing=True)
+        )
+        return list(result.scalars().all())
+
+    async def get_client_event_before(
+        self, client_id: UUID, before: datetime
+    ) -> EventLogORM | None:
+        """The client's latest row created before *before*.
+
+        Loaded with ``populate_existing`` so a head rewritten earlier in
+        the same transaction by :meth:`rewrite_event` comes back with its
+        new payload, not the stale one held in the identity map.
+        """
+        result = await self.session.execute(
+            select(EventLogORM)
+            .where(
+                EventLogORM.client_id == client_id,
+                EventLogORM.created_at < before,
+            )
+            .order_by(EventLogORM.created_at.desc(), EventLogORM.id.desc())
+            .limit(1)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def rewrite_event(
+        self,
+        key: tuple[datetime, UUID],
+        payload: dict,
+        description: str,
+        icon: str,
+    ) -> None:
+        await self.session.execute(
+            update(EventLogORM)
+            .where(tuple_(EventLogORM.created_at, EventLogORM.id) == tuple_(*key))
+            .values(payload=payload, description=description, icon=icon)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_events(self, keys: list[tuple[datetime, UUID]]) -> None:
+        if not keys:
+            return
+        await self.session.execute(
+            delete(EventLogORM)
+            .where(tuple_(EventLogORM.created_at, EventLogORM.id).in_(keys))
+            .execution_options(synchronize_session=False)
+        )
+
+    # ------------------------------------------------------------------
+    # Partitions
+    # ------------------------------------------------------------------
+
+    async def ensure_partition(self, month: date) -> None:
+        """Create the partition for the month starting *month* if missing.
+
+        Rows for that month already caught by ``event_log_default`` are
+        moved into the new partition before it is attached; Postgres
+        refuses to attach a range that the default partition still holds
+        rows for.
+        """
+        month = month.replace(day=1)
+        name = partition_name(month)
+        exists = await self.session.scalar(
+            text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+        )
+        if exists:
+            return
+
+        lower, upper = _month_bound(month), _month_bound(add_months(month, 1))
+        await self.session.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE event_log INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"WITH moved AS ("
+                f"DELETE FROM {DEFAULT_PARTITION} "
+                f"WHERE created_at >= '{lower}' AND created_at < '{upper}' "
+                f"RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            )
+        )
+        await self.session.execute(
+            text(
+                f"ALTER TABLE event_log ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+        )
+
+    async def default_partition_months(self) -> list[date]:
+        """Months with rows in ``event_log_default``, oldest first."""
+        result = await self.session.execute(
+            text(
+                f"SELECT DISTINCT date_trunc('month', timezone('UTC', created_at))::date "
+                f"FROM {DEFAULT_PARTITION} ORDER BY 1"
+            )
+        )
+        return list(result.scalars().all())
+
+    async def list_partitions(self) -> list[str]:
+        """Names of the partitions currently attached to event_log."""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'event_log'::regclass "
+                "ORDER BY c.relname"
+            )
+        )
+        return [name for name in result.scalars() if PARTITION_NAME.match(name)]
+
+    async def list_detached(self) -> list[str]:
+        """Partition tables that have been detached but not yet dropped."""
+        result = await self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_class c "
+                "JOIN pg_namespace n ON n.oid = c.relnamespace "
+                "WHERE n.nspname = current_schema() AND c.relkind = 'r' "
+                "AND NOT c.relispartition AND c.relname LIKE 'event\\_log\\_p%' "
+                "ORDER BY c.relname"
+            )
+        )
+        return [name for name in result.scalars() if PARTITION_NAME.match(name)]
+
+    async def detach_partition(self, name: str) -> None:
+        partition_month(name)
+        await self.session.execute(
+            text(f"ALTER TABLE event_log DETACH PARTITION {name}")
+        )
+
+    async def stream_table(self, name: str, batch_size: int) -> AsyncIterator[Row]:
+        """Yield every row of a (detached) partition in ``created_at`` order."""
+        partition_month(name)
+        result = await self.session.stream(
+            text(
+                f"SELECT id, event_type, payload, client_id, user_id, created_at "
+                f"FROM {name} ORDER BY created_at"
+            ).execution_options(yield_per=batch_size)
+        )
+        async for row in result:
+            yield row
+
+    async def drop_table(self, name: str) -> None:
+        partition_month(name)
+        await self.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
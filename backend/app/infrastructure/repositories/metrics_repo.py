@@ -0,0 +1,163 @@
+"""Repository for the metric_counters and event_daily_counts aggregates."""
+
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.database.models.client_orm import ClientORM
+from app.infrastructure.database.models.event_daily_count_orm import EventDailyCountORM
+from app.infrastructure.database.models.event_log_orm import EventLogORM
+from app.infrastructure.database.models.metric_counter_orm import MetricCounterORM
+from app.infrastructure.database.models.workflow_orm import WorkflowInstanceORM
+
+# Counter names
+CASES_BY_STATUS = "cases_by_status"          # dimension: client status
+COMPLETED_WORKFLOWS = "completed_workflows"  # no dimension
+CYCLE_TIME_SECONDS = "cycle_time_seconds"    # no dimension; sum over completed
+SUBMISSIONS_BY_DAY = "submissions_by_day"    # dimension: ISO date (UTC)
+
+# Daily submission counters older than this are pruned on reconciliation.
+SUBMISSION_RETENTION_DAYS = 35
+
+
+class MetricsRepository:
+    """Handles all database operations for the aggregate tables."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def increment(self, name: str, dimension: str = "", delta: int = 1) -> None:
+        """Atomically add *delta* to a counter, creating it if needed."""
+        stmt = insert(MetricCounterORM).values(
+            name=name, dimension=dimension, value=delta
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[MetricCounterORM.name, MetricCounterORM.dimension],
+            set_={
+                "value": MetricCounterORM.value + stmt.excluded.value,
+                "updated_at": func.now(),
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def get_all(self) -> dict[str, dict[str, int]]:
+        """Return every counter as ``{name: {dimension: value}}``."""
+        result = await self.session.execute(
+            select(
+                MetricCounterORM.name,
+                MetricCounterORM.dimension,
+                MetricCounterORM.value,
+            )
+        )
+        counters: dict[str, dict[str, int]] = {}
+        for name, dimension, value in result.all():
+            counters.setdefault(name, {})[dimension] = value
+        return counters
+
+    async def replace(self, name: str, values: dict[str, int]) -> None:
+        """Overwrite every dimension of counter *name* with *values*."""
+        await self.session.execute(
+            delete(MetricCounterORM).where(MetricCounterORM.name == name)
+        )
+        if values:
+            await self.session.execute(
+                insert(MetricCounterORM),
+                [
+                    {"name": name, "dimension": dimension, "value": value}
+                    for dimension, value in values.items()
+                ],
+            )
+
+    async def reconcile(self) -> None:
+        """Recompute every counter from the source tables.
+
+        Corrects drift from events whose transaction later rolled back, or
+        from changes made outside the application.
+        """
+        status_result = await self.session.execute(
+            select(ClientORM.status, func.count()).group_by(ClientORM.status)
+        )
+        await self.replace(
+            CASES_BY_STATUS, {status: count for status, count in status_result.all()}
+        )
+
+        cycle_result = await self.session.execute(
+            select(
+                func.count(),
+                func.coalesce(
+                    func.sum(
+                        func.extract("epoch", WorkflowInstanceORM.completed_at)
+                        - func.extract("epoch", WorkflowInstanceORM.started_at)
+                    ),
+                    0,
+                ),
+            ).where(
+                WorkflowInstanceORM.completed_at.isnot(None),
+                WorkflowInstanceORM.started_at.isnot(None),
+            )
+        )
+        completed, total_seconds = cycle_result.one()
+        await self.replace(COMPLETED_WORKFLOWS, {"": completed})
+        await self.replace(CYCLE_TIME_SECONDS, {"": int(total_seconds)})
+
+        # Daily submissions come from the event_daily_counts rollup, which
+        # trails event_log by at most a rollup interval, rather than from the
+        # raw log.
+        since = datetime.now(timezone.utc).date() - timedelta(
+            days=SUBMISSION_RETENTION_DAYS
+        )
+        submissions = await self.get_event_counts(since, ["WorkflowSubmitted"])
+        await self.replace(
+            SUBMISSIONS_BY_DAY,
+            {d.isoformat(): count for d, _, count in submissions},
+        )
+
+    async def roll_up_event_counts(self, since: datetime, until: datetime) -> None:
+        """Add the event_log rows created in ``[since, until)`` to the rollup.
+
+        One grouped insert per call, so each ``(day, event_type)`` row is
+        written once per run however many events it covers.  The caller
+        must not pass overlapping ranges.
+        """
+        day = func.date(func.timezone("UTC", EventLogORM.created_at))
+        counts = (
+            select(day, EventLogORM.event_type, func.count())
+            .where(
+                EventLogORM.created_at >= since,
+                EventLogORM.created_at < until,
+            )
+            .group_by(day, EventLogORM.event_type)
+        )
+        stmt = insert(EventDailyCountORM).from_select(
+            ["day", "event_type", "count"], counts
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[EventDailyCountORM.day, EventDailyCountORM.event_type],
+            set_={"count": EventDailyCountORM.count + stmt.excluded.count},
+        )
+        await self.session.execute(stmt)
+
+    async def get_event_counts(
+        self, since: date, event_types: list[str]
+    ) -> list[tuple[date, str, int]]:
+        """Return ``(day, event_type, count)`` for days on or after *since*."""
+        result = await self.session.execute(
+            select(
+                EventDailyCountORM.day,
+                EventDailyCountORM.event_type,
+                EventDailyCountORM.count,
+            ).where(
+                EventDailyCountORM.day >= since,
+                EventDailyCountORM.event_type.in_(event_types),
+            )
+        )
+        return [tuple(row) for row in result.all()]
+
+    @staticmethod
+    def day_key(value: date | datetime) -> str:
+        """Dimension value for a per-day counter (UTC calendar day)."""
+        if isinstance(value, datetime):
+            value = value.astimezone(timezone.utc).date()
+        return value.isoformat()
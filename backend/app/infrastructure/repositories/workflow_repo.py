@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -53,6 +53,22 @@ class WorkflowRepository:
         )
         return result.scalar_one_or_none()
 
+    async def get_instance_summary_by_client(self, client_id: UUID) -> Row | None:
+        """Return ``(id, status, is_offline)`` for a client's workflow instance.
+
+        A column projection for hot paths that only need to know which
+        instance exists and where it stands, without loading steps or the
+        client graph.
+        """
+        result = await self.session.execute(
+            select(
+                WorkflowInstanceORM.id,
+                WorkflowInstanceORM.status,
+                WorkflowInstanceORM.is_offline,
+            ).where(WorkflowInstanceORM.client_id == client_id)
+        )
+        return result.one_or_none()
+
     async def create_instance(
         self, client_id: UUID, definition_id: UUID
     ) -> WorkflowInstanceORM:
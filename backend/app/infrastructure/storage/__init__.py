@@ -1,11 +1,25 @@
+from app.infrastructure.storage.caching_storage import CachingFileStorage
+from app.infrastructure.storage.factory import get_file_storage
 from app.infrastructure.storage.file_storage import (
     FileStorage,
     LocalFileStorage,
     S3FileStorage,
 )
+from app.infrastructure.storage.template_catalogue import (
+    TEMPLATE_FILES,
+    TemplateAsset,
+    TemplateCatalogue,
+    get_template_catalogue,
+)
 
 __all__ = [
+    "TEMPLATE_FILES",
+    "CachingFileStorage",
     "FileStorage",
     "LocalFileStorage",
     "S3FileStorage",
+    "TemplateAsset",
+    "TemplateCatalogue",
+    "get_file_storage",
+    "get_template_catalogue",
 ]
@@ -0,0 +1,221 @@
+"""Read-through local disk cache for remote storage backends.
+
+Wraps any :class:`FileStorage` and keeps recently read files on local disk
+in a size-bounded LRU, so repeat downloads (offline packet review, the
+documents dialog) are served without a remote fetch.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+import aiofiles
+
+from app.infrastructure.storage.file_storage import FileStorage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _CacheEntry:
+    content_hash: str
+    size: int
+
+
+class CachingFileStorage(FileStorage):
+    """Decorate a storage backend with an on-disk LRU cache.
+
+    Entries are keyed by storage path and stored on disk under the SHA-256
+    of their content, so identical files uploaded under different paths
+    share one cached copy.  Writes go through to the backend and warm the
+    cache; deletes invalidate the entry.
+    """
+
+    def __init__(
+        self, backend: FileStorage, cache_dir: str, max_bytes: int
+    ) -> None:
+        self.backend = backend
+        # The index lives in this process's memory, so each process (e.g.
+        # each uvicorn worker) keeps its blobs in its own subdirectory and
+        # never touches another's.
+        self.cache_dir = Path(cache_dir) / str(os.getpid())
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._refcounts: dict[str, int] = {}
+        self._total_bytes = 0
+        self._lock = asyncio.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        # Anything left over from an earlier process with the same pid is
+        # unreachable -- start from an empty directory.
+        self._remove_blobs()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # FileStorage interface
+    # ------------------------------------------------------------------
+
+    async def save(
+        self, file_content: bytes, filename: str, subfolder: str = ""
+    ) -> str:
+        """Write through to the backend and warm the cache with the content."""
+        file_path = await self.backend.save(file_content, filename, subfolder)
+        await self._store(file_path, file_content)
+        return file_path
+
+    async def save_file(
+        self, source: BinaryIO, filename: str, subfolder: str = ""
+    ) -> str:
+        """Write through to the backend without caching the (large) content."""
+        file_path = await self.backend.save_file(source, filename, subfolder)
+        async with self._lock:
+            self._evict(file_path)
+        return file_path
+
+    async def delete(self, file_path: str) -> bool:
+        """Delete from the backend and invalidate the cached copy."""
+        async with self._lock:
+            self._evict(file_path)
+        return await self.backend.delete(file_path)
+
+    async def get(self, file_path: str) -> bytes:
+        """Serve from local disk when cached, otherwise fetch and cache."""
+        async with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None:
+                self._entries.move_to_end(file_path)
+
+        if entry is not None:
+            try:
+                async with aiofiles.open(self._blob_path(entry.content_hash), "rb") as f:
+                    content = await f.read()
+                self.hits += 1
+                return content
+            except FileNotFoundError:
+                # Blob removed underneath us -- fall through to the backend.
+                async with self._lock:
+                    self._evict(file_path)
+
+        self.misses += 1
+        content = await self.backend.get(file_path)
+        await self._store(file_path, content)
+        return content
+
+    def close(self) -> None:
+        """Empty the cache and remove this process's blobs from disk."""
+        self._entries.clear()
+        self._refcounts.clear()
+        self._total_bytes = 0
+        self._remove_blobs()
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict[str, int | float]:
+        """Return hit/miss counters and current cache occupancy."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _blob_path(self, content_hash: str) -> Path:
+        return self.cache_dir / content_hash
+
+    async def _store(self, file_path: str, content: bytes) -> None:
+        """Add *content* under *file_path*, evicting LRU entries to fit.
+
+        The blob is written to a temporary file first; the index entry is
+        only added, and the blob moved into place, under the lock once the
+        write has finished, so an eviction in between cannot leave an
+        unindexed blob behind.
+        """
+        size = len(content)
+        if size > self.max_bytes:
+            return
+
+        content_hash = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(content_hash)
+
+        async with self._lock:
+            current = self._entries.get(file_path)
+            if current is not None and current.content_hash == content_hash:
+                self._entries.move_to_end(file_path)
+                return
+            needs_write = self._refcounts.get(content_hash, 0) == 0
+
+        tmp_path = None
+        if needs_write:
+            tmp_path = blob_path.with_name(f"{content_hash}.{uuid.uuid4().hex}.tmp")
+            try:
+                async with aiofiles.open(tmp_path, "wb") as f:
+                    await f.write(content)
+            except OSError as e:
+                logger.warning(f"Failed to populate file cache for {file_path}: {e}")
+                tmp_path.unlink(missing_ok=True)
+                return
+
+        async with self._lock:
+            self._evict(file_path)
+            if self._refcounts.get(content_hash, 0) == 0:
+                if tmp_path is None:
+                    # The shared blob was evicted while we were not looking.
+                    return
+                while self._entries and self._total_bytes + size > self.max_bytes:
+                    oldest = next(iter(self._entries))
+                    self._evict(oldest)
+                    self.evictions += 1
+                try:
+                    os.replace(tmp_path, blob_path)
+                except OSError as e:
+                    logger.warning(f"Failed to populate file cache for {file_path}: {e}")
+                    tmp_path.unlink(missing_ok=True)
+                    return
+                self._total_bytes += size
+            elif tmp_path is not None:
+                # Another request cached the same content meanwhile.
+                tmp_path.unlink(missing_ok=True)
+
+            self._entries[file_path] = _CacheEntry(content_hash, size)
+            self._refcounts[content_hash] = self._refcounts.get(content_hash, 0) + 1
+
+    def _remove_blobs(self) -> None:
+        if not self.cache_dir.is_dir():
+            return
+        for leftover in self.cache_dir.iterdir():
+            if leftover.is_file():
+                leftover.unlink(missing_ok=True)
+
+    def _evict(self, file_path: str) -> None:
+        """Drop *file_path* from the index; remove its blob once unreferenced.
+
+        Caller must hold ``self._lock``.
+        """
+        entry = self._entries.pop(file_path, None)
+        if entry is None:
+            return
+        remaining = self._refcounts.get(entry.content_hash, 0) - 1
+        if remaining > 0:
+            self._refcounts[entry.content_hash] = remaining
+            return
+        self._refcounts.pop(entry.content_hash, None)
+        self._total_bytes -= entry.size
+        self._blob_path(entry.content_hash).unlink(missing_ok=True)
@@ -0,0 +1,27 @@
+"""Process-wide file storage selection."""
+
+from functools import lru_cache
+
+from app.config import settings
+from app.infrastructure.storage.caching_storage import CachingFileStorage
+from app.infrastructure.storage.file_storage import FileStorage, LocalFileStorage
+
+
+@lru_cache(maxsize=1)
+def get_file_storage() -> FileStorage:
+    """Return the storage backend configured from application settings.
+
+    The instance is shared across requests.  Files are kept on local disk:
+    ``S3FileStorage`` is still a stub, so ``S3_BUCKET`` does not select it.
+    With ``FILE_CACHE_ENABLED`` the backend is wrapped in a
+    :class:`CachingFileStorage`, so repeat downloads are served from
+    ``FILE_CACHE_DIR`` rather than ``UPLOAD_DIR``.
+    """
+    storage: FileStorage = LocalFileStorage(upload_dir=settings.UPLOAD_DIR)
+    if settings.FILE_CACHE_ENABLED:
+        storage = CachingFileStorage(
+            storage,
+            cache_dir=settings.FILE_CACHE_DIR,
+            max_bytes=settings.FILE_CACHE_MAX_BYTES,
+        )
+    return storage
@@ -5,8 +5,11 @@ binary file content (uploads, documents, etc.).
 """
 
 import abc
+import asyncio
 import os
+import shutil
 from pathlib import Path
+from typing import BinaryIO
 
 import aiofiles
 
@@ -21,6 +24,17 @@ class FileStorage(abc.ABC):
         """Persist *file_content* and return the stored path / key."""
         ...
 
+    @abc.abstractmethod
+    async def save_file(
+        self, source: BinaryIO, filename: str, subfolder: str = ""
+    ) -> str:
+        """Persist the contents of the open file *source*, read in chunks.
+
+        For content too large to hold in memory.  Returns the stored path /
+        key, as :meth:`save` does.
+        """
+        ...
+
     @abc.abstractmethod
     async def delete(self, file_path: str) -> bool:
         """Remove the file at *file_path*.  Return ``True`` on success."""
@@ -60,6 +74,22 @@ class LocalFileStorage(FileStorage):
 
         return str(file_path)
 
+    async def save_file(
+        self, source: BinaryIO, filename: str, subfolder: str = ""
+    ) -> str:
+        """Copy *source* to ``<upload_dir>/<subfolder>/<filename>`` in chunks."""
+        directory = Path(self.upload_dir) / subfolder if subfolder else Path(self.upload_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        file_path = directory / filename
+
+        def copy() -> None:
+            with open(file_path, "wb") as f:
+                shutil.copyfileobj(source, f)
+
+        await asyncio.to_thread(copy)
+        return str(file_path)
+
     async def delete(self, file_path: str) -> bool:
         """Delete the file at *file_path* from local disk.
 
@@ -117,6 +147,20 @@ class S3FileStorage(FileStorage):
         """
         raise NotImplementedError("S3FileStorage.save is not yet implemented")
 
+    async def save_file(
+        self, source: BinaryIO, filename: str, subfolder: str = ""
+    ) -> str:
+        """Upload the open file *source* to S3 and return the object key.
+
+        TODO: Implement using aioboto3's managed multipart upload::
+
+            key = f"{subfolder}/{filename}" if subfolder else filename
+            async with self._session.client("s3", region_name=self.region) as client:
+                await client.upload_fileobj(source, self.bucket_name, key)
+            return key
+        """
+        raise NotImplementedError("S3FileStorage.save_file is not yet implemented")
+
     async def delete(self, file_path: str) -> bool:
         """Delete the object at *file_path* (S3 key) from the bucket.
 
@@ -0,0 +1,270 @@
+"""Stamp lines of text onto the first page of a PDF.
+
+The original bytes are kept intact and an incremental update is appended
+(new content streams, a font, a replacement page object and a new xref
+section chained to the old one via ``/Prev``), so no PDF library is
+needed.  Only classic xref tables are supported; files using
+cross-reference streams or encryption raise ``ValueError``.
+"""
+
+import re
+
+_OBJECT = re.compile(rb"(\d+)\s+(\d+)\s+obj\b(.*?)\bendobj", re.DOTALL)
+_REF = re.compile(rb"(\d+)\s+(\d+)\s+R")
+_STARTXREF = re.compile(rb"startxref\s+(\d+)\s+%%EOF")
+
+FONT_NAME = b"/FPrefill"
+FONT_SIZE = 9
+LINE_HEIGHT = 11
+MARGIN = 36
+
+
+def stamp_pdf(content: bytes, lines: list[str]) -> bytes:
+    """Return *content* with *lines* drawn at the top of the first page."""
+    objects = {int(m.group(1)): m.group(3).strip() for m in _OBJECT.finditer(content)}
+
+    trailer_at = content.rfind(b"trailer")
+    startxref = _STARTXREF.findall(content)
+    if trailer_at < 0 or not startxref:
+        raise ValueError("PDF has no classic trailer; cannot update incrementally")
+    trailer = _read_dict(content, content.index(b"<<", trailer_at))
+    if _entry(trailer, b"/Encrypt") is not None:
+        raise ValueError("Encrypted PDFs cannot be stamped")
+
+    size = int(_entry(trailer, b"/Size") or 0)
+    root_ref = _entry(trailer, b"/Root")
+    if not size or root_ref is None:
+        raise ValueError("PDF trailer is missing /Size or /Root")
+
+    page_num, page = _first_page(objects, root_ref)
+    top = _page_top(objects, page)
+
+    font_num, save_num, stream_num = size, size + 1, size + 2
+    new_size = size + 3
+
+    # Contents: keep the original streams, wrapped in q/Q so any graphics
+    # state they leave behind (CTM, clip, colour) cannot reach ours, and
+    # append ours.  /Contents may be a stream, an array, or a reference to
+    # an array object.
+    contents = _entry(page, b"/Contents")
+    existing = b""
+    if contents is not None:
+        resolved = _resolve(objects, contents) or b""
+        if resolved.startswith(b"["):
+            existing = resolved.strip(b"[] \r\n")
+        else:
+            existing = contents.strip(b"[] \r\n")
+    if existing:
+        new_contents = b"[%d 0 R " % save_num + existing + b" %d 0 R]" % stream_num
+    else:
+        new_contents = b"[%d 0 R]" % stream_num
+
+    # Resources: inline a copy, inherited from the page tree if the page
+    # has none of its own, so our font can be added without touching
+    # objects shared with other pages or hiding inherited fonts and images.
+    resources = _resolve(objects, _inherited(objects, page, b"/Resources")) or b"<< >>"
+    fonts = _resolve(objects, _entry(resources, b"/Font")) or b"<< >>"
+    fonts = fonts[:-2].rstrip() + b" " + FONT_NAME + b" %d 0 R >>" % font_num
+    resources = _set_entry(resources, b"/Font", fonts)
+
+    page = _set_entry(page, b"/Contents", new_contents)
+    page = _set_entry(page, b"/Resources", resources)
+
+    stream = _text_stream(lines, top)
+    if existing:
+        stream = b"Q " + stream
+    new_objects = [
+        (font_num, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica "
+                   b"/Encoding /WinAnsiEncoding >>"),
+        (stream_num, _stream_object(stream)),
+        (page_num, page),
+    ]
+    if existing:
+        new_objects.append((save_num, _stream_object(b"q")))
+
+    out = bytearray(content)
+    if not out.endswith(b"\n"):
+        out += b"\n"
+    offsets: list[tuple[int, int]] = []
+    for num, body in new_objects:
+        offsets.append((num, len(out)))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+
+    xref_at = len(out)
+    out += b"xref\n"
+    for num, offset in sorted(offsets):
+        out += b"%d 1\n%010d 00000 n \n" % (num, offset)
+
+    new_trailer = b"<< /Size %d /Root " % new_size + root_ref
+    for key in (b"/Info", b"/ID"):
+        value = _entry(trailer, key)
+        if value is not None:
+            new_trailer += b" " + key + b" " + value
+    new_trailer += b" /Prev " + startxref[-1] + b" >>"
+    out += b"trailer\n" + new_trailer + b"\nstartxref\n%d\n%%%%EOF\n" % xref_at
+    return bytes(out)
+
+
+def _stream_object(data: bytes) -> bytes:
+    return b"<< /Length %d >>\nstream\n" % len(data) + data + b"\nendstream"
+
+
+def _text_stream(lines: list[str], top: float) -> bytes:
+    parts = [
+        b"q BT %s %d Tf %d TL %d %d Td"
+        % (FONT_NAME, FONT_SIZE, LINE_HEIGHT, MARGIN * 2, int(top) - MARGIN)
+    ]
+    for i, line in enumerate(lines):
+        text = line.encode("cp1252", errors="replace")
+        text = text.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+        parts.append((b"(" if i == 0 else b"T* (") + text + b") Tj")
+    parts.append(b"ET Q")
+    return b" ".join(parts)
+
+
+def _first_page(objects: dict[int, bytes], root_ref: bytes) -> tuple[int, bytes]:
+    catalog = _resolve(objects, root_ref)
+    node_ref = _entry(catalog or b"", b"/Pages")
+    for _ in range(32):  # page trees are shallow; guard against cycles
+        if node_ref is None:
+            break
+        match = _REF.fullmatch(node_ref.strip())
+        node = objects.get(int(match.group(1))) if match else None
+        if node is None:
+            break
+        if re.search(rb"/Type\s*/Page(?![a-zA-Z])", node):
+            return int(match.group(1)), node
+        kids = _entry(node, b"/Kids") or b""
+        first = _REF.search(kids)
+        node_ref = first.group(0) if first else None
+    raise ValueError("Could not locate the first page of the PDF")
+
+
+def _page_top(objects: dict[int, bytes], page: bytes) -> float:
+    box = _resolve(objects, _inherited(objects, page, b"/MediaBox"))
+    if box:
+        numbers = re.findall(rb"-?\d+(?:\.\d+)?", box)
+        if len(numbers) == 4:
+            return float(numbers[3])
+    return 792.0
+
+
+def _inherited(objects: dict[int, bytes], page: bytes, key: bytes) -> bytes | None:
+    """Value of an inheritable page attribute, from the page or its ancestors."""
+    node: bytes | None = page
+    for _ in range(32):
+        if node is None:
+            break
+        value = _entry(node, key)
+        if value is not None:
+            return value
+        node = _resolve(objects, _entry(node, b"/Parent"))
+    return None
+
+
+def _resolve(objects: dict[int, bytes], value: bytes | None) -> bytes | None:
+    if value is None:
+        return None
+    match = _REF.fullmatch(value.strip())
+    if match:
+        return objects.get(int(match.group(1)))
+    return value
+
+
+def _read_dict(data: bytes, start: int) -> bytes:
+    """Return the balanced ``<< ... >>`` beginning at *start*."""
+    end = _skip_value(data, start)
+    return data[start:end]
+
+
+def _skip_value(data: bytes, i: int) -> int:
+    """Return the index just past the PDF value starting at *i*."""
+    if data.startswith(b"<<", i):
+        depth, i = 0, i
+        while i < len(data):
+            if data.startswith(b"<<", i):
+                depth, i = depth + 1, i + 2
+            elif data.startswith(b">>", i):
+                depth, i = depth - 1, i + 2
+                if depth == 0:
+                    return i
+            elif data[i:i + 1] == b"(":
+                i = _skip_string(data, i)
+            else:
+                i += 1
+        raise ValueError("Unterminated dictionary in PDF")
+    if data[i:i + 1] == b"[":
+        depth = 0
+        while i < len(data):
+            c = data[i:i + 1]
+            if c == b"[":
+                depth += 1
+            elif c == b"]":
+                depth -= 1
+                if depth == 0:
+                    return i + 1
+            elif c == b"(":
+                i = _skip_string(data, i) - 1
+            i += 1
+        raise ValueError("Unterminated array in PDF")
+    if data[i:i + 1] == b"(":
+        return _skip_string(data, i)
+    ref = _REF.match(data, i)
+    if ref:
+        return ref.end()
+    match = re.compile(rb"/?[^\s/<>\[\]()]+|<[0-9A-Fa-f\s]*>").match(data, i)
+    if not match:
+        raise ValueError("Unexpected token in PDF dictionary")
+    return match.end()
+
+
+def _skip_string(data: bytes, i: int) -> int:
+    depth = 0
+    while i < len(data):
+        c = data[i:i + 1]
+        if c == b"\\":
+            i += 2
+            continue
+        if c == b"(":
+            depth += 1
+        elif c == b")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    raise ValueError("Unterminated string in PDF")
+
+
+def _entry_span(d: bytes, key: bytes) -> tuple[int, int, int] | None:
+    """Locate *key* among the top-level entries of dictionary *d*.
+
+    Returns ``(key_start, value_start, value_end)``.
+    """
+    i = 2
+    while i < len(d) - 2:
+        while i < len(d) and d[i:i + 1].isspace():
+            i += 1
+        if d.startswith(b">>", i):
+            return None
+        key_end = _skip_value(d, i)
+        name = d[i:key_end]
+        j = key_end
+        while j < len(d) and d[j:j + 1].isspace():
+            j += 1
+        value_end = _skip_value(d, j)
+        if name == key:
+            return i, j, value_end
+        i = value_end
+    return None
+
+
+def _entry(d: bytes, key: bytes) -> bytes | None:
+    span = _entry_span(d, key)
+    return d[span[1]:span[2]] if span else None
+
+
+def _set_entry(d: bytes, key: bytes, value: bytes) -> bytes:
+    span = _entry_span(d, key)
+    if span:
+        return d[:span[0]] + key + b" " + value + d[span[2]:]
+    return d[:-2].rstrip() + b" " + key + b" " + value + b" >>"
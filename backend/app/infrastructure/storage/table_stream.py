@@ -0,0 +1,147 @@
+"""Incremental CSV and Parquet writers.
+
+Each writer accepts rows a batch at a time and returns the bytes that
+batch produced, so a table can be streamed to the client while only one
+batch is held in memory.  Parquet needs the optional ``pyarrow`` package;
+each batch becomes one row group.
+"""
+
+import csv
+import io
+from collections.abc import Sequence
+from datetime import datetime
+from enum import Enum
+from importlib.util import find_spec
+from uuid import UUID
+
+
+class ColumnType(str, Enum):
+    STRING = "string"
+    INTEGER = "integer"
+    BOOLEAN = "boolean"
+    TIMESTAMP = "timestamp"
+
+
+Column = tuple[str, ColumnType]
+
+
+def parquet_available() -> bool:
+    return find_spec("pyarrow") is not None
+
+
+class CsvStreamWriter:
+    """Write rows as UTF-8 CSV with a header line."""
+
+    media_type = "text/csv"
+    extension = "csv"
+
+    def __init__(self, columns: Sequence[Column]) -> None:
+        self.columns = list(columns)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        self._writer.writerow(name for name, _ in self.columns)
+
+    def write_rows(self, rows: Sequence[Sequence]) -> bytes:
+        for row in rows:
+            self._writer.writerow(_csv_value(value) for value in row)
+        return self._drain()
+
+    def close(self) -> bytes:
+        return self._drain()
+
+    def _drain(self) -> bytes:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+class _ChunkSink:
+    """Write-only file object for ``pyarrow``; buffers until drained."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ParquetStreamWriter:
+    """Write rows as a Parquet file, one row group per batch."""
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self, columns: Sequence[Column]) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {
+            ColumnType.STRING: pa.string(),
+            ColumnType.INTEGER: pa.int64(),
+            ColumnType.BOOLEAN: pa.bool_(),
+            ColumnType.TIMESTAMP: pa.timestamp("us", tz="UTC"),
+        }
+        self.columns = list(columns)
+        self._pa = pa
+        self._schema = pa.schema([(name, types[kind]) for name, kind in self.columns])
+        self._sink = _ChunkSink()
+        self._writer = pq.ParquetWriter(self._sink, self._schema, compression="zstd")
+
+    def write_rows(self, rows: Sequence[Sequence]) -> bytes:
+        if rows:
+            arrays = [
+                [_parquet_value(row[i], kind) for row in rows]
+                for i, (_, kind) in enumerate(self.columns)
+            ]
+            self._writer.write_table(
+                self._pa.Table.from_arrays(arrays, schema=self._schema)
+            )
+        return self._sink.drain()
+
+    def close(self) -> bytes:
+        self._writer.close()
+        return self._sink.drain()
+
+
+# Spreadsheets evaluate a cell starting with one of these as a formula.
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_value(value) -> object:
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        # User-entered text: make it a literal, not a formula.
+        return "'" + value
+    return value
+
+
+def _parquet_value(value, kind: ColumnType) -> object:
+    if value is not None and kind is ColumnType.STRING and isinstance(value, UUID):
+        return str(value)
+    return value
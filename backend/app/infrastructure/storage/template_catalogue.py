@@ -0,0 +1,142 @@
+"""In-memory catalogue of offline packet template PDFs.
+
+Templates are read from ``TEMPLATE_DIR`` once and served from memory with
+a content-derived ETag.  Per-client prefilled variants are rendered in a
+small thread pool and kept in a bounded LRU keyed by template hash, client
+and the client's ``updated_at``, so any change to the client produces a
+new entry.
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from uuid import UUID
+
+from app.config import settings
+from app.infrastructure.storage.pdf_stamp import stamp_pdf
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_FILES = {
+    "MASTER_APP": "MASTER_APP.pdf",
+    "DATA_GATHERING_TOOL": "DATA_GATHERING_TOOL.pdf",
+    "CENSUS_TEMPLATE": "CENSUS_TEMPLATE.pdf",
+    "COMMISSION_ACK": "COMMISSION_ACK.pdf",
+    "ENROLLMENT_FORM": "ENROLLMENT_FORM.pdf",
+}
+
+
+@dataclass(frozen=True)
+class TemplateAsset:
+    document_type: str
+    filename: str
+    content: bytes
+    content_hash: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.content_hash[:32]}"'
+
+
+class TemplateCatalogue:
+    """Holds template bytes in memory and renders prefilled copies."""
+
+    def __init__(
+        self,
+        template_dir: str,
+        render_workers: int,
+        render_cache_size: int,
+    ) -> None:
+        self.template_dir = Path(template_dir)
+        self._assets: dict[str, TemplateAsset] | None = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, render_workers),
+            thread_name_prefix="template-render",
+        )
+        self._rendered: OrderedDict[tuple, bytes] = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+        self._cache_size = render_cache_size
+
+    def load(self) -> None:
+        """Read every known template from disk, replacing what is loaded."""
+        assets: dict[str, TemplateAsset] = {}
+        for document_type, filename in TEMPLATE_FILES.items():
+            path = self.template_dir / filename
+            try:
+                content = path.read_bytes()
+            except OSError as e:
+                logger.warning(f"Template {filename} not loaded: {e}")
+                continue
+            assets[document_type] = TemplateAsset(
+                document_type=document_type,
+                filename=filename,
+                content=content,
+                content_hash=hashlib.sha256(content).hexdigest(),
+            )
+        self._assets = assets
+        self._rendered.clear()
+        logger.info(f"Loaded {len(assets)} offline packet templates")
+
+    def get(self, document_type: str) -> TemplateAsset | None:
+        """Return the template for *document_type*, or ``None`` if unavailable."""
+        if self._assets is None:
+            self.load()
+        return self._assets.get(document_type)
+
+    @staticmethod
+    def prefilled_etag(
+        asset: TemplateAsset, client_id: UUID, client_updated_at: datetime
+    ) -> str:
+        """ETag for a prefilled copy, computable without rendering it."""
+        key = f"{asset.content_hash}:{client_id}:{client_updated_at.isoformat()}"
+        return f'"{hashlib.sha256(key.encode()).hexdigest()[:32]}"'
+
+    async def render_prefilled(
+        self,
+        asset: TemplateAsset,
+        client_id: UUID,
+        client_updated_at: datetime,
+        lines: list[str],
+    ) -> bytes:
+        """Return *asset* with *lines* stamped on it, rendering at most once."""
+        key = (asset.content_hash, client_id, client_updated_at)
+        cached = self._rendered.get(key)
+        if cached is not None:
+            self._rendered.move_to_end(key)
+            return cached
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, stamp_pdf, asset.content, lines)
+        self._in_flight[key] = future
+        try:
+            content = await asyncio.shield(future)
+        finally:
+            self._in_flight.pop(key, None)
+
+        self._rendered[key] = content
+        while len(self._rendered) > self._cache_size:
+            self._rendered.popitem(last=False)
+        return content
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache(maxsize=1)
+def get_template_catalogue() -> TemplateCatalogue:
+    """Return the process-wide template catalogue."""
+    return TemplateCatalogue(
+        settings.TEMPLATE_DIR,
+        render_workers=settings.TEMPLATE_PREFILL_WORKERS,
+        render_cache_size=settings.TEMPLATE_PREFILL_CACHE_SIZE,
+    )
@@ -0,0 +1,82 @@
+"""Incremental ZIP archive writer.
+
+Produces a ZIP archive as a sequence of byte chunks so it can be streamed
+to the client without ever holding the full archive in memory.
+"""
+
+import zipfile
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class _ChunkSink:
+    """Write-only, non-seekable file object that buffers until drained.
+
+    ``zipfile`` detects the missing ``tell``/``seek`` and switches to
+    streaming mode (data descriptors after each member).
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ZipStreamWriter:
+    """Build a ZIP archive member by member, yielding bytes as they are ready."""
+
+    def __init__(self) -> None:
+        self._sink = _ChunkSink()
+        self._zip = zipfile.ZipFile(self._sink, mode="w", allowZip64=True)
+        self._names: set[str] = set()
+
+    def write_entry(
+        self, name: str, content: bytes, compress: bool = True
+    ) -> Iterator[bytes]:
+        """Add a member named *name* and yield the archive bytes it produced.
+
+        Duplicate names get a numeric suffix so no member is shadowed.
+        """
+        info = zipfile.ZipInfo(
+            self._unique_name(name),
+            date_time=datetime.now(timezone.utc).timetuple()[:6],
+        )
+        info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        info.external_attr = 0o644 << 16
+
+        with self._zip.open(info, mode="w", force_zip64=len(content) > 0x7FFFFFFF) as dest:
+            for start in range(0, len(content), CHUNK_SIZE):
+                dest.write(content[start:start + CHUNK_SIZE])
+                chunk = self._sink.drain()
+                if chunk:
+                    yield chunk
+        chunk = self._sink.drain()
+        if chunk:
+            yield chunk
+
+    def close(self) -> bytes:
+        """Finish the archive and return the central directory bytes."""
+        self._zip.close()
+        return self._sink.drain()
+
+    def _unique_name(self, name: str) -> str:
+        candidate = name
+        counter = 1
+        while candidate in self._names:
+            stem, dot, ext = name.rpartition(".")
+            candidate = f"{stem} ({counter}).{ext}" if dot else f"{name} ({counter})"
+            counter += 1
+        self._names.add(candidate)
+        return candidate
@@ -9,15 +9,34 @@ from app.api.middleware.error_handler import register_exception_handlers
 from app.api.middleware.request_timing import RequestTimingMiddleware
 from app.api.v1.router import router as v1_router
 from app.domain.events.handlers import setup_event_handlers
+from app.infrastructure.cache import get_response_cache
+from app.infrastructure.database.event_log_listener import get_event_log_listener
+from app.infrastructure.jobs import setup_background_jobs
+from app.infrastructure.storage import CachingFileStorage, get_file_storage
+from app.infrastructure.storage.template_catalogue import get_template_catalogue
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan: runs startup and shutdown logic."""
     # --- startup ---
-    setup_event_handlers()
+    get_template_catalogue().load()
+    workers = [
+        *setup_event_handlers(),
+        *setup_background_jobs(),
+        get_event_log_listener(),
+    ]
+    for worker in workers:
+        await worker.start()
     yield
     # --- shutdown ---
+    for worker in reversed(workers):
+        await worker.stop()
+    await get_response_cache().close()
+    storage = get_file_storage()
+    if isinstance(storage, CachingFileStorage):
+        storage.close()
+    get_template_catalogue().shutdown()
 
 
 app = FastAPI(
@@ -0,0 +1,44 @@
+"""Add post-upload processing metadata to documents
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'documents',
+        sa.Column('processing_status', sa.String(20), server_default='PENDING', nullable=False),
+    )
+    op.add_column('documents', sa.Column('content_sha256', sa.String(64), nullable=True))
+    op.add_column('documents', sa.Column('sniffed_mime_type', sa.String(100), nullable=True))
+    op.add_column('documents', sa.Column('page_count', sa.Integer(), nullable=True))
+    op.add_column('documents', sa.Column('text_length', sa.Integer(), nullable=True))
+    op.add_column('documents', sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('documents', sa.Column('processing_error', sa.Text(), nullable=True))
+    op.create_index(
+        'idx_documents_processing_pending',
+        'documents',
+        ['uploaded_at'],
+        postgresql_where=sa.text("processing_status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_documents_processing_pending', table_name='documents')
+    op.drop_column('documents', 'processing_error')
+    op.drop_column('documents', 'processed_at')
+    op.drop_column('documents', 'text_length')
+    op.drop_column('documents', 'page_count')
+    op.drop_column('documents', 'sniffed_mime_type')
+    op.drop_column('documents', 'content_sha256')
+    op.drop_column('documents', 'processing_status')
@@ -0,0 +1,36 @@
+"""Add partial composite indexes for document listings
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The predicate is spelled exactly as the repository filters
+    # (``is_deleted IS false``) so the planner can match the partial index.
+    op.create_index(
+        'idx_documents_client_uploaded',
+        'documents',
+        ['client_id', sa.text('uploaded_at DESC')],
+        postgresql_where=sa.text('is_deleted IS FALSE'),
+    )
+    op.create_index(
+        'idx_documents_instance_type_uploaded',
+        'documents',
+        ['workflow_instance_id', 'file_type', sa.text('uploaded_at DESC')],
+        postgresql_where=sa.text('is_deleted IS FALSE'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_documents_instance_type_uploaded', table_name='documents')
+    op.drop_index('idx_documents_client_uploaded', table_name='documents')
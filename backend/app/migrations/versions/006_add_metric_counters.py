@@ -0,0 +1,66 @@
+"""Add metric_counters table for dashboard aggregates
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+
+The counters are seeded with the same aggregates as
+MetricsRepository.reconcile, so the dashboard is right (and status-change
+decrements do not go negative) before the reconciler first runs.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'metric_counters',
+        sa.Column('name', sa.String(64), nullable=False),
+        sa.Column('dimension', sa.String(100), server_default='', nullable=False),
+        sa.Column('value', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('name', 'dimension'),
+    )
+
+    op.execute("""
+        INSERT INTO metric_counters (name, dimension, value)
+        SELECT 'cases_by_status', status, count(*)
+        FROM clients
+        WHERE status IS NOT NULL
+        GROUP BY status
+    """)
+    op.execute("""
+        INSERT INTO metric_counters (name, dimension, value)
+        SELECT 'completed_workflows', '', count(*)
+        FROM workflow_instances
+        WHERE completed_at IS NOT NULL AND started_at IS NOT NULL
+        UNION ALL
+        SELECT 'cycle_time_seconds', '', COALESCE(
+            sum(extract(epoch FROM completed_at) - extract(epoch FROM started_at)),
+            0
+        )::bigint
+        FROM workflow_instances
+        WHERE completed_at IS NOT NULL AND started_at IS NOT NULL
+    """)
+    # Keep the window in step with SUBMISSION_RETENTION_DAYS.
+    op.execute("""
+        INSERT INTO metric_counters (name, dimension, value)
+        SELECT 'submissions_by_day', to_char(day, 'YYYY-MM-DD'), count(*)
+        FROM (
+            SELECT date(timezone('UTC', created_at)) AS day
+            FROM event_log
+            WHERE event_type = 'WorkflowSubmitted'
+              AND created_at >= now() - interval '35 days'
+        ) AS submissions
+        GROUP BY day
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('metric_counters')
@@ -0,0 +1,21 @@
+"""Add index on clients.updated_at for SLA alerting
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_clients_updated_at', 'clients', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_clients_updated_at', table_name='clients')
@@ -0,0 +1,30 @@
+"""Add partial index for in-progress workflow steps
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_workflow_steps_in_progress_started',
+        'workflow_step_instances',
+        ['started_at'],
+        postgresql_where=sa.text("status = 'IN_PROGRESS'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'idx_workflow_steps_in_progress_started',
+        table_name='workflow_step_instances',
+    )
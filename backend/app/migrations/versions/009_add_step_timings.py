@@ -0,0 +1,99 @@
+"""Add step_timings fact table and step duration sketches
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19
+"""
+import math
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.domain.analytics.duration_sketch (1% relative accuracy).
+LOG_GAMMA = math.log(1.01 / 0.99)
+
+EMPLOYEE_BUCKET_SQL = """
+    CASE
+        WHEN c.eligible_employees IS NULL THEN 'unknown'
+        WHEN c.eligible_employees < 50 THEN '1-49'
+        WHEN c.eligible_employees < 100 THEN '50-99'
+        WHEN c.eligible_employees < 500 THEN '100-499'
+        ELSE '500+'
+    END
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'step_timings',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), primary_key=True),
+        sa.Column('workflow_instance_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('workflow_instances.id'), nullable=False),
+        sa.Column('client_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('clients.id'), nullable=False),
+        sa.Column('step_id', sa.String(50), nullable=False),
+        sa.Column('outcome', sa.String(20), nullable=False),
+        sa.Column('assigned_role', sa.String(50), nullable=True),
+        sa.Column('employee_bucket', sa.String(20), nullable=False),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('duration_seconds', sa.Float(), nullable=True),
+        sa.UniqueConstraint('workflow_instance_id', 'step_id', name='uq_step_timings_instance_step'),
+    )
+    op.create_index('idx_step_timings_step_finished', 'step_timings', ['step_id', 'finished_at'])
+
+    op.create_table(
+        'step_duration_sketches',
+        sa.Column('step_id', sa.String(50), nullable=False),
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('employee_bucket', sa.String(20), nullable=False),
+        sa.Column('bucket_index', sa.Integer(), nullable=False),
+        sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('week_start', 'step_id', 'employee_bucket', 'bucket_index'),
+    )
+
+    # Backfill from steps that already finished.
+    op.execute(f"""
+        INSERT INTO step_timings (
+            workflow_instance_id, client_id, step_id, outcome, assigned_role,
+            employee_bucket, started_at, finished_at, duration_seconds
+        )
+        SELECT
+            s.workflow_instance_id, w.client_id, s.step_id, s.status, s.assigned_role,
+            {EMPLOYEE_BUCKET_SQL},
+            s.started_at,
+            COALESCE(s.completed_at, s.updated_at),
+            -- As StepTimingHandler does: finish time minus start, for skips too.
+            CASE WHEN s.started_at IS NOT NULL
+                 THEN GREATEST(EXTRACT(EPOCH FROM
+                      COALESCE(s.completed_at, s.updated_at) - s.started_at), 0)
+            END
+        FROM workflow_step_instances s
+        JOIN workflow_instances w ON w.id = s.workflow_instance_id
+        JOIN clients c ON c.id = w.client_id
+        WHERE s.status IN ('COMPLETED', 'SKIPPED')
+    """)
+    op.execute(f"""
+        INSERT INTO step_duration_sketches (step_id, week_start, employee_bucket, bucket_index, count)
+        SELECT
+            step_id,
+            date_trunc('week', finished_at AT TIME ZONE 'UTC')::date,
+            employee_bucket,
+            CASE WHEN duration_seconds <= 1 THEN 0
+                 ELSE CEIL(LN(duration_seconds) / {LOG_GAMMA!r})::int
+            END AS bucket_index,
+            COUNT(*)
+        FROM step_timings
+        WHERE duration_seconds IS NOT NULL
+        GROUP BY 1, 2, 3, 4
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('step_duration_sketches')
+    op.drop_index('idx_step_timings_step_finished', table_name='step_timings')
+    op.drop_table('step_timings')
@@ -0,0 +1,56 @@
+"""Add alerts and job_state tables for the background SLA scanner
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'alerts',
+        sa.Column('id', postgresql.UUID(as_uuid=True), server_default=sa.text('gen_random_uuid()'), primary_key=True),
+        sa.Column('alert_type', sa.String(20), nullable=False),
+        sa.Column('subject_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('client_id', postgresql.UUID(as_uuid=True), sa.ForeignKey('clients.id'), nullable=False),
+        sa.Column('step_id', sa.String(50), nullable=True),
+        sa.Column('severity', sa.String(20), nullable=False),
+        sa.Column('reference_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('opened_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('resolved_at', sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        'uq_alerts_open_subject',
+        'alerts',
+        ['alert_type', 'subject_id'],
+        unique=True,
+        postgresql_where=sa.text('resolved_at IS NULL'),
+    )
+    op.create_index(
+        'idx_alerts_open_reference',
+        'alerts',
+        ['alert_type', 'reference_at'],
+        postgresql_where=sa.text('resolved_at IS NULL'),
+    )
+
+    op.create_table(
+        'job_state',
+        sa.Column('name', sa.String(64), primary_key=True),
+        sa.Column('last_run_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('job_state')
+    op.drop_index('idx_alerts_open_reference', table_name='alerts')
+    op.drop_index('uq_alerts_open_subject', table_name='alerts')
+    op.drop_table('alerts')
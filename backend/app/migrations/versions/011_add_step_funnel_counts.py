@@ -0,0 +1,35 @@
+"""Add step_funnel_counts projection
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+Populated by the funnel handler going forward; rebuild history with
+``python -m app.replay_events funnel --rebuild``.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'step_funnel_counts',
+        sa.Column('week_start', sa.Date(), nullable=False),
+        sa.Column('step_id', sa.String(50), nullable=False),
+        sa.Column('assigned_role', sa.String(50), nullable=False),
+        sa.Column('channel', sa.String(10), nullable=False),
+        sa.Column('entered', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('completed', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('skipped', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('week_start', 'step_id', 'assigned_role', 'channel'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('step_funnel_counts')
@@ -0,0 +1,44 @@
+"""Add BRIN index on event_log.created_at and event_daily_counts rollup
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # event_log is append-only, so created_at follows physical order and a
+    # BRIN index serves time-range scans at a tiny fraction of a btree's size.
+    op.create_index(
+        'idx_event_log_created_at_brin',
+        'event_log',
+        ['created_at'],
+        postgresql_using='brin',
+    )
+
+    op.create_table(
+        'event_daily_counts',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('event_type', sa.String(100), nullable=False),
+        sa.Column('count', sa.BigInteger(), server_default='0', nullable=False),
+        sa.PrimaryKeyConstraint('day', 'event_type'),
+    )
+    op.execute("""
+        INSERT INTO event_daily_counts (day, event_type, count)
+        SELECT date(timezone('UTC', created_at)), event_type, COUNT(*)
+        FROM event_log
+        GROUP BY 1, 2
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('event_daily_counts')
+    op.drop_index('idx_event_log_created_at_brin', table_name='event_log')
@@ -0,0 +1,125 @@
+"""Partition event_log by month on created_at
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+Rebuilds event_log as a range-partitioned table with one partition per
+UTC calendar month, from the oldest existing row through
+PARTITIONS_AHEAD months past the current one.  Later months are created
+by the EventLogMaintenance job, which also detaches and archives
+partitions past the retention period.
+
+Indexes are declared on the parent and so exist on every partition:
+the primary key (which must include the partition key), a BRIN index on
+created_at, and (client_id, created_at) / (event_type, created_at)
+btrees so per-client and per-type scans can stop after the most recent
+partitions.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Keep in step with settings.EVENT_LOG_PARTITIONS_AHEAD.
+PARTITIONS_AHEAD = 3
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE event_log RENAME TO event_log_unpartitioned")
+    op.execute(
+        "ALTER TABLE event_log_unpartitioned "
+        "RENAME CONSTRAINT event_log_pkey TO event_log_unpartitioned_pkey"
+    )
+
+    op.execute("""
+        CREATE TABLE event_log (
+            id uuid NOT NULL DEFAULT gen_random_uuid(),
+            event_type varchar(100) NOT NULL,
+            payload jsonb NOT NULL,
+            client_id uuid REFERENCES clients (id),
+            user_id uuid REFERENCES users (id),
+            created_at timestamptz NOT NULL DEFAULT now(),
+            CONSTRAINT event_log_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    op.execute(f"""
+        DO $$
+        DECLARE
+            first_month date := date_trunc(
+                'month',
+                timezone('UTC', COALESCE(
+                    (SELECT min(created_at) FROM event_log_unpartitioned), now()
+                ))
+            )::date;
+            last_month date := (
+                date_trunc('month', timezone('UTC', now()))
+                + interval '{PARTITIONS_AHEAD} months'
+            )::date;
+            m date;
+        BEGIN
+            FOR m IN
+                SELECT generate_series(first_month, last_month, interval '1 month')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF event_log FOR VALUES FROM (%L) TO (%L)',
+                    'event_log_p' || to_char(m, 'YYYY_MM'),
+                    m::timestamp AT TIME ZONE 'UTC',
+                    (m + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END $$
+    """)
+
+    op.execute("""
+        INSERT INTO event_log (id, event_type, payload, client_id, user_id, created_at)
+        SELECT id, event_type, payload, client_id, user_id, COALESCE(created_at, now())
+        FROM event_log_unpartitioned
+    """)
+    op.execute("DROP TABLE event_log_unpartitioned")
+
+    op.create_index(
+        'idx_event_log_created_at_brin',
+        'event_log',
+        ['created_at'],
+        postgresql_using='brin',
+    )
+    op.create_index('idx_event_log_client_created', 'event_log', ['client_id', 'created_at'])
+    op.create_index('idx_event_log_type_created', 'event_log', ['event_type', 'created_at'])
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE event_log RENAME TO event_log_partitioned")
+    op.execute(
+        "ALTER TABLE event_log_partitioned "
+        "RENAME CONSTRAINT event_log_pkey TO event_log_partitioned_pkey"
+    )
+    op.execute("""
+        CREATE TABLE event_log (
+            id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+            event_type varchar(100) NOT NULL,
+            payload jsonb NOT NULL,
+            client_id uuid REFERENCES clients (id),
+            user_id uuid REFERENCES users (id),
+            created_at timestamptz DEFAULT now()
+        )
+    """)
+    op.execute("""
+        INSERT INTO event_log (id, event_type, payload, client_id, user_id, created_at)
+        SELECT id, event_type, payload, client_id, user_id, created_at
+        FROM event_log_partitioned
+    """)
+    op.execute("DROP TABLE event_log_partitioned")
+
+    op.create_index('idx_event_log_client', 'event_log', ['client_id'])
+    op.create_index('idx_event_log_type', 'event_log', ['event_type'])
+    op.create_index(
+        'idx_event_log_created_at_brin',
+        'event_log',
+        ['created_at'],
+        postgresql_using='brin',
+    )
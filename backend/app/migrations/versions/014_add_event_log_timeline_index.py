@@ -0,0 +1,31 @@
+"""Add (client_id, event_type, created_at DESC) index on event_log
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+
+Serves the per-client timeline when filtered by event type: the cursor
+predicate and ORDER BY created_at DESC, id DESC become a single index
+range scan regardless of how deep the page is.  The unfiltered timeline
+uses idx_event_log_client_created from 013.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '014'
+down_revision: Union[str, None] = '013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'idx_event_log_client_type_created',
+        'event_log',
+        ['client_id', 'event_type', sa.text('created_at DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_event_log_client_type_created', table_name='event_log')
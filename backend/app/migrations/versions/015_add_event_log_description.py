@@ -0,0 +1,112 @@
+"""Store rendered timeline description and icon on event_log
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-19
+
+The audit handler now renders each event's timeline text once, when it
+is written.  Existing rows are backfilled one day of created_at at a
+time, outside the migration transaction, using a copy of the templates
+as they stood at this revision, so later template changes do not alter
+what this migration writes.
+"""
+import json
+from datetime import timedelta
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '015'
+down_revision: Union[str, None] = '014'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+WINDOW = timedelta(days=1)
+
+# event_type -> (description_template, material_icon), frozen at this revision.
+EVENT_DESCRIPTIONS = {
+    "CaseMarkedSold": ("Case marked as sold", "sell"),
+    "AccessAssigned": ("Access granted to {email} as {role_type}", "person_add"),
+    "AccessRevoked": ("Access revoked for {email}", "person_remove"),
+    "GroupSetupStarted": ("Online group setup started", "play_arrow"),
+    "OfflineSetupChosen": ("Offline setup initiated", "description"),
+    "WorkflowStepStarted": ("Workflow step started: {step_id}", "start"),
+    "WorkflowStepCompleted": ("Workflow step completed: {step_id}", "check_circle"),
+    "WorkflowStepSaved": ("Workflow step saved: {step_id}", "save"),
+    "WorkflowStepSkipped": ("Workflow step skipped: {step_id}", "skip_next"),
+    "DocumentUploaded": ("Document uploaded: {file_name}", "upload_file"),
+    "DocumentDeleted": ("Document deleted: {file_name}", "delete"),
+    "OfflinePacketSubmitted": ("Offline packet submitted for review", "send"),
+    "CaseOwnerAssigned": ("Case assigned to owner", "assignment_ind"),
+    "InvitationSent": ("Invitation sent to {email} ({role_type})", "send"),
+    "AccessUnlocked": ("Access unlocked for {email}", "lock_open"),
+    "WorkflowSubmitted": ("Workflow submitted for downstream processing", "send"),
+    "MasterAppSigned": ("Master Application signed by {accepted_by}", "draw"),
+    "EnrollmentTransitionInitiated": ("Enrollment transition initiated (group: {group_number})", "swap_horiz"),
+    "WorkflowHandoffRequested": ("Workflow handed off to {target_role} ({target_email})", "forward_to_inbox"),
+    "SlaBreached": ("Case stale for {days_stale} days ({severity})", "schedule"),
+    "StepStuck": ("Workflow step stuck for {days_stuck} days: {step_id}", "hourglass_empty"),
+}
+
+
+def _render(event_type: str, payload: dict) -> tuple[str, str]:
+    desc_template, icon = EVENT_DESCRIPTIONS.get(
+        event_type, ("{event_type} occurred", "event")
+    )
+    try:
+        description = desc_template.format(event_type=event_type, **payload)
+    except (KeyError, IndexError):
+        description = desc_template.split("{")[0].strip() or event_type
+    return description, icon
+
+
+def upgrade() -> None:
+    op.add_column('event_log', sa.Column('description', sa.Text(), nullable=True))
+    op.add_column('event_log', sa.Column('icon', sa.String(50), nullable=True))
+
+    # Walk created_at one window at a time: the BRIN index (and partition
+    # pruning) confine each read to that range, and nothing holds one long
+    # transaction.  Updates find their row through the (id, created_at) key.
+    select_window = sa.text("""
+        SELECT id, created_at, event_type, payload FROM event_log
+        WHERE created_at >= :lower AND created_at < :upper
+          AND description IS NULL
+    """)
+    update_row = sa.text("""
+        UPDATE event_log SET description = :description, icon = :icon
+        WHERE id = :id AND created_at = :created_at
+    """)
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        first, last = conn.execute(
+            sa.text("SELECT min(created_at), max(created_at) FROM event_log")
+        ).one()
+        lower = first
+        while lower is not None and lower <= last:
+            upper = lower + WINDOW
+            rows = conn.execute(select_window, {'lower': lower, 'upper': upper}).all()
+            updates = []
+            for row in rows:
+                payload = row.payload
+                if isinstance(payload, str):
+                    try:
+                        payload = json.loads(payload)
+                    except ValueError:
+                        payload = {}
+                description, icon = _render(
+                    row.event_type, payload if isinstance(payload, dict) else {}
+                )
+                updates.append({
+                    'id': row.id,
+                    'created_at': row.created_at,
+                    'description': description,
+                    'icon': icon,
+                })
+            if updates:
+                conn.execute(update_row, updates)
+            lower = upper
+
+
+def downgrade() -> None:
+    op.drop_column('event_log', 'icon')
+    op.drop_column('event_log', 'description')
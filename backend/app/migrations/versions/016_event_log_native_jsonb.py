@@ -0,0 +1,63 @@
+"""Store event_log payloads as JSONB objects and index common fields
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-19
+
+Payloads used to be written as json.dumps() strings, so each row held a
+JSONB string rather than an object.  Rows are converted one day of
+created_at at a time, each day committed individually, so no long
+transaction holds locks on the table.  Re-running the conversion is
+harmless: only string payloads are touched.
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '016'
+down_revision: Union[str, None] = '015'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+WINDOW = timedelta(days=1)
+
+
+def upgrade() -> None:
+    # One created_at window per statement: the BRIN index (and partition
+    # pruning) confine each update to that range, and each commits on its
+    # own, so no long transaction holds locks on the table.
+    convert_window = sa.text("""
+        UPDATE event_log SET payload = (payload #>> '{}')::jsonb
+        WHERE created_at >= :lower AND created_at < :upper
+          AND jsonb_typeof(payload) = 'string'
+    """)
+    with op.get_context().autocommit_block():
+        conn = op.get_bind()
+        first, last = conn.execute(
+            sa.text("SELECT min(created_at), max(created_at) FROM event_log")
+        ).one()
+        lower = first
+        while lower is not None and lower <= last:
+            upper = lower + WINDOW
+            conn.execute(convert_window, {'lower': lower, 'upper': upper})
+            lower = upper
+
+    op.create_index(
+        'idx_event_log_payload_workflow_instance',
+        'event_log',
+        [sa.text("(payload->>'workflow_instance_id')")],
+        postgresql_where=sa.text("payload->>'workflow_instance_id' IS NOT NULL"),
+    )
+    op.create_index(
+        'idx_event_log_payload_step',
+        'event_log',
+        ['client_id', sa.text("(payload->>'step_id')")],
+        postgresql_where=sa.text("payload->>'step_id' IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_event_log_payload_step', table_name='event_log')
+    op.drop_index('idx_event_log_payload_workflow_instance', table_name='event_log')
+    # Payloads stay as objects; readers of the old format accept both.
@@ -0,0 +1,34 @@
+"""Add replay_checkpoints table for the event log replay tool
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision: str = '017'
+down_revision: Union[str, None] = '016'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'replay_checkpoints',
+        sa.Column('name', sa.String(64), nullable=False),
+        sa.Column('partition', sa.Integer(), nullable=False),
+        sa.Column('partitions', sa.Integer(), nullable=False),
+        sa.Column('until', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_id', UUID(as_uuid=True), nullable=True),
+        sa.Column('replayed', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.PrimaryKeyConstraint('name', 'partition'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('replay_checkpoints')
@@ -0,0 +1,49 @@
+"""Add a DEFAULT partition to event_log
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-19
+
+Without it, an insert into a month the EventLogMaintenance job has not
+created yet fails, and audit rows are lost if the job stops or lags.
+Rows that land here are moved into their month's partition when the job
+next creates it.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '018'
+down_revision: Union[str, None] = '017'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE TABLE event_log_default PARTITION OF event_log DEFAULT")
+
+
+def downgrade() -> None:
+    # Give every month still held in the default partition a partition of
+    # its own before dropping it.
+    op.execute("ALTER TABLE event_log DETACH PARTITION event_log_default")
+    op.execute("""
+        DO $$
+        DECLARE
+            m date;
+        BEGIN
+            FOR m IN
+                SELECT DISTINCT date_trunc('month', timezone('UTC', created_at))::date
+                FROM event_log_default
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF event_log '
+                    'FOR VALUES FROM (%L) TO (%L)',
+                    'event_log_p' || to_char(m, 'YYYY_MM'),
+                    m::timestamp AT TIME ZONE 'UTC',
+                    (m + interval '1 month')::timestamp AT TIME ZONE 'UTC'
+                );
+            END LOOP;
+        END $$
+    """)
+    op.execute("INSERT INTO event_log SELECT * FROM event_log_default")
+    op.execute("DROP TABLE event_log_default")
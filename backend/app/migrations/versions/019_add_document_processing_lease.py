@@ -0,0 +1,28 @@
+"""Add a processing lease to documents
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-19
+
+processing_claimed_at records when a worker moved a document to
+PROCESSING, so other processes only reclaim it once the lease expires.
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '019'
+down_revision: Union[str, None] = '018'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'documents',
+        sa.Column('processing_claimed_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('documents', 'processing_claimed_at')
@@ -0,0 +1,29 @@
+"""Start the event_daily_counts rollup job from the deployment time
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-19
+
+event_daily_counts used to be incremented per event by the audit handler;
+the EventCountRollup job now adds new event_log rows to it in batches.
+Its watermark starts here, where the per-event increments stop.
+"""
+from typing import Sequence, Union
+from alembic import op
+
+revision: str = '020'
+down_revision: Union[str, None] = '019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        INSERT INTO job_state (name, last_run_at)
+        VALUES ('event-count-rollup', now())
+        ON CONFLICT (name) DO UPDATE SET last_run_at = excluded.last_run_at
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DELETE FROM job_state WHERE name = 'event-count-rollup'")
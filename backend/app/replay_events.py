@@ -0,0 +1,245 @@
+"""Replay event_log through projection handlers to rebuild read models.
+
+Usage::
+
+    python -m app.replay_events step_timing [funnel] [--rebuild]
+        [--workers 4] [--batch-size 1000] [--name NAME] [--report-seconds 10]
+
+Streams the events the chosen projections handle from event_log in
+``(created_at, id)`` order, rebuilds each as its ``DomainEvent`` class and
+passes each batch to the projections' handlers directly, so audit,
+notification and cache handlers never see replayed events.  A handler
+applies a batch in one transaction, with its lookups made once per batch;
+if it fails the replay stops, and resuming starts from that batch.
+
+Rows are split across ``--workers`` partitions by a hash of client_id; a
+client's events are always replayed in order by one worker.  Each worker
+records its position in replay_checkpoints after every batch, and
+re-running with the same ``--name`` resumes from there, up to the cut-off
+fixed by the first run.  A batch interrupted part-way is replayed in full
+on resume, so handlers may see some events twice.
+
+``--rebuild`` clears the chosen projections and the checkpoints first.
+Projections that are not idempotent (the step funnel) always require it,
+and so cannot resume.
+"""
+import argparse
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Protocol
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.base import DomainEvent
+from app.domain.events.handlers.funnel_handler import FunnelHandler
+from app.domain.events.handlers.step_timing_handler import StepTimingHandler
+from app.domain.events.registry import rehydrate
+from app.infrastructure.database.models.replay_checkpoint_orm import (
+    ReplayCheckpointORM,
+)
+from app.infrastructure.database.session import async_session_factory
+from app.infrastructure.repositories.analytics_repo import AnalyticsRepository
+from app.infrastructure.repositories.event_log_repo import EventLogRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BatchHandler(Protocol):
+    event_types: tuple[type[DomainEvent], ...]
+
+    async def handle_batch(self, events: list) -> None: ...
+
+
+@dataclass(frozen=True)
+class Projection:
+    handler: Callable[[Callable[..., AsyncSession]], BatchHandler]
+    clear: Callable[[AsyncSession], Awaitable[None]] | None = None
+    idempotent: bool = True
+
+
+PROJECTIONS: dict[str, Projection] = {
+    # step_timings ignores a step it has already recorded.
+    "step_timing": Projection(StepTimingHandler),
+    # Always replayed from the start, so it can tell which steps' starts
+    # predate WorkflowStepStarted.
+    "funnel": Projection(
+        lambda session_factory: FunnelHandler(session_factory, track_entries=True),
+        clear=lambda session: AnalyticsRepository(session).clear_funnel(),
+        idempotent=False,
+    ),
+}
+
+
+async def _prepare(
+    name: str, projections: list[str], workers: int, rebuild: bool
+) -> list[ReplayCheckpointORM]:
+    """Return the checkpoint of every partition, creating them if new."""
+    async with async_session_factory() as session:
+        repo = EventLogRepository(session)
+        not_idempotent = [p for p in projections if not PROJECTIONS[p].idempotent]
+        checkpoints = [] if rebuild else await repo.get_checkpoints(name)
+        if checkpoints:
+            # The batch in flight when a run stopped is replayed in full on
+            # resume, which would count it twice.
+            if not_idempotent:
+                raise SystemExit(
+                    f"{', '.join(not_idempotent)} cannot resume an interrupted "
+                    f"replay; pass --rebuild"
+                )
+            if checkpoints[0].partitions != workers:
+                raise SystemExit(
+                    f"Replay '{name}' was started with {checkpoints[0].partitions} "
+                    f"workers; pass --workers {checkpoints[0].partitions} or --rebuild"
+                )
+            return checkpoints
+
+        if not_idempotent and not rebuild:
+            raise SystemExit(
+                f"{', '.join(not_idempotent)} cannot be replayed on top of "
+                f"existing data; pass --rebuild"
+            )
+
+        await repo.clear_checkpoints(name)
+        for projection in projections:
+            clear = PROJECTIONS[projection].clear
+            if clear is not None:
+                await clear(session)
+        until = datetime.now(timezone.utc)
+        for partition in range(workers):
+            await repo.save_checkpoint(name, partition, workers, until, None, 0)
+        await session.commit()
+        return await repo.get_checkpoints(name)
+
+
+async def _replay_partition(
+    handlers: list[BatchHandler],
+    event_types: list[str],
+    checkpoint: ReplayCheckpointORM,
+    batch_size: int,
+    progress: list[int],
+) -> None:
+    partition = checkpoint.partition
+    after = None
+    if checkpoint.last_id is not None:
+        after = (checkpoint.last_created_at, checkpoint.last_id)
+    replayed = checkpoint.replayed
+
+    async def flush(batch: list) -> None:
+        nonlocal after, replayed
+        events = []
+        for row in batch:
+            try:
+                event = rehydrate(row.event_type, row.payload)
+            except ValueError as e:
+                logger.warning(f"Skipping unreadable {row.event_type} {row.id}: {e}")
+                continue
+            if event is not None:
+                events.append(event)
+        for handler in handlers:
+            await handler.handle_batch(
+                [event for event in events if isinstance(event, handler.event_types)]
+            )
+        after = (batch[-1].created_at, batch[-1].id)
+        replayed += len(batch)
+        async with async_session_factory() as session:
+            await EventLogRepository(session).save_checkpoint(
+                checkpoint.name,
+                partition,
+                checkpoint.partitions,
+                checkpoint.until,
+                after,
+                replayed,
+            )
+            await session.commit()
+        progress[partition] = replayed
+
+    async with async_session_factory() as session:
+        rows = EventLogRepository(session).stream_for_replay(
+            event_types,
+            partition,
+            checkpoint.partitions,
+            after,
+            checkpoint.until,
+            batch_size,
+        )
+        batch = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+
+
+async def _report(progress: list[int], started: int, interval: float) -> None:
+    begun = time.monotonic()
+    while True:
+        await asyncio.sleep(interval)
+        done = sum(progress) - started
+        rate = done / (time.monotonic() - begun)
+        print(f"  ... {sum(progress)} events replayed ({rate:.0f}/s)")
+
+
+async def replay(
+    projections: list[str],
+    name: str,
+    workers: int,
+    batch_size: int,
+    rebuild: bool,
+    report_seconds: float,
+) -> None:
+    handlers = [
+        PROJECTIONS[projection].handler(async_session_factory)
+        for projection in projections
+    ]
+    event_types = sorted(
+        {cls.__name__ for handler in handlers for cls in handler.event_types}
+    )
+
+    checkpoints = await _prepare(name, projections, workers, rebuild)
+    progress = [checkpoint.replayed for checkpoint in checkpoints]
+    started = sum(progress)
+    if started:
+        print(f"Resuming '{name}' after {started} events")
+
+    begun = time.monotonic()
+    reporter = asyncio.create_task(_report(progress, started, report_seconds))
+    try:
+        await asyncio.gather(*(
+            _replay_partition(handlers, event_types, checkpoint, batch_size, progress)
+            for checkpoint in checkpoints
+        ))
+    finally:
+        reporter.cancel()
+
+    elapsed = time.monotonic() - begun
+    done = sum(progress) - started
+    print(
+        f"Replayed {done} events into {', '.join(projections)} in {elapsed:.0f}s "
+        f"({done / max(elapsed, 1e-6):.0f}/s)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("projections", nargs="+", choices=sorted(PROJECTIONS))
+    parser.add_argument("--name", help="checkpoint name (default: the projections)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--rebuild", action="store_true")
+    parser.add_argument("--report-seconds", type=float, default=10.0)
+    args = parser.parse_args()
+    projections = sorted(set(args.projections))
+    asyncio.run(replay(
+        projections,
+        name=args.name or "+".join(projections),
+        workers=max(1, args.workers),
+        batch_size=args.batch_size,
+        rebuild=args.rebuild,
+        report_seconds=args.report_seconds,
+    ))
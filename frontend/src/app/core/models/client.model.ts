@@ -115,5 +115,6 @@ export interface TimelineEvent {
 export interface TimelineResponse {
   client_id: string;
   events: TimelineEvent[];
-  total: number;
+  total: number | null;
+  next_cursor: string | null;
 }
@@ -82,8 +82,8 @@ const STATUS_COLORS: Record<string, string> = {
         <div class="bg-white rounded-xl border border-gray-200 p-5 mb-8">
           <h2 class="text-sm font-semibold text-slate-700 mb-3">
             Stuck Steps
-            <span *ngIf="metrics.stuck_steps.length" class="ml-2 text-xs text-red-500 font-normal">
-              ({{ metrics.stuck_steps.length }})
+            <span *ngIf="metrics.stuck_steps_total" class="ml-2 text-xs text-red-500 font-normal">
+              ({{ metrics.stuck_steps_total }})
             </span>
           </h2>
           <div *ngIf="metrics.stuck_steps.length === 0" class="text-sm text-slate-400 py-4 text-center">
@@ -121,8 +121,8 @@ const STATUS_COLORS: Record<string, string> = {
         <div class="bg-white rounded-xl border border-gray-200 p-5">
           <h2 class="text-sm font-semibold text-slate-700 mb-3">
             SLA Alerts
-            <span *ngIf="metrics.stale_cases.length" class="ml-2 text-xs text-amber-500 font-normal">
-              ({{ metrics.stale_cases.length }})
+            <span *ngIf="metrics.stale_cases_total" class="ml-2 text-xs text-amber-500 font-normal">
+              ({{ metrics.stale_cases_total }})
             </span>
           </h2>
           <div *ngIf="metrics.stale_cases.length === 0" class="text-sm text-slate-400 py-4 text-center">
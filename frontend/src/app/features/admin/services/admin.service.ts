@@ -13,6 +13,8 @@ export interface SlaAlert {
 export interface SlaAlertsResponse {
   alerts: SlaAlert[];
   total: number;
+  page: number;
+  per_page: number;
 }
 
 export interface StuckStep {
@@ -26,7 +28,9 @@ export interface DashboardMetrics {
   total_cases: number;
   by_status: Record<string, number>;
   stuck_steps: StuckStep[];
+  stuck_steps_total: number;
   stale_cases: SlaAlert[];
+  stale_cases_total: number;
   avg_cycle_time_days: number | null;
   submissions_last_7_days: number;
   submissions_last_30_days: number;
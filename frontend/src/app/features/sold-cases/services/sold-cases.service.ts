@@ -59,9 +59,10 @@ export class SoldCasesService {
     return this.api.get<CaseReadiness>(`/clients/${clientId}/readiness`);
   }
 
-  getTimeline(clientId: string, limit = 50, offset = 0, eventType?: string): Observable<TimelineResponse> {
+  getTimeline(clientId: string, limit = 50, offset = 0, eventType?: string, before?: string): Observable<TimelineResponse> {
     const params: any = { limit, offset };
     if (eventType) params.event_type = eventType;
+    if (before) params.before = before;
     return this.api.get<TimelineResponse>(`/clients/${clientId}/timeline`, params);
   }
 